@@ -0,0 +1,93 @@
+"""
+Script đo kích thước và CPU của payload API trước/sau khi dùng ORJSONRenderer và nén.
+
+Chạy: python benchmark_payloads.py [--repeat 20]
+
+Mỗi payload là đúng dữ liệu mà renderer nhận (``serializer.data`` của danh
+sách job, chi tiết job, danh sách tỉnh/phường/xã), cùng một payload các
+dòng ``.values()`` thô (Decimal, datetime) để đo đường mã hoá qua encoder
+của DRF:
+- Render: CPU để render bằng JSONRenderer của DRF (trước) và
+  main.renderers.ORJSONRenderer (sau), và kiểm tra hai kết quả giống nhau;
+- Nén: số byte và CPU khi gửi nguyên bản (trước), gzip và Brotli (sau,
+  main/middleware.py).
+
+Dữ liệu lấy từ database đang cấu hình (cần có job và fixtures địa giới).
+"""
+import argparse
+import os
+import time
+
+import django
+
+os.environ.setdefault('DJANGO_SETTINGS_MODULE', 'main.settings')
+django.setup()
+
+from rest_framework.renderers import JSONRenderer
+
+from jobfinder.models import Form, Province, Ward
+from jobfinder.serializers import FormListSerializer, FormSerializer, ProvinceSerializer, WardSerializer
+from main import middleware
+from main.renderers import ORJSONRenderer, orjson
+
+
+def cpu_ms(fn, repeat):
+    """Average CPU time of ``fn()`` in milliseconds."""
+    start = time.process_time()
+    for _ in range(repeat):
+        fn()
+    return (time.process_time() - start) * 1000 / repeat
+
+
+def payloads():
+    """``(label, build)``; ``build()`` returns what the view hands to the renderer."""
+    published = Form.objects.filter(status='approved', is_active=True, owner_hidden=False).order_by('-created_at')
+    yield 'forms (list, all)', lambda: FormListSerializer(FormListSerializer.project(published), many=True).data
+    yield 'forms (list, 20)', lambda: FormListSerializer(FormListSerializer.project(published[:20]), many=True).data
+    form = published.first()
+    if form is not None:
+        yield 'form detail', lambda: FormSerializer(form).data
+    yield 'forms (raw values)', lambda: list(
+        published.values('id', 'title', 'salary_from', 'salary_to', 'created_at', 'updated_at', 'expires_at')
+    )
+    yield 'provinces', lambda: ProvinceSerializer(
+        Province.objects.filter(is_active=True).select_related('administrative_unit'), many=True
+    ).data
+    yield 'wards', lambda: WardSerializer(
+        Ward.objects.filter(is_active=True).select_related('district', 'administrative_unit'), many=True
+    ).data
+
+
+def benchmark(label, build, repeat):
+    start = time.process_time()
+    data = build()
+    serialize = (time.process_time() - start) * 1000
+
+    before = JSONRenderer().render(data)
+    after = ORJSONRenderer().render(data)
+    print(f"\n{label}  (serialize {serialize:.2f} ms, một lần)")
+    print(f"  render   DRF JSONRenderer {cpu_ms(lambda: JSONRenderer().render(data), repeat):8.2f} ms"
+          f"   ORJSONRenderer {cpu_ms(lambda: ORJSONRenderer().render(data), repeat):8.2f} ms"
+          f"   {'(cùng nội dung)' if before == after else '(KHÁC nội dung)'}")
+    print(f"  identity {len(before):>10,} bytes")
+    for encoding in middleware.available_encodings():
+        size = len(middleware.compress(before, encoding))
+        cost = cpu_ms(lambda: middleware.compress(before, encoding), repeat)
+        print(f"  {encoding:<8} {size:>10,} bytes  ({size / max(1, len(before)):6.1%})  {cost:8.2f} ms CPU")
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument('--repeat', type=int, default=20, help='Số lần lặp mỗi phép đo (mặc định: 20)')
+    args = parser.parse_args()
+
+    if orjson is None:
+        print("Chưa cài orjson: ORJSONRenderer dùng lại JSONRenderer của DRF")
+    if middleware.brotli is None:
+        print("Chưa cài brotli: chỉ đo gzip")
+    for label, build in payloads():
+        benchmark(label, build, max(1, args.repeat))
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,11 @@
+from django.apps import AppConfig
+
+class JobfinderConfig(AppConfig):
+    default_auto_field = 'django.db.models.BigAutoField'
+    name = 'jobfinder'
+
+    def ready(self):
+        # import signals to keep derived data (search index, counters, caches)
+        # in sync; an import error must fail loudly instead of silently
+        # disabling those handlers
+        import jobfinder.signals  # noqa: F401
@@ -0,0 +1,66 @@
+"""
+Per-job application counters stored on Form.
+
+Counters are shifted in the same transaction as the Application write, with
+one ``UPDATE ... SET x = x + n`` per form, so concurrent applications never
+lose an increment and job cards can show totals without counting rows.
+``reconcile_application_counters`` recomputes them from the Application
+table (``manage.py reconcile_application_counters``) for anything written
+around these helpers, such as cascading deletes of applicant accounts.
+"""
+from django.db.models import Count, F, OuterRef, Q, Subquery, Value
+from django.db.models.functions import Coalesce, Greatest
+
+from . import public_feed
+from .models import Form, Application, APPLICATION_STATUS_COUNTERS
+
+
+def adjust_application_counters(form_id, old_status=None, new_status=None, count=1):
+    """Record ``count`` applications of ``form_id`` moving from ``old_status`` to ``new_status``.
+
+    ``old_status=None`` means created, ``new_status=None`` means deleted.
+    """
+    if old_status == new_status or not count:
+        return
+    changes = {}
+    if old_status is None:
+        changes['application_count'] = F('application_count') + count
+    elif new_status is None:
+        changes['application_count'] = Greatest(F('application_count') - count, Value(0))
+    if old_status in APPLICATION_STATUS_COUNTERS:
+        field = APPLICATION_STATUS_COUNTERS[old_status]
+        # Clamp at zero: a drifted counter must not break the status change itself
+        changes[field] = Greatest(F(field) - count, Value(0))
+    if new_status in APPLICATION_STATUS_COUNTERS:
+        field = APPLICATION_STATUS_COUNTERS[new_status]
+        changes[field] = F(field) + count
+    Form.objects.filter(pk=form_id).update(**changes)
+    # The counters are shown on job cards, which are only in the feed while published
+    public_feed.invalidate_forms([form_id], published_only=True)
+
+
+def _count(status=None):
+    applications = Application.objects.filter(form=OuterRef('pk'))
+    if status is not None:
+        applications = applications.filter(status=status)
+    return Coalesce(
+        Subquery(applications.order_by().values('form').annotate(n=Count('id')).values('n')),
+        0,
+    )
+
+
+def reconcile_application_counters(queryset=None):
+    """Recompute the counters of ``queryset`` (default: every Form); return how many were wrong."""
+    queryset = Form.objects.all() if queryset is None else queryset
+    expected = {'application_count': _count()}
+    expected.update({field: _count(status) for status, field in APPLICATION_STATUS_COUNTERS.items()})
+
+    drift = Q()
+    for field in expected:
+        drift |= ~Q(**{field: F(f'expected_{field}')})
+    stale = queryset.annotate(**{f'expected_{field}': value for field, value in expected.items()}).filter(drift)
+    stale_ids = list(stale.values_list('pk', flat=True))
+    if stale_ids:
+        Form.objects.filter(pk__in=stale_ids).update(**expected)
+        public_feed.invalidate_forms(stale_ids)
+    return len(stale_ids)
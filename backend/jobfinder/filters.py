@@ -0,0 +1,45 @@
+import django_filters
+from django.db.models import Q
+
+from .models import Form
+
+
+class FormFilter(django_filters.FilterSet):
+    """Query-string filters for job listings.
+
+    Parameter names mirror the ones used by the Jobs page so the frontend
+    can forward its search params unchanged.
+    """
+
+    keyword = django_filters.CharFilter(method='filter_keyword')
+    province = django_filters.CharFilter(field_name='province_id')
+    district = django_filters.CharFilter(field_name='district_id')
+    ward = django_filters.CharFilter(field_name='ward_id')
+    company = django_filters.CharFilter(field_name='verified_company__code', lookup_expr='iexact')
+    work_format = django_filters.CharFilter(field_name='work_format__code', lookup_expr='iexact')
+    job_type = django_filters.CharFilter(field_name='job_type__code', lookup_expr='iexact')
+    currency = django_filters.CharFilter(field_name='salary_currency__code', lookup_expr='iexact')
+    salary_min = django_filters.NumberFilter(field_name='salary_from', lookup_expr='gte')
+    salary_max = django_filters.NumberFilter(method='filter_salary_max')
+    min_positions = django_filters.NumberFilter(field_name='number_of_positions', lookup_expr='gte')
+
+    class Meta:
+        model = Form
+        fields = []
+
+    def filter_keyword(self, queryset, name, value):
+        # Match the title or the displayed company name (verified or free-text)
+        value = value.strip()
+        if not value:
+            return queryset
+        return queryset.filter(
+            Q(title__icontains=value)
+            | Q(verified_company__name__icontains=value)
+            | Q(verified_company_other__icontains=value)
+        )
+
+    def filter_salary_max(self, queryset, name, value):
+        # Use the upper bound of the range when set, otherwise the lower bound
+        return queryset.filter(
+            Q(salary_to__lte=value) | Q(salary_to__isnull=True, salary_from__lte=value)
+        )
@@ -0,0 +1,99 @@
+"""
+Pre-rendered snapshot of the administrative hierarchy (province → district → ward).
+
+The location lists are large (~10k wards), almost never change and are the
+same for every visitor, so they are serialized once, already sorted (by the
+stored natural-sort keys), and kept as JSON bytes, the three full lists also
+compressed ahead of time (``encoded``, see main/middleware.py):
+
+- per worker process, in ``_snapshot``;
+- in the shared cache, keyed by the Province/District/Ward table versions
+  from ``main.lookup_cache`` (bumped by the model signals).
+
+A snapshot is rebuilt only when one of those versions changes. The
+``build_location_snapshot`` management command primes the shared cache at
+release time.
+"""
+import threading
+
+from django.core.cache import cache
+from main.lookup_cache import VERSION_KEY, get_versions
+from main.middleware import precompress
+from main.renderers import ORJSONRenderer
+
+from .models import Province, District, Ward, NATURAL_SORT_ORDERING
+from .serializers import ProvinceSerializer, DistrictSerializer, WardSerializer
+
+SNAPSHOT_MODELS = (Province, District, Ward)
+SNAPSHOT_KEY = 'locations:snapshot:{version}'
+SNAPSHOT_TIMEOUT = 7 * 24 * 60 * 60
+# Built once per table version; higher qualities cost seconds for a few percent
+SNAPSHOT_BROTLI_QUALITY = 9
+
+_lock = threading.Lock()
+_snapshot = None
+
+
+def current_version():
+    keys = [VERSION_KEY.format(label=model._meta.label_lower) for model in SNAPSHOT_MODELS]
+    versions = get_versions(keys)
+    return '-'.join(str(versions[key]) for key in keys)
+
+
+def _group(items, key):
+    groups = {}
+    for item in items:
+        groups.setdefault(item[key], []).append(item)
+    return groups
+
+
+def build_snapshot(version):
+    render = ORJSONRenderer().render
+
+    provinces = ProvinceSerializer(
+        Province.objects.filter(is_active=True).select_related('administrative_unit').order_by('name'),
+        many=True,
+    ).data
+    districts = DistrictSerializer(
+        District.objects.filter(is_active=True)
+        .select_related('province', 'administrative_unit')
+        .order_by(*NATURAL_SORT_ORDERING),
+        many=True,
+    ).data
+    wards = WardSerializer(
+        Ward.objects.filter(is_active=True)
+        .select_related('district', 'administrative_unit')
+        .order_by(*NATURAL_SORT_ORDERING),
+        many=True,
+    ).data
+
+    full_lists = {'provinces': render(provinces), 'districts': render(districts), 'wards': render(wards)}
+    return {
+        'version': version,
+        'province_ids': {p['id'] for p in provinces},
+        'district_ids': {d['id'] for d in districts},
+        **full_lists,
+        'encoded': {name: precompress(body, quality=SNAPSHOT_BROTLI_QUALITY) for name, body in full_lists.items()},
+        'districts_by_province': {pk: render(items) for pk, items in _group(districts, 'province').items()},
+        'wards_by_district': {pk: render(items) for pk, items in _group(wards, 'district').items()},
+    }
+
+
+def get_snapshot():
+    """Return the snapshot for the current table versions, building it at most once."""
+    global _snapshot
+    version = current_version()
+    snapshot = _snapshot
+    if snapshot is not None and snapshot['version'] == version:
+        return snapshot
+
+    with _lock:
+        if _snapshot is not None and _snapshot['version'] == version:
+            return _snapshot
+        key = SNAPSHOT_KEY.format(version=version)
+        snapshot = cache.get(key)
+        if snapshot is None:
+            snapshot = build_snapshot(version)
+            cache.set(key, snapshot, SNAPSHOT_TIMEOUT)
+        _snapshot = snapshot
+    return snapshot
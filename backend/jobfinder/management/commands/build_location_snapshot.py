@@ -0,0 +1,15 @@
+from django.core.management.base import BaseCommand
+
+from jobfinder.locations import get_snapshot
+
+
+class Command(BaseCommand):
+    help = 'Build the province/district/ward snapshot and store it in the shared cache.'
+
+    def handle(self, *args, **options):
+        snapshot = get_snapshot()
+        size = len(snapshot['provinces']) + len(snapshot['districts']) + len(snapshot['wards'])
+        self.stdout.write(self.style.SUCCESS(
+            f"Location snapshot {snapshot['version']} ready "
+            f"({len(snapshot['province_ids'])} provinces, {len(snapshot['district_ids'])} districts, {size // 1024} KB)."
+        ))
@@ -0,0 +1,30 @@
+from django.core.management.base import BaseCommand
+from django.utils import timezone
+
+from jobfinder import public_feed
+from jobfinder.models import Form
+
+
+class Command(BaseCommand):
+    help = 'Hide (is_active = False) job postings whose expires_at has passed. Run periodically, e.g. from cron.'
+
+    def add_arguments(self, parser):
+        parser.add_argument(
+            '--batch-size', type=int, default=500,
+            help='Forms flipped per UPDATE statement (default: 500).',
+        )
+
+    def handle(self, *args, **options):
+        batch_size = max(1, options['batch_size'])
+        now = timezone.now()
+        expired = 0
+        # One status at a time so each batch is a range scan on form_visibility_idx
+        for code, _ in Form.STATUS_CHOICES:
+            candidates = Form.objects.filter(status=code, is_active=True, expires_at__lte=now)
+            while True:
+                ids = list(candidates.order_by().values_list('pk', flat=True)[:batch_size])
+                if not ids:
+                    break
+                expired += Form.objects.filter(pk__in=ids, is_active=True).update(is_active=False, updated_at=now)
+                public_feed.invalidate_forms(ids)
+        self.stdout.write(self.style.SUCCESS(f'{expired} expired job(s) hidden.'))
@@ -0,0 +1,18 @@
+from django.core.management.base import BaseCommand
+
+from jobfinder.counters import reconcile_application_counters
+from jobfinder.models import Form
+
+
+class Command(BaseCommand):
+    help = 'Recompute the per-job application counters on Form from the Application table.'
+
+    def add_arguments(self, parser):
+        parser.add_argument('form_ids', nargs='*', type=int, help='Only these forms (default: all).')
+
+    def handle(self, *args, **options):
+        queryset = Form.objects.all()
+        if options['form_ids']:
+            queryset = queryset.filter(pk__in=options['form_ids'])
+        fixed = reconcile_application_counters(queryset)
+        self.stdout.write(self.style.SUCCESS(f'Application counters reconciled ({fixed} form(s) corrected).'))
@@ -0,0 +1,83 @@
+# Generated by Django 5.2.9 on 2026-10-17 17:43
+
+import unicodedata
+
+from django.db import migrations, models
+
+
+# Frozen copies of jobfinder/search.py at the time of this migration
+SEARCH_FIELDS = ('title', 'description', 'responsibilities', 'requirements', 'benefits')
+SQLITE_FTS_TABLE = 'jobfinder_form_fts'
+POSTGRES_INDEX_NAME = 'form_search_document_gin'
+
+SQLITE_FTS_SQL = [
+    f'CREATE VIRTUAL TABLE {SQLITE_FTS_TABLE} USING fts5(search_document)',
+    f'INSERT INTO {SQLITE_FTS_TABLE}(rowid, search_document) SELECT id, search_document FROM jobfinder_form',
+]
+
+SQLITE_FTS_DROP_SQL = [
+    f'DROP TABLE IF EXISTS {SQLITE_FTS_TABLE}',
+]
+
+
+def fold_text(value):
+    if not value:
+        return ''
+    value = value.replace('đ', 'd').replace('Đ', 'D')
+    decomposed = unicodedata.normalize('NFKD', value)
+    return ''.join(ch for ch in decomposed if not unicodedata.combining(ch)).lower()
+
+
+def _postgres_index():
+    from django.contrib.postgres.indexes import GinIndex
+    from django.contrib.postgres.search import SearchVector
+
+    return GinIndex(SearchVector('search_document', config='simple'), name=POSTGRES_INDEX_NAME)
+
+
+def _sqlite_has_fts5(connection):
+    with connection.cursor() as cursor:
+        cursor.execute("SELECT sqlite_compileoption_used('ENABLE_FTS5')")
+        return bool(cursor.fetchone()[0])
+
+
+def backfill_search_document(apps, schema_editor):
+    Form = apps.get_model('jobfinder', 'Form')
+    for form in Form.objects.only(*SEARCH_FIELDS).iterator():
+        document = fold_text('\n'.join(getattr(form, f) or '' for f in SEARCH_FIELDS))
+        Form.objects.filter(pk=form.pk).update(search_document=document)
+
+
+def create_search_index(apps, schema_editor):
+    vendor = schema_editor.connection.vendor
+    if vendor == 'postgresql':
+        schema_editor.add_index(apps.get_model('jobfinder', 'Form'), _postgres_index())
+    elif vendor == 'sqlite' and _sqlite_has_fts5(schema_editor.connection):
+        for sql in SQLITE_FTS_SQL:
+            schema_editor.execute(sql)
+
+
+def drop_search_index(apps, schema_editor):
+    vendor = schema_editor.connection.vendor
+    if vendor == 'postgresql':
+        schema_editor.remove_index(apps.get_model('jobfinder', 'Form'), _postgres_index())
+    elif vendor == 'sqlite':
+        for sql in SQLITE_FTS_DROP_SQL:
+            schema_editor.execute(sql)
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('jobfinder', '0003_application'),
+    ]
+
+    operations = [
+        migrations.AddField(
+            model_name='form',
+            name='search_document',
+            field=models.TextField(blank=True, editable=False),
+        ),
+        migrations.RunPython(backfill_search_document, migrations.RunPython.noop),
+        migrations.RunPython(create_search_index, drop_search_index),
+    ]
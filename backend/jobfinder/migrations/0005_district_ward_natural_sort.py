@@ -0,0 +1,57 @@
+# Generated by Django 5.2.9 on 2026-10-17 17:47
+
+from django.db import migrations, models
+
+
+def backfill_sort_keys(apps, schema_editor):
+    for model_name in ('District', 'Ward'):
+        model = apps.get_model('jobfinder', model_name)
+        batch = []
+        for obj in model.objects.only('id', 'name').iterator(chunk_size=2000):
+            obj.is_numeric = bool(obj.name) and obj.name.isdecimal()
+            obj.numeric_value = int(obj.name) if obj.is_numeric else 0
+            batch.append(obj)
+            if len(batch) >= 2000:
+                model.objects.bulk_update(batch, ['is_numeric', 'numeric_value'])
+                batch = []
+        if batch:
+            model.objects.bulk_update(batch, ['is_numeric', 'numeric_value'])
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('jobfinder', '0004_form_search_document'),
+    ]
+
+    operations = [
+        migrations.AddField(
+            model_name='district',
+            name='is_numeric',
+            field=models.BooleanField(default=False, editable=False),
+        ),
+        migrations.AddField(
+            model_name='district',
+            name='numeric_value',
+            field=models.PositiveIntegerField(default=0, editable=False),
+        ),
+        migrations.AddField(
+            model_name='ward',
+            name='is_numeric',
+            field=models.BooleanField(default=False, editable=False),
+        ),
+        migrations.AddField(
+            model_name='ward',
+            name='numeric_value',
+            field=models.PositiveIntegerField(default=0, editable=False),
+        ),
+        migrations.RunPython(backfill_sort_keys, migrations.RunPython.noop),
+        migrations.AddIndex(
+            model_name='district',
+            index=models.Index(condition=models.Q(('is_active', True)), fields=['province', '-is_numeric', 'numeric_value', 'name'], name='district_province_sort_idx'),
+        ),
+        migrations.AddIndex(
+            model_name='ward',
+            index=models.Index(condition=models.Q(('is_active', True)), fields=['district', '-is_numeric', 'numeric_value', 'name'], name='ward_district_sort_idx'),
+        ),
+    ]
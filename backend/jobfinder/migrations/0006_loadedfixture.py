@@ -0,0 +1,23 @@
+# Generated by Django 5.2.9 on 2026-10-17 17:53
+
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('jobfinder', '0005_district_ward_natural_sort'),
+    ]
+
+    operations = [
+        migrations.CreateModel(
+            name='LoadedFixture',
+            fields=[
+                ('id', models.BigAutoField(auto_created=True, primary_key=True, serialize=False, verbose_name='ID')),
+                ('name', models.CharField(max_length=255, unique=True)),
+                ('sha256', models.CharField(max_length=64)),
+                ('object_count', models.PositiveIntegerField(default=0)),
+                ('loaded_at', models.DateTimeField(auto_now=True)),
+            ],
+        ),
+    ]
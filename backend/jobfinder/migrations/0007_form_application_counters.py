@@ -0,0 +1,54 @@
+# Generated by Django 5.2.9 on 2026-10-17 17:58
+
+from django.db import migrations, models
+from django.db.models import Count, OuterRef, Subquery
+from django.db.models.functions import Coalesce
+
+
+def backfill_counters(apps, schema_editor):
+    Form = apps.get_model('jobfinder', 'Form')
+    Application = apps.get_model('jobfinder', 'Application')
+
+    def count(status=None):
+        applications = Application.objects.filter(form=OuterRef('pk'))
+        if status is not None:
+            applications = applications.filter(status=status)
+        return Coalesce(Subquery(applications.order_by().values('form').annotate(n=Count('id')).values('n')), 0)
+
+    Form.objects.update(
+        application_count=count(),
+        pending_application_count=count('pending'),
+        approved_application_count=count('approved'),
+        rejected_application_count=count('rejected'),
+    )
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('jobfinder', '0006_loadedfixture'),
+    ]
+
+    operations = [
+        migrations.AddField(
+            model_name='form',
+            name='application_count',
+            field=models.PositiveIntegerField(default=0, editable=False),
+        ),
+        migrations.AddField(
+            model_name='form',
+            name='approved_application_count',
+            field=models.PositiveIntegerField(default=0, editable=False),
+        ),
+        migrations.AddField(
+            model_name='form',
+            name='pending_application_count',
+            field=models.PositiveIntegerField(default=0, editable=False),
+        ),
+        migrations.AddField(
+            model_name='form',
+            name='rejected_application_count',
+            field=models.PositiveIntegerField(default=0, editable=False),
+        ),
+        migrations.RunPython(backfill_counters, migrations.RunPython.noop),
+    ]
@@ -0,0 +1,30 @@
+# Generated by Django 5.2.9 on 2026-10-17 12:00
+
+import django.db.models.deletion
+from django.conf import settings
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('jobfinder', '0007_form_application_counters'),
+        migrations.swappable_dependency(settings.AUTH_USER_MODEL),
+    ]
+
+    operations = [
+        migrations.AddField(
+            model_name='form',
+            name='claimed_at',
+            field=models.DateTimeField(blank=True, editable=False, null=True),
+        ),
+        migrations.AddField(
+            model_name='form',
+            name='claimed_by',
+            field=models.ForeignKey(blank=True, editable=False, null=True, on_delete=django.db.models.deletion.SET_NULL, related_name='claimed_forms', to=settings.AUTH_USER_MODEL),
+        ),
+        migrations.AddIndex(
+            model_name='form',
+            index=models.Index(condition=models.Q(('is_active', True), ('status', 'pending')), fields=['created_at', 'id'], name='form_moderation_queue_idx'),
+        ),
+    ]
@@ -0,0 +1,19 @@
+# Generated by Django 5.2.9 on 2026-10-17 18:40
+
+from django.conf import settings
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('jobfinder', '0008_form_moderation_queue'),
+        migrations.swappable_dependency(settings.AUTH_USER_MODEL),
+    ]
+
+    operations = [
+        migrations.AddIndex(
+            model_name='form',
+            index=models.Index(fields=['status', 'is_active', 'expires_at'], name='form_visibility_idx'),
+        ),
+    ]
@@ -0,0 +1,30 @@
+# Generated by Django 5.2.9 on 2026-10-17 19:05
+
+from django.conf import settings
+from django.db import migrations, models
+
+
+def backfill_owner_hidden(apps, schema_editor):
+    Form = apps.get_model('jobfinder', 'Form')
+    Form.objects.filter(created_by__status__code__in=['LOCKED', 'BANNED']).update(owner_hidden=True)
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('jobfinder', '0009_form_visibility_idx'),
+        migrations.swappable_dependency(settings.AUTH_USER_MODEL),
+    ]
+
+    operations = [
+        migrations.AddField(
+            model_name='form',
+            name='owner_hidden',
+            field=models.BooleanField(default=False, editable=False),
+        ),
+        migrations.RunPython(backfill_owner_hidden, migrations.RunPython.noop),
+        migrations.AddIndex(
+            model_name='form',
+            index=models.Index(condition=models.Q(('is_active', True), ('owner_hidden', False), ('status', 'approved')), fields=['-created_at'], name='form_public_listing_idx'),
+        ),
+    ]
@@ -6,6 +6,8 @@ from django.core.exceptions import ValidationError
 
 from users.models import CustomUser
 
+from .search import SEARCH_FIELDS, build_search_document
+
 class VerifiedCompany(models.Model):
     code = models.CharField(max_length=20, unique=True)
     name = models.CharField(max_length=255, unique=True)
@@ -59,6 +61,17 @@ class Currency(models.Model):
     def __str__(self):
         return self.name
 
+# Index-backed ordering for District/Ward lists
+NATURAL_SORT_ORDERING = ('-is_numeric', 'numeric_value', 'name')
+
+
+def natural_sort_fields(name):
+    """Stored sort keys for District/Ward: numeric names first (by value), then alphabetic."""
+    if name and name.isdecimal():
+        return {'is_numeric': True, 'numeric_value': int(name)}
+    return {'is_numeric': False, 'numeric_value': 0}
+
+
 class AdministrativeUnit(models.Model):
     """
     Loại đơn vị hành chính: Thành phố trực thuộc trung ương, Tỉnh, Quận, Huyện, Phường, Xã, ...
@@ -125,8 +138,20 @@ class District(models.Model):
     )
     is_active = models.BooleanField(default=True)
 
+    # Natural-sort keys, kept in sync from the name by a pre_save signal (see signals.py)
+    is_numeric = models.BooleanField(default=False, editable=False)
+    numeric_value = models.PositiveIntegerField(default=0, editable=False)
+
     class Meta:
         ordering = ['code']
+        indexes = [
+            # Partial on is_active so the boolean filter matches on SQLite as well as PostgreSQL
+            models.Index(
+                fields=['province', '-is_numeric', 'numeric_value', 'name'],
+                condition=models.Q(is_active=True),
+                name='district_province_sort_idx',
+            ),
+        ]
 
     def __str__(self):
         return f"{self.name}, {self.province.name}"
@@ -157,8 +182,20 @@ class Ward(models.Model):
     )
     is_active = models.BooleanField(default=True)
 
+    # Natural-sort keys, kept in sync from the name by a pre_save signal (see signals.py)
+    is_numeric = models.BooleanField(default=False, editable=False)
+    numeric_value = models.PositiveIntegerField(default=0, editable=False)
+
     class Meta:
         ordering = ['code']
+        indexes = [
+            # Partial on is_active so the boolean filter matches on SQLite as well as PostgreSQL
+            models.Index(
+                fields=['district', '-is_numeric', 'numeric_value', 'name'],
+                condition=models.Q(is_active=True),
+                name='ward_district_sort_idx',
+            ),
+        ]
 
     def __str__(self):
         return f"{self.name}, {self.district.name}"
@@ -182,6 +219,30 @@ class PendingLookup(models.Model):
     def __str__(self):
         return f"{self.lookup_type}: {self.proposed_value}"
     
+# Form counter field per application status, plus the overall total
+APPLICATION_STATUS_COUNTERS = {
+    'pending': 'pending_application_count',
+    'approved': 'approved_application_count',
+    'rejected': 'rejected_application_count',
+}
+APPLICATION_COUNTER_FIELDS = ('application_count', *APPLICATION_STATUS_COUNTERS.values())
+
+MODERATION_CLAIM_FIELDS = ('claimed_by', 'claimed_at')
+
+# Owner account statuses that hide all of the owner's jobs (INACTIVE and
+# SUSPENDED owners stay visible); mirrored on Form.owner_hidden by owners.py
+HIDDEN_OWNER_STATUSES = ('LOCKED', 'BANNED')
+
+
+def owner_hides_jobs(status_code):
+    return (status_code or '').upper() in HIDDEN_OWNER_STATUSES
+
+
+def owner_status(user_id):
+    """The owner's status code as stored in the database (never a token claim)."""
+    return CustomUser.objects.filter(pk=user_id).values_list('status_id', flat=True).first()
+
+
 class Form(models.Model):
     STATUS_CHOICES = [
         ('pending', 'Chờ duyệt'),
@@ -262,14 +323,72 @@ class Form(models.Model):
     updated_at = models.DateTimeField(auto_now=True)
     expires_at = models.DateTimeField(null=True, blank=True)
 
+    # Diacritic-folded copy of the text fields, indexed for full-text search (see search.py)
+    search_document = models.TextField(blank=True, editable=False)
+
+    # Application counters, shifted with F() expressions by counters.py; never
+    # written by a plain save() so concurrent updates are not overwritten
+    application_count = models.PositiveIntegerField(default=0, editable=False)
+    pending_application_count = models.PositiveIntegerField(default=0, editable=False)
+    approved_application_count = models.PositiveIntegerField(default=0, editable=False)
+    rejected_application_count = models.PositiveIntegerField(default=0, editable=False)
+
+    # Moderation queue claim (see FormViewSet.moderation_queue_claim); like the
+    # counters, only written by UPDATE statements
+    claimed_by = models.ForeignKey(
+        CustomUser,
+        on_delete=models.SET_NULL,
+        null=True,
+        blank=True,
+        editable=False,
+        related_name='claimed_forms'
+    )
+    claimed_at = models.DateTimeField(null=True, blank=True, editable=False)
+
+    # Owner's account is LOCKED or BANNED; kept in step with the owner's status by
+    # owners.sync_owner_hidden so listings need no join on the user table
+    owner_hidden = models.BooleanField(default=False, editable=False)
+
     class Meta:
         ordering = ['-created_at']
-        indexes = [models.Index(fields=['created_at', 'status'])]
+        indexes = [
+            models.Index(fields=['created_at', 'status']),
+            # The moderation queue: pending, visible jobs, oldest first
+            models.Index(
+                fields=['created_at', 'id'],
+                name='form_moderation_queue_idx',
+                condition=models.Q(status='pending', is_active=True),
+            ),
+            # Public visibility: approved, active, not expired (FormViewSet.get_queryset)
+            models.Index(fields=['status', 'is_active', 'expires_at'], name='form_visibility_idx'),
+            # The public listing, newest first
+            models.Index(
+                fields=['-created_at'],
+                name='form_public_listing_idx',
+                condition=models.Q(status='approved', is_active=True, owner_hidden=False),
+            ),
+        ]
 
     def __str__(self):
         company = self.verified_company.name if self.verified_company else 'Unknown'
         return f"{self.title} — {company}"
 
+    def save(self, *args, **kwargs):
+        self.search_document = build_search_document(self)
+        if self._state.adding and self.created_by_id:
+            # Read the stored status: created_by may be a TokenClaimsUser whose
+            # status_id is the (possibly stale) token claim
+            self.owner_hidden = owner_hides_jobs(owner_status(self.created_by_id))
+        update_fields = kwargs.get('update_fields')
+        if update_fields is None and not self._state.adding and not kwargs.get('force_insert'):
+            update_fields = kwargs['update_fields'] = [
+                f.name for f in self._meta.concrete_fields
+                if not f.primary_key and f.name not in APPLICATION_COUNTER_FIELDS + MODERATION_CLAIM_FIELDS + ('owner_hidden',)
+            ]
+        if update_fields is not None and set(update_fields) & set(SEARCH_FIELDS):
+            kwargs['update_fields'] = set(update_fields) | {'search_document'}
+        super().save(*args, **kwargs)
+
     def is_active_and_approved(self):
         if not self.is_active or self.status != 'approved':
             return False
@@ -350,4 +469,14 @@ class Application(models.Model):
         unique_together = ['form', 'applicant']  # Mỗi user chỉ ứng tuyển 1 lần/job
     
     def __str__(self):
-        return f"{self.applicant.username} → {self.form.title}"
\ No newline at end of file
+        return f"{self.applicant.username} → {self.form.title}"
+
+class LoadedFixture(models.Model):
+    """Content hash of each lookup fixture file loaded by load_fixtures.py (see fixture_loader.py)."""
+    name = models.CharField(max_length=255, unique=True)
+    sha256 = models.CharField(max_length=64)
+    object_count = models.PositiveIntegerField(default=0)
+    loaded_at = models.DateTimeField(auto_now=True)
+
+    def __str__(self):
+        return f"{self.name} ({self.sha256[:12]})"
@@ -0,0 +1,28 @@
+"""
+Form.owner_hidden: whether a job's owner account is LOCKED or BANNED.
+
+Listings used to exclude those jobs with ``created_by__status__code__in``,
+joining the user and status tables on every request. The flag is set when
+a job is created (Form.save) and rewritten here, with one UPDATE over the
+owner's jobs, whenever the owner's status changes (``users/<id>/set-status/``
+and ``users/me/``). Like the application counters it is never written by a
+plain save(). Both paths read the status from the user row, never from the
+request user: with stateless JWT auth that is the token's claim, which can be
+stale.
+"""
+from django.utils import timezone
+
+from . import public_feed
+from .models import Form, owner_hides_jobs, owner_status
+
+
+def sync_owner_hidden(user_id):
+    """Set owner_hidden on all of the user's jobs for their stored status; return rows changed."""
+    hidden = owner_hides_jobs(owner_status(user_id))
+    # updated_at moves too: list and detail Last-Modified must change with visibility
+    changed = Form.objects.filter(created_by_id=user_id).exclude(owner_hidden=hidden).update(
+        owner_hidden=hidden, updated_at=timezone.now()
+    )
+    if changed:
+        public_feed.invalidate_forms(Form.objects.filter(created_by_id=user_id).values('pk'))
+    return changed
@@ -0,0 +1,40 @@
+from rest_framework.pagination import CursorPagination, LimitOffsetPagination
+
+
+class OptOutCursorPagination(CursorPagination):
+    """Keyset pagination with an escape hatch for tools that need every row.
+
+    Pass ``?page_size=<n>`` to change the page size (capped at
+    ``max_page_size``) or ``?page_size=all`` to get the plain, unpaginated
+    list as before.
+    """
+
+    page_size = 20
+    page_size_query_param = 'page_size'
+    max_page_size = 100
+    unpaginated_value = 'all'
+
+    def paginate_queryset(self, queryset, request, view=None):
+        if request.query_params.get(self.page_size_query_param) == self.unpaginated_value:
+            return None
+        return super().paginate_queryset(queryset, request, view)
+
+
+class FormCursorPagination(OptOutCursorPagination):
+    # Walks the (created_at, status) index on Form
+    ordering = '-created_at'
+
+
+class ModerationQueuePagination(OptOutCursorPagination):
+    # Oldest first, along the partial index on pending, active jobs
+    ordering = ('created_at', 'id')
+
+
+class ApplicationCursorPagination(OptOutCursorPagination):
+    ordering = '-applied_at'
+
+
+class SearchPagination(LimitOffsetPagination):
+    # Relevance-ranked results have no stable key to build a cursor from
+    default_limit = 20
+    max_limit = 100
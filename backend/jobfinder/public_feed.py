@@ -0,0 +1,187 @@
+"""
+Materialized public job feed: anonymous list pages served from the cache.
+
+Every anonymous visitor of ``/api/jobfinder/forms/`` gets the same published
+set, so pages for the common filter combinations (all jobs, ``?province=``,
+``?job_type=``, with ``page_size``/``cursor``) are stored rendered to JSON
+and compressed (gzip, and Brotli when available). A hit is a cache read
+(plus a primary-key check of the province or job type): no list query, no
+serialization, and a 304 when the client's ETag matches.
+
+Pages are keyed by a version per scope (``all``, ``province:<id>``,
+``job_type:<code>``, for existing provinces and job types only) plus a
+global generation, both versioned like the lookup lists (main/lookup_cache.py):
+
+- Form saves and deletes bump the scopes of the job before and after the
+  change, and only if the job was or is published (signals.py);
+- bulk writes (moderation, owner status changes, the expiry sweeper) call
+  ``invalidate_forms`` with the ids they touched; application counters only
+  for published jobs;
+- renaming a lookup or location used in list rows bumps the generation.
+
+Nothing is written when a job passes ``expires_at``, so a page lives at most
+until the next expiry in its scope (and ``FEED_TIMEOUT`` at the longest).
+
+Lists that need the database (signed-in users, other filters) keep their
+ETag and Last-Modified under the ``any`` scope, which every job write bumps,
+published or not (``list_validators``). Only a miss runs the aggregate over
+the filtered jobs.
+"""
+import hashlib
+
+from django.core.cache import cache
+from django.db.models import Min
+from django.http import HttpResponseNotModified
+from django.utils import timezone
+from django.utils.cache import patch_cache_control, patch_vary_headers
+
+from main import middleware
+from main.lookup_cache import bump_versions, etag_matches, get_versions
+from main.renderers import ORJSONRenderer
+
+from .models import Form, JobType, Province
+
+GENERATION_KEY = 'feed:generation'
+VERSION_KEY = 'feed:version:{scope}'
+PAGE_KEY = 'feed:page:{generation}:{version}:{digest}'
+VALIDATORS_KEY = 'feed:validators:{generation}:{version}:{digest}'
+# Bumped by every job write; never a feed page scope
+ANY_SCOPE = 'any'
+FEED_TIMEOUT = 10 * 60
+
+# Query parameters a cached page may carry; anything else goes to the database
+FEED_PARAMS = {'province', 'job_type', 'page_size', 'cursor'}
+
+
+def generation():
+    """Current feed generation; changes whenever lookup or location names change."""
+    return get_versions([GENERATION_KEY])[GENERATION_KEY]
+
+
+def scopes_for(province_id, job_type_code):
+    scopes = {'all'}
+    if province_id:
+        scopes.add(f'province:{province_id}')
+    if job_type_code:
+        scopes.add(f'job_type:{job_type_code.lower()}')
+    return scopes
+
+
+def invalidate_scopes(scopes):
+    """Retire the cached pages of ``scopes`` once the current transaction commits."""
+    if scopes:
+        bump_versions(sorted(VERSION_KEY.format(scope=scope) for scope in scopes))
+
+
+def invalidate_job_write(scopes=()):
+    """A job changed: retire the list validators plus the pages of ``scopes``."""
+    invalidate_scopes({ANY_SCOPE, *scopes})
+
+
+def invalidate_all():
+    """Retire every cached page (lookup or location names shown in list rows changed)."""
+    bump_versions([GENERATION_KEY])
+
+
+def feed_rows(form_ids):
+    """``(province_id, job_type code, published)`` of each job, for working out what to invalidate."""
+    rows = Form.objects.filter(pk__in=form_ids).values_list(
+        'province_id', 'job_type__code', 'status', 'is_active', 'owner_hidden'
+    )
+    return [
+        (province_id, job_type, status == 'approved' and is_active and not owner_hidden)
+        for province_id, job_type, status, is_active, owner_hidden in rows
+    ]
+
+
+def invalidate_forms(form_ids, published_only=False):
+    """Retire the pages that may list any of ``form_ids`` (call after a bulk UPDATE).
+
+    ``published_only`` skips jobs that are not published now; only for
+    writes that cannot change whether a job is published.
+    """
+    rows = feed_rows(form_ids)
+    scopes = set()
+    for province_id, job_type, published in rows:
+        if published or not published_only:
+            scopes |= scopes_for(province_id, job_type)
+    if rows:
+        invalidate_job_write(scopes)
+
+
+def feed_scope(request):
+    """The scope a list request can be served from, or None when it needs the database."""
+    if request.user.is_authenticated or request.accepted_renderer.format != 'json':
+        return None
+    params = request.query_params
+    if not set(params) <= FEED_PARAMS or params.get('page_size') == '':
+        return None
+    province, job_type = params.get('province'), params.get('job_type')
+    if province and job_type:
+        return None
+    # Scopes come from the query string: only known values get a version key
+    if province:
+        return f'province:{province}' if Province.objects.filter(pk=province).exists() else None
+    if job_type:
+        return f'job_type:{job_type.lower()}' if JobType.objects.filter(code__iexact=job_type).exists() else None
+    return 'all'
+
+
+def expiry_timeout(queryset):
+    # Expired jobs drop out of the list query without any write to invalidate on
+    next_expiry = queryset.filter(expires_at__isnull=False).aggregate(next=Min('expires_at'))['next']
+    if next_expiry is None:
+        return FEED_TIMEOUT
+    return max(1, min(FEED_TIMEOUT, int((next_expiry - timezone.now()).total_seconds())))
+
+
+def serve(request, scope, queryset, build_response, cache_control):
+    """Answer from the cached page for ``request``; ``build_response()`` renders it on a miss.
+
+    ``cache_control`` is what the same list gets outside the feed, so clients
+    see one policy whichever path answered.
+    """
+    version_key = VERSION_KEY.format(scope=scope)
+    versions = get_versions([GENERATION_KEY, version_key])
+    # The full URL: next/previous links are absolute
+    digest = hashlib.sha256(request.build_absolute_uri().encode()).hexdigest()
+    key = PAGE_KEY.format(generation=versions[GENERATION_KEY], version=versions[version_key], digest=digest)
+
+    page = cache.get(key)
+    if page is None:
+        body = ORJSONRenderer().render(build_response().data)
+        page = {
+            'etag': '"feed-%s"' % hashlib.sha256(body).hexdigest()[:32],
+            'body': body,
+            'encoded': middleware.precompress(body),
+        }
+        cache.set(key, page, expiry_timeout(queryset))
+
+    if etag_matches(request, page['etag']):
+        response = HttpResponseNotModified()
+        patch_vary_headers(response, ('Accept-Encoding',))
+    else:
+        response = middleware.precompressed_response(request, page['body'], page['encoded'])
+    response['ETag'] = page['etag']
+    patch_cache_control(response, **cache_control)
+    # Signed-in users get other lists at the same URLs
+    patch_vary_headers(response, ('Authorization',))
+    return response
+
+
+def list_validators(request, visibility, queryset, compute):
+    """``(etag, last_modified)`` of a list served from the database; ``compute()`` builds them on a miss.
+
+    Keyed by the user, what they may see and the full URL. ``queryset`` is
+    the visible list, for the next expiry that changes it without a write.
+    """
+    versions = get_versions([GENERATION_KEY, VERSION_KEY.format(scope=ANY_SCOPE)])
+    digest = hashlib.sha256(repr((visibility, request.user.pk, request.get_full_path())).encode()).hexdigest()
+    key = VALIDATORS_KEY.format(
+        generation=versions[GENERATION_KEY], version=versions[VERSION_KEY.format(scope=ANY_SCOPE)], digest=digest,
+    )
+    validators = cache.get(key)
+    if validators is None:
+        validators = compute()
+        cache.set(key, validators, expiry_timeout(queryset))
+    return validators
@@ -0,0 +1,142 @@
+"""
+Full-text search over job postings.
+
+Each Form keeps a ``search_document`` column holding its text fields with
+Vietnamese diacritics folded away ("Kế toán" -> "ke toan"). The column is
+indexed per database backend:
+
+- PostgreSQL: GIN index on ``to_tsvector('simple', search_document)``,
+  queried with SearchVector / SearchQuery and ranked with SearchRank.
+- SQLite: FTS5 table ``jobfinder_form_fts`` (rowid = form id), ranked with
+  bm25() and refreshed from the post_save/post_delete signals.
+
+Both indexes are created by migration 0004 and follow every Form write, so
+a search never scans the raw TextFields.
+"""
+import re
+import unicodedata
+
+from django.core.exceptions import EmptyResultSet
+from django.db import connection, DatabaseError
+from django.db.models import Case, When, Value, FloatField, Q
+
+SEARCH_FIELDS = ('title', 'description', 'responsibilities', 'requirements', 'benefits')
+
+SQLITE_FTS_TABLE = 'jobfinder_form_fts'
+
+# FTS5 results are ranked in SQLite and then matched back to Form rows;
+# cap the candidate set (after visibility and filters) so the rank CASE stays small.
+SQLITE_MAX_HITS = 1000
+
+_TOKEN_RE = re.compile(r'\w+')
+
+
+def fold_text(value):
+    """Lowercase and strip diacritics, including the Vietnamese 'đ'."""
+    if not value:
+        return ''
+    value = value.replace('đ', 'd').replace('Đ', 'D')
+    decomposed = unicodedata.normalize('NFKD', value)
+    return ''.join(ch for ch in decomposed if not unicodedata.combining(ch)).lower()
+
+
+def build_search_document(form):
+    """Return the folded text that is indexed for a Form."""
+    return fold_text('\n'.join(getattr(form, f) or '' for f in SEARCH_FIELDS))
+
+
+def query_terms(query):
+    return _TOKEN_RE.findall(fold_text(query))
+
+
+def update_search_index(form):
+    """Refresh the SQLite FTS row of a saved Form (PostgreSQL indexes the column itself)."""
+    if connection.vendor != 'sqlite':
+        return
+    try:
+        with connection.cursor() as cursor:
+            cursor.execute(f'DELETE FROM {SQLITE_FTS_TABLE} WHERE rowid = %s', [form.pk])
+            cursor.execute(
+                f'INSERT INTO {SQLITE_FTS_TABLE}(rowid, search_document) VALUES (%s, %s)',
+                [form.pk, form.search_document],
+            )
+    except DatabaseError:
+        # No FTS5 table on this database; search uses the fallback
+        pass
+
+
+def remove_from_search_index(pk):
+    if connection.vendor != 'sqlite':
+        return
+    try:
+        with connection.cursor() as cursor:
+            cursor.execute(f'DELETE FROM {SQLITE_FTS_TABLE} WHERE rowid = %s', [pk])
+    except DatabaseError:
+        pass
+
+
+def search_forms(queryset, query):
+    """Restrict a Form queryset to rows matching ``query``, best match first.
+
+    Every term must match (as a prefix, so partially typed words work).
+    The returned queryset is annotated with ``rank``.
+    """
+    terms = query_terms(query)
+    if not terms:
+        return queryset.none()
+
+    if connection.vendor == 'postgresql':
+        return _search_postgres(queryset, terms)
+    if connection.vendor == 'sqlite':
+        try:
+            return _search_sqlite(queryset, terms)
+        except DatabaseError:
+            # FTS5 not compiled in or table missing: fall through
+            pass
+    return _search_fallback(queryset, terms)
+
+
+def _search_postgres(queryset, terms):
+    from django.contrib.postgres.search import SearchQuery, SearchRank, SearchVector
+
+    vector = SearchVector('search_document', config='simple')
+    search_query = SearchQuery(' & '.join(f'{t}:*' for t in terms), config='simple', search_type='raw')
+    return (
+        queryset.annotate(search=vector, rank=SearchRank(vector, search_query))
+        .filter(search=search_query)
+        .order_by('-rank', '-created_at')
+    )
+
+
+def _search_sqlite(queryset, terms):
+    match = ' '.join(f'"{t}"*' for t in terms)
+    # Only rows the queryset can return compete for the capped candidate set
+    try:
+        candidates, params = queryset.order_by().values('pk').query.sql_with_params()
+    except EmptyResultSet:
+        return queryset.none()
+    with connection.cursor() as cursor:
+        cursor.execute(
+            f'SELECT rowid, bm25({SQLITE_FTS_TABLE}) FROM {SQLITE_FTS_TABLE} '
+            f'WHERE {SQLITE_FTS_TABLE} MATCH %s AND rowid IN ({candidates}) ORDER BY rank LIMIT %s',
+            [match, *params, SQLITE_MAX_HITS],
+        )
+        hits = cursor.fetchall()
+    if not hits:
+        return queryset.none()
+    # bm25() is lower-is-better; negate so rank sorts like SearchRank
+    return (
+        queryset.filter(pk__in=[pk for pk, _ in hits])
+        .annotate(rank=Case(
+            *[When(pk=pk, then=Value(-score)) for pk, score in hits],
+            output_field=FloatField(),
+        ))
+        .order_by('-rank', '-created_at')
+    )
+
+
+def _search_fallback(queryset, terms):
+    condition = Q()
+    for term in terms:
+        condition &= Q(search_document__icontains=term)
+    return queryset.filter(condition).annotate(rank=Value(0.0, output_field=FloatField())).order_by('-created_at')
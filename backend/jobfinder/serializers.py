@@ -1,5 +1,6 @@
 from rest_framework import serializers
 from django.contrib.auth import get_user_model
+from django.db import transaction
 from rest_framework.validators import UniqueValidator
 
 from .models import (
@@ -14,6 +15,7 @@ from .models import (
     Form,
     Application,
 )
+from .counters import adjust_application_counters
 
 User = get_user_model()
 
@@ -145,6 +147,10 @@ class FormSerializer(serializers.ModelSerializer):
             'created_at',
             'updated_at',
             'expires_at',
+            'application_count',
+            'pending_application_count',
+            'approved_application_count',
+            'rejected_application_count',
         ]
         read_only_fields = ['status']
 
@@ -182,6 +188,97 @@ class FormSerializer(serializers.ModelSerializer):
         return data
 
 
+class FormListSerializer(serializers.BaseSerializer):
+    """Compact, read-only representation of a Form in list responses.
+
+    Works on dict rows from ``FormListSerializer.project(queryset)``, a single
+    ``.values()`` query with every lookup/location name joined in SQL, so
+    listing needs no model instances and no per-row related lookups. The long
+    text fields and contact details are only part of the detail schema
+    (FormSerializer).
+    """
+
+    values_fields = (
+        'id', 'title', 'status', 'is_active', 'created_at', 'updated_at', 'expires_at',
+        'verified_company__code', 'verified_company__name', 'verified_company_other',
+        'created_by__username',
+        'work_format__code', 'work_format__name', 'work_format_other',
+        'job_type__code', 'job_type__name', 'job_type_other',
+        'salary_from', 'salary_to',
+        'salary_currency__code', 'salary_currency__name', 'salary_currency__symbol', 'salary_currency_other',
+        'province_id', 'province__name', 'district_id', 'district__name', 'ward_id', 'ward__name',
+        'address', 'number_of_positions',
+        'application_count', 'pending_application_count', 'approved_application_count', 'rejected_application_count',
+    )
+
+    _datetime = serializers.DateTimeField()
+    _salary = serializers.DecimalField(max_digits=12, decimal_places=2)
+
+    @classmethod
+    def project(cls, queryset):
+        return queryset.values(*cls.values_fields)
+
+    @staticmethod
+    def _display(code, name, other):
+        # Same rule as the Form.display_* properties
+        if code is not None and code.lower() != 'other':
+            return name
+        return other or None
+
+    def to_representation(self, row):
+        datetime = self._datetime.to_representation
+        salary = self._salary.to_representation
+        return {
+            'id': row['id'],
+            'verified_company': row['verified_company__code'],
+            'verified_company_other': row['verified_company_other'],
+            'display_verified_company': self._display(
+                row['verified_company__code'], row['verified_company__name'], row['verified_company_other']),
+            'created_by': row['created_by__username'],
+            'title': row['title'],
+            'work_format': row['work_format__code'],
+            'display_work_format': self._display(
+                row['work_format__code'], row['work_format__name'], row['work_format_other']),
+            'job_type': row['job_type__code'],
+            'display_job_type': self._display(row['job_type__code'], row['job_type__name'], row['job_type_other']),
+            'salary_from': None if row['salary_from'] is None else salary(row['salary_from']),
+            'salary_to': None if row['salary_to'] is None else salary(row['salary_to']),
+            'salary_currency': row['salary_currency__code'],
+            'display_salary_currency': self._display(
+                row['salary_currency__code'], row['salary_currency__name'], row['salary_currency_other']),
+            'salary_currency_symbol': row['salary_currency__symbol'],
+            'province': row['province_id'],
+            'province_name': row['province__name'],
+            'district': row['district_id'],
+            'district_name': row['district__name'],
+            'ward': row['ward_id'],
+            'ward_name': row['ward__name'],
+            'address': row['address'],
+            'number_of_positions': row['number_of_positions'],
+            'status': row['status'],
+            'is_active': row['is_active'],
+            'created_at': datetime(row['created_at']),
+            'updated_at': datetime(row['updated_at']),
+            'expires_at': None if row['expires_at'] is None else datetime(row['expires_at']),
+            'application_count': row['application_count'],
+            'pending_application_count': row['pending_application_count'],
+            'approved_application_count': row['approved_application_count'],
+            'rejected_application_count': row['rejected_application_count'],
+        }
+
+
+class ModerationQueueSerializer(FormListSerializer):
+    """FormListSerializer plus who has claimed the job in the moderation queue."""
+
+    values_fields = FormListSerializer.values_fields + ('claimed_by__username', 'claimed_at')
+
+    def to_representation(self, row):
+        data = super().to_representation(row)
+        data['claimed_by'] = row['claimed_by__username']
+        data['claimed_at'] = None if row['claimed_at'] is None else self._datetime.to_representation(row['claimed_at'])
+        return data
+
+
 # Application Serializers
 
 class ApplicationSerializer(serializers.ModelSerializer):
@@ -219,6 +316,45 @@ class ApplicationSerializer(serializers.ModelSerializer):
         return user.username
 
 
+class ApplicationInboxSerializer(serializers.BaseSerializer):
+    """Read-only row of the employer inbox, built from ``ApplicationInboxSerializer.project(queryset)``.
+
+    One ``.values()`` query joins the job title and the applicant columns, so
+    an inbox page never loads Form or CustomUser instances.
+    """
+
+    values_fields = (
+        'id', 'form_id', 'form__title', 'status', 'cover_letter', 'cv_url', 'applied_at', 'updated_at',
+        'applicant_id', 'applicant__username', 'applicant__first_name', 'applicant__last_name',
+        'applicant__email', 'applicant__avatar', 'applicant__status_id',
+    )
+
+    _datetime = serializers.DateTimeField()
+
+    @classmethod
+    def project(cls, queryset):
+        return queryset.values(*cls.values_fields)
+
+    def to_representation(self, row):
+        datetime = self._datetime.to_representation
+        name = f"{row['applicant__first_name']} {row['applicant__last_name']}".strip()
+        return {
+            'id': row['id'],
+            'job_id': row['form_id'],
+            'job_title': row['form__title'],
+            'applicant_id': row['applicant_id'],
+            'applicant_name': name or row['applicant__username'],
+            'applicant_email': row['applicant__email'],
+            'applicant_avatar': row['applicant__avatar'],
+            'applicant_status': row['applicant__status_id'],
+            'cover_letter': row['cover_letter'],
+            'cv_url': row['cv_url'],
+            'status': row['status'],
+            'applied_at': datetime(row['applied_at']),
+            'updated_at': datetime(row['updated_at']),
+        }
+
+
 class ApplicationCreateSerializer(serializers.ModelSerializer):
     """Serializer for creating applications - applicant auto-set from request"""
     class Meta:
@@ -238,4 +374,7 @@ class ApplicationCreateSerializer(serializers.ModelSerializer):
             user = self.context['request'].user
             if hasattr(user, 'profile') and user.profile.cv:
                 validated_data['cv_url'] = user.profile.cv
-        return super().create(validated_data)
\ No newline at end of file
+        with transaction.atomic():
+            application = super().create(validated_data)
+            adjust_application_counters(application.form_id, new_status=application.status)
+        return application
\ No newline at end of file
@@ -0,0 +1,73 @@
+from django.db.models.signals import pre_save, post_save, post_delete
+from django.dispatch import receiver
+
+from main.lookup_cache import bump_version
+
+from . import public_feed
+from .models import natural_sort_fields
+from .search import update_search_index, remove_from_search_index
+
+
+@receiver(post_save, sender='jobfinder.Form')
+def index_form_for_search(sender, instance, update_fields=None, **kwargs):
+    """Refresh the full-text index entry when a Form's searchable text may have changed."""
+    if update_fields is not None and 'search_document' not in update_fields:
+        return
+    update_search_index(instance)
+
+
+@receiver(post_delete, sender='jobfinder.Form')
+def unindex_deleted_form(sender, instance, **kwargs):
+    remove_from_search_index(instance.pk)
+
+
+@receiver(pre_save, sender='jobfinder.Form')
+def remember_feed_row(sender, instance, raw=False, **kwargs):
+    """Keep where the job sat in the public feed before the save (see post_save below)."""
+    if not raw and instance.pk is not None:
+        instance._feed_rows_before = public_feed.feed_rows([instance.pk])
+
+
+@receiver(post_save, sender='jobfinder.Form')
+@receiver(post_delete, sender='jobfinder.Form')
+def invalidate_public_feed(sender, instance, raw=False, **kwargs):
+    """Retire the feed pages the job was or is listed on, and the database-served list validators."""
+    if raw:
+        return
+    rows = getattr(instance, '_feed_rows_before', [])
+    instance._feed_rows_before = []
+    job_type = instance.job_type.code if instance.job_type_id else None
+    published = instance.status == 'approved' and instance.is_active and not instance.owner_hidden
+    scopes = set()
+    for province_id, job_type_code, was_published in rows + [(instance.province_id, job_type, published)]:
+        if was_published:
+            scopes |= public_feed.scopes_for(province_id, job_type_code)
+    public_feed.invalidate_job_write(scopes)
+
+
+@receiver([post_save, post_delete], sender='jobfinder.VerifiedCompany')
+@receiver([post_save, post_delete], sender='jobfinder.WorkFormat')
+@receiver([post_save, post_delete], sender='jobfinder.JobType')
+@receiver([post_save, post_delete], sender='jobfinder.Currency')
+def invalidate_lookup_cache(sender, **kwargs):
+    """Retire the cached lookup list (and its ETag) after any change."""
+    bump_version(sender)
+    # Lookup names are part of every feed row
+    public_feed.invalidate_all()
+
+
+@receiver([post_save, post_delete], sender='jobfinder.Province')
+@receiver([post_save, post_delete], sender='jobfinder.District')
+@receiver([post_save, post_delete], sender='jobfinder.Ward')
+def invalidate_location_snapshot(sender, **kwargs):
+    """A new table version makes locations.get_snapshot() rebuild the hierarchy."""
+    bump_version(sender)
+    public_feed.invalidate_all()
+
+
+@receiver(pre_save, sender='jobfinder.District')
+@receiver(pre_save, sender='jobfinder.Ward')
+def set_natural_sort_keys(sender, instance, **kwargs):
+    """Derive is_numeric/numeric_value from the name; also runs for raw fixture loads."""
+    for field, value in natural_sort_fields(instance.name).items():
+        setattr(instance, field, value)
@@ -0,0 +1,102 @@
+"""
+Aggregate counters for the admin dashboard.
+
+Each table is summarized by one grouped query (``values(...).annotate(Count)``)
+instead of shipping every row to the browser to be counted there, and the
+result is cached for ``STATS_TIMEOUT`` seconds so a busy dashboard costs a
+cache read.
+"""
+from datetime import timedelta
+
+from django.core.cache import cache
+from django.db.models import Count
+from django.db.models.functions import TruncDay, TruncWeek, TruncMonth
+from django.utils import timezone
+
+from users.models import CustomUser
+
+from .models import Form, Application
+
+STATS_KEY = 'jobfinder:stats:{bucket}'
+STATS_TIMEOUT = 60
+
+# bucket -> (truncate function, number of buckets returned)
+BUCKETS = {
+    'day': (TruncDay, 30),
+    'week': (TruncWeek, 12),
+    'month': (TruncMonth, 12),
+}
+DEFAULT_BUCKET = 'day'
+
+
+def _bucket_starts(bucket, count):
+    """Start of the last ``count`` buckets, oldest first, in the current timezone."""
+    now = timezone.localtime()
+    start = now.replace(hour=0, minute=0, second=0, microsecond=0)
+    if bucket == 'week':
+        start -= timedelta(days=start.weekday())
+    elif bucket == 'month':
+        start = start.replace(day=1)
+
+    starts = [start]
+    for _ in range(count - 1):
+        if bucket == 'day':
+            start -= timedelta(days=1)
+        elif bucket == 'week':
+            start -= timedelta(weeks=1)
+        else:
+            start = (start - timedelta(days=1)).replace(day=1)
+        starts.append(start)
+    return starts[::-1]
+
+
+def _series(queryset, field, bucket, starts):
+    trunc = BUCKETS[bucket][0]
+    rows = (
+        queryset.filter(**{f'{field}__gte': starts[0]})
+        .annotate(bucket=trunc(field))
+        .values('bucket')
+        .annotate(count=Count('id'))
+        .order_by()
+    )
+    counts = {timezone.localtime(row['bucket']).date(): row['count'] for row in rows}
+    return [{'start': s.date().isoformat(), 'count': counts.get(s.date(), 0)} for s in starts]
+
+
+def compute_stats(bucket=DEFAULT_BUCKET):
+    jobs = {'total': 0, 'hidden': 0, 'by_status': {code: 0 for code, _ in Form.STATUS_CHOICES}}
+    for row in Form.objects.values('is_active', 'status').annotate(count=Count('id')).order_by():
+        jobs['total'] += row['count']
+        if row['is_active']:
+            jobs['by_status'][row['status']] = jobs['by_status'].get(row['status'], 0) + row['count']
+        else:
+            jobs['hidden'] += row['count']
+
+    applications = {'total': 0, 'by_status': {code: 0 for code, _ in Application.STATUS_CHOICES}}
+    for row in Application.objects.values('status').annotate(count=Count('id')).order_by():
+        applications['total'] += row['count']
+        applications['by_status'][row['status']] = applications['by_status'].get(row['status'], 0) + row['count']
+
+    users = {'total': 0, 'by_status': {}}
+    for row in CustomUser.objects.values('status_id').annotate(count=Count('id')).order_by():
+        users['total'] += row['count']
+        if row['status_id']:
+            users['by_status'][row['status_id']] = row['count']
+
+    starts = _bucket_starts(bucket, BUCKETS[bucket][1])
+    return {
+        'jobs': jobs,
+        'applications': applications,
+        'users': users,
+        'timeline': {
+            'bucket': bucket,
+            'jobs': _series(Form.objects.all(), 'created_at', bucket, starts),
+            'applications': _series(Application.objects.all(), 'applied_at', bucket, starts),
+        },
+        'generated_at': timezone.now().isoformat(),
+    }
+
+
+def get_stats(bucket=DEFAULT_BUCKET):
+    """Return the dashboard statistics, recomputed at most every STATS_TIMEOUT seconds."""
+    return cache.get_or_set(STATS_KEY.format(bucket=bucket), lambda: compute_stats(bucket), STATS_TIMEOUT)
@@ -0,0 +1,170 @@
+from datetime import timedelta
+
+from django.core.cache import cache
+from django.utils import timezone
+from rest_framework.test import APITestCase
+
+from users.models import CustomUser
+
+from .counters import reconcile_application_counters
+from .models import Application, Form, VerifiedCompany
+
+
+class JobfinderTestCase(APITestCase):
+    fixtures = ['users_lookups.json', '01_lookups_basic.json']
+
+    def setUp(self):
+        # LocMemCache outlives a test's transaction; start every test cold
+        cache.clear()
+        self.employer = CustomUser.objects.create_user('emp', 'emp@example.com', password='pw', status_id='ACTIVE')
+
+    def login(self, username, password='pw'):
+        response = self.client.post('/api/users/token/', {'username': username, 'password': password}, format='json')
+        self.assertEqual(response.status_code, 200, response.content)
+        self.client.credentials(HTTP_AUTHORIZATION='Bearer ' + response.json()['access'])
+
+    def post_job(self, **data):
+        data = {'verified_company': 'fpt', 'title': 'Python Developer', **data}
+        response = self.client.post('/api/jobfinder/forms/', data, format='json')
+        self.assertEqual(response.status_code, 201, response.content)
+        return Form.objects.get(pk=response.json()['id'])
+
+    def make_job(self, title='Python Developer', **fields):
+        fields.setdefault('status', 'approved')
+        return Form.objects.create(
+            verified_company=VerifiedCompany.objects.get(code='fpt'), created_by=self.employer, title=title, **fields
+        )
+
+    def public_ids(self, path='/api/jobfinder/forms/?page_size=all'):
+        response = self.client_class().get(path)
+        self.assertEqual(response.status_code, 200, response.content)
+        payload = response.json()
+        rows = payload['results'] if isinstance(payload, dict) else payload
+        return {row['id'] for row in rows}
+
+
+class VisibilityTests(JobfinderTestCase):
+    def test_anonymous_list_shows_published_jobs_only(self):
+        published = self.make_job()
+        pending = self.make_job(status='pending')
+        expired = self.make_job(expires_at=timezone.now() - timedelta(minutes=1))
+        inactive = self.make_job(is_active=False)
+
+        for path in ('/api/jobfinder/forms/?page_size=all', '/api/jobfinder/forms/?page_size=all&keyword=Python'):
+            ids = self.public_ids(path)
+            self.assertIn(published.pk, ids)
+            self.assertFalse(ids & {pending.pk, expired.pk, inactive.pk})
+        self.assertEqual(self.client.get(f'/api/jobfinder/forms/{pending.pk}/').status_code, 404)
+
+    def test_owner_sees_own_unpublished_jobs(self):
+        pending = self.make_job(status='pending')
+        self.login('emp')
+        response = self.client.get('/api/jobfinder/forms/?page_size=all')
+        self.assertIn(pending.pk, {row['id'] for row in response.json()})
+        self.assertIn('private', response['Cache-Control'])
+        self.assertEqual(self.client.get(f'/api/jobfinder/forms/{pending.pk}/').status_code, 200)
+
+    def test_feed_page_is_retired_when_a_job_is_published(self):
+        form = self.make_job(status='pending')
+        self.assertNotIn(form.pk, self.public_ids())
+        form.status = 'approved'
+        with self.captureOnCommitCallbacks(execute=True):
+            form.save()
+        self.assertIn(form.pk, self.public_ids())
+
+
+class OwnerHiddenTests(JobfinderTestCase):
+    def test_stale_token_cannot_publish_for_locked_owner(self):
+        self.login('emp')
+        # Locked after the token was issued: the token still claims ACTIVE
+        CustomUser.objects.filter(pk=self.employer.pk).update(status_id='LOCKED')
+        form = self.post_job()
+        self.assertTrue(form.owner_hidden)
+
+        Form.objects.filter(pk=form.pk).update(status='approved')
+        # Both the anonymous feed and the filtered database query leave it out
+        self.assertNotIn(form.pk, self.public_ids())
+        self.assertNotIn(form.pk, self.public_ids('/api/jobfinder/forms/?page_size=all&keyword=Python'))
+
+    def test_locking_through_me_hides_jobs(self):
+        self.login('emp')
+        form = self.post_job()
+        self.assertFalse(form.owner_hidden)
+        response = self.client.patch('/api/users/me/', {'status': 'LOCKED'}, format='json')
+        self.assertEqual(response.status_code, 200, response.content)
+        form.refresh_from_db()
+        self.assertTrue(form.owner_hidden)
+
+
+class ListValidatorTests(JobfinderTestCase):
+    def test_signed_in_list_validators_are_cached_until_a_job_changes(self):
+        self.login('emp')
+        form = self.post_job()
+        path = '/api/jobfinder/forms/?page_size=all'
+        etag = self.client.get(path)['ETag']
+
+        with self.assertNumQueries(0):
+            response = self.client.get(path, HTTP_IF_NONE_MATCH=etag)
+        self.assertEqual(response.status_code, 304)
+
+        # The owner's pending job is in their list but on no feed page
+        form.title = 'Senior Python Developer'
+        with self.captureOnCommitCallbacks(execute=True):
+            form.save()
+        self.assertEqual(self.client.get(path, HTTP_IF_NONE_MATCH=etag).status_code, 200)
+
+
+class ApplicationCounterTests(JobfinderTestCase):
+    def setUp(self):
+        super().setUp()
+        self.seeker = CustomUser.objects.create_user('seek', 'seek@example.com', password='pw', status_id='ACTIVE')
+        self.form = self.make_job()
+
+    def counters(self):
+        return Form.objects.values(
+            'application_count', 'pending_application_count', 'approved_application_count', 'rejected_application_count',
+        ).get(pk=self.form.pk)
+
+    def test_counters_follow_application_lifecycle(self):
+        self.login('seek')
+        response = self.client.post('/api/jobfinder/applications/', {'form': self.form.pk}, format='json')
+        self.assertEqual(response.status_code, 201, response.content)
+        application = Application.objects.get(form=self.form, applicant=self.seeker)
+        self.assertEqual(self.counters(), {
+            'application_count': 1, 'pending_application_count': 1,
+            'approved_application_count': 0, 'rejected_application_count': 0,
+        })
+
+        self.login('emp')
+        response = self.client.patch(f'/api/jobfinder/applications/{application.pk}/', {'status': 'approved'}, format='json')
+        self.assertEqual(response.status_code, 200, response.content)
+        self.assertEqual(self.counters()['pending_application_count'], 0)
+        self.assertEqual(self.counters()['approved_application_count'], 1)
+
+        self.login('seek')
+        response = self.client.delete(f'/api/jobfinder/applications/{application.pk}/')
+        self.assertEqual(response.status_code, 204, response.content)
+        self.assertEqual(self.counters(), dict.fromkeys(self.counters(), 0))
+
+    def test_bulk_status_moves_counters_and_rejects_bad_status(self):
+        application = Application.objects.create(form=self.form, applicant=self.seeker)
+        Form.objects.filter(pk=self.form.pk).update(application_count=1, pending_application_count=1)
+        self.login('emp')
+        path = '/api/jobfinder/applications/bulk-status/'
+        response = self.client.post(path, {'ids': [application.pk], 'status': ['approved']}, format='json')
+        self.assertEqual(response.status_code, 400)
+
+        response = self.client.post(path, {'ids': [application.pk], 'status': 'rejected'}, format='json')
+        self.assertEqual(response.status_code, 200, response.content)
+        self.assertEqual(response.json()['results'], {str(application.pk): 'updated'})
+        self.assertEqual(self.counters()['rejected_application_count'], 1)
+        self.assertEqual(self.counters()['pending_application_count'], 0)
+
+    def test_reconcile_repairs_drifted_counters(self):
+        Application.objects.create(form=self.form, applicant=self.seeker, status='approved')
+        self.assertEqual(reconcile_application_counters(), 1)
+        self.assertEqual(self.counters(), {
+            'application_count': 1, 'pending_application_count': 0,
+            'approved_application_count': 1, 'rejected_application_count': 0,
+        })
+        self.assertEqual(reconcile_application_counters(), 0)
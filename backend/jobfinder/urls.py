@@ -13,6 +13,7 @@ from .views import (
     FormViewSet,
     PendingLookupViewSet,
     ApplicationViewSet,
+    StatsView,
 )
 
 router = DefaultRouter()
@@ -30,4 +31,5 @@ router.register(r'applications', ApplicationViewSet, basename='application')
 
 urlpatterns = [
     path('', include(router.urls)),
+    path('stats/', StatsView.as_view(), name='stats'),
 ]
@@ -1,12 +1,25 @@
+import hashlib
+from datetime import timedelta
+
 from rest_framework import viewsets, permissions, status
 from rest_framework.response import Response
 from rest_framework.decorators import action
+from rest_framework.views import APIView
 
+from django_filters.rest_framework import DjangoFilterBackend
 from django.shortcuts import get_object_or_404
-from django.db.models import Case, When, Value, IntegerField
-from django.db.models.functions import Cast
+from django.http import Http404, HttpResponse, HttpResponseNotModified
+from django.utils.cache import get_conditional_response, patch_cache_control, patch_vary_headers
+from django.utils.http import http_date
+from django.utils import timezone
+from django.db.models import Case, When, Value, IntegerField, Count, Max, Q, Sum
 from django.db import transaction
 
+from main.lookup_cache import CachedLookupListMixin, bump_version, etag_matches
+from main.middleware import precompressed_response
+from users.authentication import user_is_admin, user_is_employer
+from users.cv_index import matching_cv_texts
+
 from .models import (
     VerifiedCompany,
     WorkFormat,
@@ -19,6 +32,8 @@ from .models import (
     Form,
     PendingLookup,
     Application,
+    NATURAL_SORT_ORDERING,
+    APPLICATION_STATUS_COUNTERS,
 )
 from .serializers import (
     VerifiedCompanySerializer,
@@ -30,22 +45,63 @@ from .serializers import (
     DistrictSerializer,
     WardSerializer,
     FormSerializer,
+    FormListSerializer,
+    ModerationQueueSerializer,
     ApplicationSerializer,
+    ApplicationInboxSerializer,
     ApplicationCreateSerializer,
 )
+from .filters import FormFilter
+from .pagination import (
+    FormCursorPagination,
+    ModerationQueuePagination,
+    ApplicationCursorPagination,
+    SearchPagination,
+)
+from .search import search_forms
+from . import public_feed
+from .locations import get_snapshot
+from .stats import get_stats, BUCKETS, DEFAULT_BUCKET
+from .counters import adjust_application_counters
+
+
+# Location lists only change when the administrative tables are reloaded
+LOCATION_MAX_AGE = 24 * 60 * 60
+
+# Upper bound on ids per bulk request, to keep the IN (...) list and the lock set small
+BULK_MAX_IDS = 500
+
+# Bulk moderation target -> the columns it sets on Form
+FORM_MODERATION_TARGETS = {
+    'approved': {'status': 'approved'},
+    'rejected': {'status': 'rejected'},
+    'restored': {'is_active': True},
+    'hidden': {'is_active': False},
+}
+
+# A moderation queue claim lapses after this long, so abandoned claims return to the queue
+MODERATION_CLAIM_TTL = timedelta(minutes=15)
+MODERATION_CLAIM_MAX = 50
+
+
+def parse_bulk_ids(data):
+    """Return the de-duplicated ``ids`` list of a bulk request, or None when it is invalid."""
+    ids = data.get('ids')
+    if (
+        not isinstance(ids, list) or not ids or len(ids) > BULK_MAX_IDS
+        or not all(isinstance(pk, int) and not isinstance(pk, bool) for pk in ids)
+    ):
+        return None
+    return list(dict.fromkeys(ids))
 
 
 class IsOwnerOrAdmin(permissions.BasePermission):
     """Allow access if user is object owner (created_by) or admin."""
 
     def has_object_permission(self, request, view, obj):
-        if request.user and request.user.is_staff:
+        if user_is_admin(request.user):
             return True
-        # Also check role
-        if request.user and hasattr(request.user, 'role') and request.user.role:
-            if request.user.role.code.upper() == 'ADMIN':
-                return True
-        return getattr(obj, 'created_by', None) == request.user
+        return getattr(obj, 'created_by_id', None) == request.user.pk
 
 
 class LookupViewSetMixin:
@@ -63,7 +119,7 @@ class LookupViewSetMixin:
         if not items:
             return Response({'detail': 'No items provided.'}, status=status.HTTP_400_BAD_REQUEST)
         
-        model = self.queryset.model if hasattr(self, 'queryset') else self.get_queryset().model
+        model = self.queryset.model if self.queryset is not None else self.get_queryset().model
         try:
             with transaction.atomic():
                 for item_data in items:
@@ -71,12 +127,13 @@ class LookupViewSetMixin:
                     order = item_data.get('order')
                     if code is not None and order is not None:
                         model.objects.filter(code=code).update(order=order)
+                bump_version(model)
             return Response({'detail': 'Order updated successfully.'}, status=status.HTTP_200_OK)
         except Exception as e:
             return Response({'detail': str(e)}, status=status.HTTP_400_BAD_REQUEST)
 
 
-class VerifiedCompanyViewSet(LookupViewSetMixin, viewsets.ModelViewSet):
+class VerifiedCompanyViewSet(CachedLookupListMixin, LookupViewSetMixin, viewsets.ModelViewSet):
     serializer_class = VerifiedCompanySerializer
     lookup_field = 'code'
 
@@ -91,7 +148,7 @@ class VerifiedCompanyViewSet(LookupViewSetMixin, viewsets.ModelViewSet):
         ).order_by('is_other', 'order', 'name')
 
 
-class WorkFormatViewSet(LookupViewSetMixin, viewsets.ModelViewSet):
+class WorkFormatViewSet(CachedLookupListMixin, LookupViewSetMixin, viewsets.ModelViewSet):
     serializer_class = WorkFormatSerializer
     lookup_field = 'code'
 
@@ -106,7 +163,7 @@ class WorkFormatViewSet(LookupViewSetMixin, viewsets.ModelViewSet):
         ).order_by('is_other', 'order', 'name')
 
 
-class JobTypeViewSet(LookupViewSetMixin, viewsets.ModelViewSet):
+class JobTypeViewSet(CachedLookupListMixin, LookupViewSetMixin, viewsets.ModelViewSet):
     serializer_class = JobTypeSerializer
     lookup_field = 'code'
 
@@ -121,7 +178,7 @@ class JobTypeViewSet(LookupViewSetMixin, viewsets.ModelViewSet):
         ).order_by('is_other', 'order', 'name')
 
 
-class CurrencyViewSet(LookupViewSetMixin, viewsets.ModelViewSet):
+class CurrencyViewSet(CachedLookupListMixin, LookupViewSetMixin, viewsets.ModelViewSet):
     serializer_class = CurrencySerializer
     lookup_field = 'code'
 
@@ -142,33 +199,39 @@ class AdministrativeUnitViewSet(LookupViewSetMixin, viewsets.ReadOnlyModelViewSe
     serializer_class = AdministrativeUnitSerializer
 
 
+def location_response(request, snapshot, body, name=None):
+    """Serve a pre-rendered location list from the snapshot with long-lived caching headers.
+
+    ``name`` picks one of the full lists, which the snapshot keeps precompressed.
+    """
+    etag = '"locations-%s"' % snapshot['version']
+    if etag_matches(request, etag):
+        response = HttpResponseNotModified()
+    elif name is not None:
+        response = precompressed_response(request, body, snapshot['encoded'][name])
+    else:
+        response = HttpResponse(body, content_type='application/json')
+    response['ETag'] = etag
+    patch_cache_control(response, public=True, max_age=LOCATION_MAX_AGE)
+    return response
+
+
 class ProvinceViewSet(LookupViewSetMixin, viewsets.ReadOnlyModelViewSet):
     """Tỉnh/Thành phố trực thuộc trung ương"""
     queryset = Province.objects.filter(is_active=True).select_related('administrative_unit').order_by('name')
     serializer_class = ProvinceSerializer
 
+    def list(self, request, *args, **kwargs):
+        snapshot = get_snapshot()
+        return location_response(request, snapshot, snapshot['provinces'], 'provinces')
+
     @action(detail=True, methods=['get'])
     def districts(self, request, pk=None):
         """Get districts sorted: numeric names first (sorted numerically), then alphabetic names."""
-        province = self.get_object()
-        districts = District.objects.filter(province=province, is_active=True).select_related('administrative_unit')
-        
-        # Sort: numeric names first (by numeric value), then alphabetic names
-        districts = districts.annotate(
-            is_numeric=Case(
-                When(name__regex=r'^\d+$', then=Value(0)),
-                default=Value(1),
-                output_field=IntegerField()
-            ),
-            numeric_value=Case(
-                When(name__regex=r'^\d+$', then=Cast('name', IntegerField())),
-                default=Value(999999),
-                output_field=IntegerField()
-            )
-        ).order_by('is_numeric', 'numeric_value', 'name')
-        
-        serializer = DistrictSerializer(districts, many=True)
-        return Response(serializer.data)
+        snapshot = get_snapshot()
+        if pk not in snapshot['province_ids']:
+            raise Http404
+        return location_response(request, snapshot, snapshot['districts_by_province'].get(pk, b'[]'))
 
 
 class DistrictViewSet(LookupViewSetMixin, viewsets.ReadOnlyModelViewSet):
@@ -184,43 +247,22 @@ class DistrictViewSet(LookupViewSetMixin, viewsets.ReadOnlyModelViewSet):
             queryset = queryset.filter(province_id=province_id)
         
         # Sort: numeric names first (by numeric value), then alphabetic names
-        queryset = queryset.annotate(
-            is_numeric=Case(
-                When(name__regex=r'^\d+$', then=Value(0)),
-                default=Value(1),
-                output_field=IntegerField()
-            ),
-            numeric_value=Case(
-                When(name__regex=r'^\d+$', then=Cast('name', IntegerField())),
-                default=Value(999999),
-                output_field=IntegerField()
-            )
-        ).order_by('is_numeric', 'numeric_value', 'name')
-        
-        return queryset
+        return queryset.order_by(*NATURAL_SORT_ORDERING)
+
+    def list(self, request, *args, **kwargs):
+        snapshot = get_snapshot()
+        province_id = request.query_params.get('province')
+        if province_id:
+            return location_response(request, snapshot, snapshot['districts_by_province'].get(province_id, b'[]'))
+        return location_response(request, snapshot, snapshot['districts'], 'districts')
 
     @action(detail=True, methods=['get'])
     def wards(self, request, pk=None):
         """Get wards sorted: numeric names first (sorted numerically), then alphabetic names."""
-        district = self.get_object()
-        wards = Ward.objects.filter(district=district, is_active=True).select_related('administrative_unit')
-        
-        # Sort: numeric names first (by numeric value), then alphabetic names
-        wards = wards.annotate(
-            is_numeric=Case(
-                When(name__regex=r'^\d+$', then=Value(0)),
-                default=Value(1),
-                output_field=IntegerField()
-            ),
-            numeric_value=Case(
-                When(name__regex=r'^\d+$', then=Cast('name', IntegerField())),
-                default=Value(999999),
-                output_field=IntegerField()
-            )
-        ).order_by('is_numeric', 'numeric_value', 'name')
-        
-        serializer = WardSerializer(wards, many=True)
-        return Response(serializer.data)
+        snapshot = get_snapshot()
+        if pk not in snapshot['district_ids']:
+            raise Http404
+        return location_response(request, snapshot, snapshot['wards_by_district'].get(pk, b'[]'))
 
 
 class WardViewSet(LookupViewSetMixin, viewsets.ReadOnlyModelViewSet):
@@ -236,20 +278,48 @@ class WardViewSet(LookupViewSetMixin, viewsets.ReadOnlyModelViewSet):
             queryset = queryset.filter(district_id=district_id)
         
         # Sort: numeric names first (by numeric value), then alphabetic names
-        queryset = queryset.annotate(
-            is_numeric=Case(
-                When(name__regex=r'^\d+$', then=Value(0)),
-                default=Value(1),
-                output_field=IntegerField()
-            ),
-            numeric_value=Case(
-                When(name__regex=r'^\d+$', then=Cast('name', IntegerField())),
-                default=Value(999999),
-                output_field=IntegerField()
-            )
-        ).order_by('is_numeric', 'numeric_value', 'name')
-        
-        return queryset
+        return queryset.order_by(*NATURAL_SORT_ORDERING)
+
+    def list(self, request, *args, **kwargs):
+        snapshot = get_snapshot()
+        district_id = request.query_params.get('district')
+        if district_id:
+            return location_response(request, snapshot, snapshot['wards_by_district'].get(district_id, b'[]'))
+        return location_response(request, snapshot, snapshot['wards'], 'wards')
+
+
+# Cache-Control per visibility class of a job response: anonymous visitors get
+# the shared published set, owners see their own unpublished jobs, admins see
+# everything (nothing an admin is shown may linger in a cache)
+FORM_CACHE_CONTROL = {
+    'public': {'public': True, 'max_age': 60},
+    'owner': {'private': True, 'no_cache': True},
+    'admin': {'private': True, 'no_store': True},
+}
+
+# Columns that change a job's representation without touching updated_at
+FORM_VALIDATOR_FIELDS = ('application_count', *APPLICATION_STATUS_COUNTERS.values())
+
+
+def form_validators(*parts):
+    """Strong ETag over ``parts`` plus the feed generation (lookup/location names in the body)."""
+    digest = hashlib.sha256(repr((public_feed.generation(),) + parts).encode()).hexdigest()[:32]
+    return f'"form-{digest}"'
+
+
+def conditional_response(request, etag, last_modified, visibility, build_response):
+    """Answer If-None-Match/If-Modified-Since with 304 before ``build_response()`` serializes anything."""
+    last_modified = int(last_modified.timestamp()) if last_modified else None
+    response = get_conditional_response(request, etag=etag, last_modified=last_modified)
+    if response is None:
+        response = build_response()
+    response['ETag'] = etag
+    if last_modified:
+        response['Last-Modified'] = http_date(last_modified)
+    patch_cache_control(response, **FORM_CACHE_CONTROL[visibility])
+    # Signed-in users get their own jobs in the same URLs
+    patch_vary_headers(response, ('Authorization',))
+    return response
 
 
 class FormViewSet(viewsets.ModelViewSet):
@@ -259,10 +329,19 @@ class FormViewSet(viewsets.ModelViewSet):
     - Retrieve: public allowed for published items; owner/staff can access all.
     - Create: authenticated users only.
     - Update/Delete: owner or admin.
+    - Filtering: see FormFilter for the supported query parameters.
+    - Pagination: cursor based, newest first; ``?page_size=all`` returns the full list.
+    - Lists use the compact FormListSerializer schema; retrieve returns the full FormSerializer.
+    - List and retrieve carry ETag/Last-Modified and answer conditional requests with 304.
     """
 
-    queryset = Form.objects.select_related('verified_company', 'work_format', 'job_type', 'salary_currency').all()
+    queryset = Form.objects.select_related(
+        'verified_company', 'work_format', 'job_type', 'salary_currency', 'province', 'district', 'ward', 'created_by'
+    ).all()
     serializer_class = FormSerializer
+    filter_backends = [DjangoFilterBackend]
+    filterset_class = FormFilter
+    pagination_class = FormCursorPagination
 
     def get_permissions(self):
         if self.action in ['create']:
@@ -272,40 +351,112 @@ class FormViewSet(viewsets.ModelViewSet):
         return [permissions.AllowAny()]
 
     def get_queryset(self):
-        from django.db.models import Q
-        qs = super().get_queryset()
+        return super().get_queryset().filter(self.visible_filter())
+
+    def visible_filter(self):
+        """Q of the jobs the current user may see."""
         user = self.request.user
-        
-        # Define status codes where jobs should be hidden
-        # LOCKED and BANNED: hide all jobs
-        # INACTIVE: jobs still visible
-        # SUSPENDED: jobs still visible
-        hidden_owner_statuses = ['LOCKED', 'BANNED']
-        
-        # Base filter: exclude jobs from users with hidden statuses (for non-admin)
-        def exclude_hidden_owners(queryset):
-            return queryset.exclude(
-                created_by__status__code__in=hidden_owner_statuses
-            )
-        
+
         # Staff or admin role can see all statuses but only active jobs
         if user.is_authenticated:
-            is_admin = user.is_staff or (hasattr(user, 'role') and user.role and user.role.code.upper() == 'ADMIN')
+            is_admin = user_is_admin(user)
             if is_admin:
-                return qs.filter(is_active=True)
+                return Q(is_active=True)
+
+        # Approved, active, not past expires_at and not from a LOCKED/BANNED owner
+        # (owner_hidden, see owners.py); served by form_public_listing_idx.
+        # INACTIVE and SUSPENDED owners' jobs stay visible.
+        now = timezone.now()
+        published = (
+            Q(status='approved', is_active=True, owner_hidden=False)
+            & (Q(expires_at__isnull=True) | Q(expires_at__gt=now))
+        )
 
-        # Authenticated users see: approved & active jobs + their own active jobs (any status)
+        # Authenticated users see: published jobs + their own active jobs (any status)
         if user.is_authenticated:
-            base_qs = qs.filter(
-                Q(status='approved', is_active=True) | Q(created_by=user, is_active=True)
-            )
-            # Exclude jobs from hidden owners (except user's own jobs)
-            return base_qs.exclude(
-                ~Q(created_by=user) & Q(created_by__status__code__in=hidden_owner_statuses)
+            return published | Q(created_by_id=user.pk, is_active=True)
+
+        # Anonymous: only published jobs
+        return published
+
+    @action(detail=False, methods=['get'], pagination_class=SearchPagination)
+    def search(self, request):
+        """Full-text search (``?q=``) over the job text fields, best match first.
+
+        Diacritics are ignored, so "ke toan" finds "Kế toán". FormFilter parameters still apply.
+        """
+        query = request.query_params.get('q', '').strip()
+        if not query:
+            return Response({'detail': 'Query parameter "q" is required.'}, status=status.HTTP_400_BAD_REQUEST)
+
+        return self.list_response(search_forms(self.filter_queryset(self.get_queryset()), query))
+
+    def visibility(self, owner_id=None):
+        user = self.request.user
+        if not user.is_authenticated:
+            return 'public'
+        if user_is_admin(user):
+            return 'admin'
+        # A signed-in user's list includes their own unpublished jobs
+        if owner_id is None or owner_id == user.pk:
+            return 'owner'
+        return 'public'
+
+    def list(self, request, *args, **kwargs):
+        queryset = self.filter_queryset(self.get_queryset())
+        # Anonymous pages of the common filters come from the materialized feed
+        scope = public_feed.feed_scope(request)
+        if scope is not None:
+            return public_feed.serve(
+                request, scope, queryset, lambda: self.list_response(queryset), FORM_CACHE_CONTROL['public'],
             )
 
-        # Anonymous: only approved & active jobs, excluding hidden owners
-        return exclude_hidden_owners(qs.filter(status='approved', is_active=True))
+        visibility = self.visibility()
+        etag, last_modified = public_feed.list_validators(
+            request, visibility, queryset, lambda: self.list_validators(request),
+        )
+        return conditional_response(
+            request, etag, last_modified, visibility,
+            lambda: self.list_response(queryset),
+        )
+
+    def list_validators(self, request):
+        """``(etag, last_modified)`` of the list; one aggregate, cached by public_feed.list_validators."""
+        # Validators over the filtered jobs whether visible or not: a job that
+        # dropped out of the list (hidden, owner locked, expired) leaves its
+        # updated_at or expires_at behind for If-Modified-Since
+        visible = self.visible_filter()
+        summary = self.filter_queryset(Form.objects.all()).order_by().aggregate(
+            changed=Max('updated_at'),
+            expired=Max('expires_at', filter=Q(expires_at__lte=timezone.now())),
+            count=Count('id', filter=visible),
+            **{field: Sum(field, filter=visible) for field in FORM_VALIDATOR_FIELDS},
+        )
+        etag = form_validators(
+            'list', request.user.pk, request.get_full_path(), *(summary[key] for key in sorted(summary))
+        )
+        return etag, max(filter(None, (summary['changed'], summary['expired'])), default=None)
+
+    def retrieve(self, request, *args, **kwargs):
+        pk = str(kwargs.get(self.lookup_url_kwarg or self.lookup_field, ''))
+        if not pk.isdigit():
+            raise Http404
+        row = get_object_or_404(
+            self.get_queryset().values('updated_at', 'created_by_id', *FORM_VALIDATOR_FIELDS), pk=pk
+        )
+        etag = form_validators('detail', int(pk), *(row[key] for key in sorted(row)))
+        return conditional_response(
+            request, etag, row['updated_at'], self.visibility(row['created_by_id']),
+            lambda: super(FormViewSet, self).retrieve(request, *args, **kwargs),
+        )
+
+    def list_response(self, queryset, serializer_class=FormListSerializer):
+        """Paginated list in the compact FormListSerializer schema (one .values() query)."""
+        rows = serializer_class.project(queryset)
+        page = self.paginate_queryset(rows)
+        if page is not None:
+            return self.get_paginated_response(serializer_class(page, many=True).data)
+        return Response(serializer_class(rows, many=True).data)
 
     def perform_create(self, serializer):
         # set created_by if available
@@ -343,50 +494,48 @@ class FormViewSet(viewsets.ModelViewSet):
     def approve(self, request, pk=None):
         """Admin action to approve a job posting."""
         user = request.user
-        is_admin = user.is_staff or (hasattr(user, 'role') and user.role and user.role.code.upper() == 'ADMIN')
+        is_admin = user_is_admin(user)
         if not is_admin:
             return Response({'detail': 'Only admins can approve jobs.'}, status=status.HTTP_403_FORBIDDEN)
         
         form = self.get_object()
         form.status = 'approved'
-        form.save()
+        form.save(update_fields=['status', 'updated_at'])
         return Response({'detail': 'Job approved successfully.', 'status': form.status})
 
     @action(detail=True, methods=['post'], permission_classes=[permissions.IsAuthenticated])
     def reject(self, request, pk=None):
         """Admin action to reject a job posting."""
         user = request.user
-        is_admin = user.is_staff or (hasattr(user, 'role') and user.role and user.role.code.upper() == 'ADMIN')
+        is_admin = user_is_admin(user)
         if not is_admin:
             return Response({'detail': 'Only admins can reject jobs.'}, status=status.HTTP_403_FORBIDDEN)
         
         form = self.get_object()
         form.status = 'rejected'
-        form.save()
+        form.save(update_fields=['status', 'updated_at'])
         return Response({'detail': 'Job rejected successfully.', 'status': form.status})
 
     def perform_destroy(self, instance):
         """Soft delete: set is_active = False instead of deleting."""
         instance.is_active = False
-        instance.save()
+        instance.save(update_fields=['is_active', 'updated_at'])
 
     @action(detail=False, methods=['get'], permission_classes=[permissions.IsAuthenticated])
     def hidden(self, request):
         """Admin action to list hidden (soft-deleted) jobs."""
         user = request.user
-        is_admin = user.is_staff or (hasattr(user, 'role') and user.role and user.role.code.upper() == 'ADMIN')
+        is_admin = user_is_admin(user)
         if not is_admin:
             return Response({'detail': 'Only admins can view hidden jobs.'}, status=status.HTTP_403_FORBIDDEN)
         
-        qs = Form.objects.filter(is_active=False)
-        serializer = self.get_serializer(qs, many=True)
-        return Response(serializer.data)
+        return self.list_response(Form.objects.filter(is_active=False))
 
     @action(detail=True, methods=['post'], permission_classes=[permissions.IsAuthenticated])
     def restore(self, request, pk=None):
         """Admin action to restore a hidden job."""
         user = request.user
-        is_admin = user.is_staff or (hasattr(user, 'role') and user.role and user.role.code.upper() == 'ADMIN')
+        is_admin = user_is_admin(user)
         if not is_admin:
             return Response({'detail': 'Only admins can restore jobs.'}, status=status.HTTP_403_FORBIDDEN)
         
@@ -396,9 +545,131 @@ class FormViewSet(viewsets.ModelViewSet):
             return Response({'detail': 'Job not found.'}, status=status.HTTP_404_NOT_FOUND)
         
         form.is_active = True
-        form.save()
+        form.save(update_fields=['is_active', 'updated_at'])
         return Response({'detail': 'Job restored successfully.'})
 
+    def moderation_queue_queryset(self):
+        # Matches the partial index condition, so pending jobs are read from the index
+        return Form.objects.filter(status='pending', is_active=True).order_by('created_at', 'id')
+
+    @action(
+        detail=False, methods=['get'], url_path='moderation-queue',
+        permission_classes=[permissions.IsAuthenticated], pagination_class=ModerationQueuePagination,
+    )
+    def moderation_queue(self, request):
+        """Admin action to list pending jobs, oldest first.
+
+        Jobs claimed by another moderator are left out unless
+        ``?include_claimed=true`` is passed.
+        """
+        user = request.user
+        if not user_is_admin(user):
+            return Response({'detail': 'Only admins can view the moderation queue.'}, status=status.HTTP_403_FORBIDDEN)
+
+        queryset = self.moderation_queue_queryset()
+        if request.query_params.get('include_claimed', '').lower() not in ('1', 'true'):
+            queryset = queryset.filter(self.claimable_by(user))
+        return self.list_response(queryset, ModerationQueueSerializer)
+
+    @staticmethod
+    def claimable_by(user):
+        """Jobs that are unclaimed, whose claim has lapsed, or that ``user`` already holds."""
+        return (
+            Q(claimed_at__isnull=True)
+            | Q(claimed_at__lt=timezone.now() - MODERATION_CLAIM_TTL)
+            | Q(claimed_by_id=user.pk)
+        )
+
+    @action(
+        detail=False, methods=['post'], url_path='moderation-queue/claim',
+        permission_classes=[permissions.IsAuthenticated],
+    )
+    def moderation_queue_claim(self, request):
+        """Admin action to claim the oldest ``limit`` unclaimed pending jobs.
+
+        Rows are picked with ``SELECT ... FOR UPDATE SKIP LOCKED``, so
+        moderators claiming at the same time get disjoint jobs. A claim lasts
+        MODERATION_CLAIM_TTL; claiming again renews the claims you hold.
+        """
+        user = request.user
+        if not user_is_admin(user):
+            return Response({'detail': 'Only admins can claim jobs.'}, status=status.HTTP_403_FORBIDDEN)
+
+        limit = request.data.get('limit', 10)
+        if not isinstance(limit, int) or isinstance(limit, bool) or not 1 <= limit <= MODERATION_CLAIM_MAX:
+            return Response(
+                {'detail': f'limit must be an integer between 1 and {MODERATION_CLAIM_MAX}.'},
+                status=status.HTTP_400_BAD_REQUEST,
+            )
+
+        with transaction.atomic():
+            ids = list(
+                self.moderation_queue_queryset()
+                .filter(self.claimable_by(user))
+                .select_for_update(skip_locked=True)
+                .values_list('id', flat=True)[:limit]
+            )
+            Form.objects.filter(pk__in=ids).update(claimed_by_id=user.pk, claimed_at=timezone.now())
+
+        rows = ModerationQueueSerializer.project(self.moderation_queue_queryset().filter(pk__in=ids))
+        return Response({'results': ModerationQueueSerializer(rows, many=True).data})
+
+    @action(
+        detail=False, methods=['post'], url_path='moderation-queue/release',
+        permission_classes=[permissions.IsAuthenticated],
+    )
+    def moderation_queue_release(self, request):
+        """Admin action to hand claimed jobs back to the queue: ``{"ids": [...]}``."""
+        user = request.user
+        if not user_is_admin(user):
+            return Response({'detail': 'Only admins can release jobs.'}, status=status.HTTP_403_FORBIDDEN)
+
+        ids = parse_bulk_ids(request.data)
+        if ids is None:
+            return Response(
+                {'detail': f'ids must be a list of 1-{BULK_MAX_IDS} job ids.'},
+                status=status.HTTP_400_BAD_REQUEST,
+            )
+        released = Form.objects.filter(pk__in=ids, claimed_by_id=user.pk).update(claimed_by=None, claimed_at=None)
+        return Response({'released': released})
+
+    @action(detail=False, methods=['post'], url_path='bulk-moderate', permission_classes=[permissions.IsAuthenticated])
+    def bulk_moderate(self, request):
+        """Admin action to approve, reject, restore or hide many jobs: ``{"ids": [...], "action": "approved"}``.
+
+        One UPDATE touches only ``status``/``is_active`` and ``updated_at``.
+        ``results`` maps each id to ``updated``, ``unchanged`` or ``not_found``.
+        """
+        if not user_is_admin(request.user):
+            return Response({'detail': 'Only admins can moderate jobs.'}, status=status.HTTP_403_FORBIDDEN)
+
+        target = request.data.get('action')
+        changes = FORM_MODERATION_TARGETS.get(target) if isinstance(target, str) else None
+        if changes is None:
+            return Response(
+                {'detail': f'action must be one of: {", ".join(FORM_MODERATION_TARGETS)}.'},
+                status=status.HTTP_400_BAD_REQUEST,
+            )
+        ids = parse_bulk_ids(request.data)
+        if ids is None:
+            return Response(
+                {'detail': f'ids must be a list of 1-{BULK_MAX_IDS} job ids.'},
+                status=status.HTTP_400_BAD_REQUEST,
+            )
+
+        results = dict.fromkeys(ids, 'not_found')
+        with transaction.atomic():
+            rows = Form.objects.select_for_update().filter(pk__in=ids).values_list('id', *changes)
+            for pk, *current in rows:
+                results[pk] = 'unchanged' if tuple(current) == tuple(changes.values()) else 'updated'
+
+            updated_ids = [pk for pk, outcome in results.items() if outcome == 'updated']
+            if updated_ids:
+                Form.objects.filter(pk__in=updated_ids).update(**changes, updated_at=timezone.now())
+                public_feed.invalidate_forms(updated_ids)
+
+        return Response({'action': target, 'updated': len(updated_ids), 'results': results})
+
 
 class PendingLookupViewSet(viewsets.ReadOnlyModelViewSet):
     """Admins can list and review pending lookups via admin; expose read-only view for transparency."""
@@ -410,6 +681,16 @@ class PendingLookupViewSet(viewsets.ReadOnlyModelViewSet):
         return super().list(request, *args, **kwargs)
 
 
+def application_queryset():
+    """Applications with only the form/applicant columns ApplicationSerializer reads, in one join."""
+    return Application.objects.select_related('form', 'applicant').only(
+        'id', 'form', 'applicant', 'cover_letter', 'cv_url', 'status', 'applied_at', 'updated_at',
+        'form__title', 'form__created_by',
+        'applicant__username', 'applicant__first_name', 'applicant__last_name',
+        'applicant__email', 'applicant__avatar',
+    )
+
+
 class ApplicationViewSet(viewsets.ModelViewSet):
     """
     Application (Đơn ứng tuyển) endpoints.
@@ -418,7 +699,9 @@ class ApplicationViewSet(viewsets.ModelViewSet):
     - Employers can: list applications for their jobs, update status
     - Admin can: view all
     """
-    
+
+    pagination_class = ApplicationCursorPagination
+
     def get_serializer_class(self):
         if self.action == 'create':
             return ApplicationCreateSerializer
@@ -439,36 +722,61 @@ class ApplicationViewSet(viewsets.ModelViewSet):
             return Application.objects.none()
         
         # Admin sees all
-        is_admin = user.is_staff or (hasattr(user, 'role') and user.role and user.role.code.upper() == 'ADMIN')
+        is_admin = user_is_admin(user)
         if is_admin:
-            return Application.objects.select_related('form', 'applicant').all()
+            return application_queryset()
         
         # If this user has created any forms, treat them as the job owner (employer)
-        try:
-            from .models import Form as JobFormModel
-            if JobFormModel.objects.filter(created_by=user).exists():
-                return Application.objects.select_related('form', 'applicant').filter(
-                    form__created_by=user
-                )
-        except Exception:
-            # fallback to role-based check if something goes wrong
-            pass
+        if user_is_employer(user):
+            return application_queryset().filter(
+                form__created_by=user
+            )
 
         # Job seeker sees their own applications
-        return Application.objects.select_related('form', 'applicant').filter(
+        return application_queryset().filter(
             applicant=user
         )
     
     def perform_create(self, serializer):
         serializer.save()
+
+    def perform_update(self, serializer):
+        with transaction.atomic():
+            old_form_id, old_status = (
+                Application.objects.select_for_update()
+                .values_list('form_id', 'status')
+                .get(pk=serializer.instance.pk)
+            )
+            instance = serializer.save()
+            if instance.form_id == old_form_id:
+                adjust_application_counters(old_form_id, old_status, instance.status)
+            else:
+                adjust_application_counters(old_form_id, old_status=old_status)
+                adjust_application_counters(instance.form_id, new_status=instance.status)
+
+    def perform_destroy(self, instance):
+        with transaction.atomic():
+            form_id, old_status = (
+                Application.objects.select_for_update().values_list('form_id', 'status').get(pk=instance.pk)
+            )
+            instance.delete()
+            adjust_application_counters(form_id, old_status=old_status)
+
+    def set_status(self, instance, new_status):
+        """Change one application's status and shift its job's counters in the same transaction."""
+        with transaction.atomic():
+            old_status = Application.objects.select_for_update().values_list('status', flat=True).get(pk=instance.pk)
+            instance.status = new_status
+            instance.save(update_fields=['status', 'updated_at'])
+            adjust_application_counters(instance.form_id, old_status, new_status)
     
     def update(self, request, *args, **kwargs):
         """Only employer (job owner) or admin can update status."""
         instance = self.get_object()
         user = request.user
         
-        is_admin = user.is_staff or (hasattr(user, 'role') and user.role and user.role.code.upper() == 'ADMIN')
-        is_job_owner = instance.form.created_by == user
+        is_admin = user_is_admin(user)
+        is_job_owner = instance.form.created_by_id == user.pk
         
         if not (is_admin or is_job_owner):
             return Response(
@@ -492,7 +800,7 @@ class ApplicationViewSet(viewsets.ModelViewSet):
         instance = self.get_object()
         user = request.user
         
-        is_admin = user.is_staff or (hasattr(user, 'role') and user.role and user.role.code.upper() == 'ADMIN')
+        is_admin = user_is_admin(user)
         is_applicant = instance.applicant == user
         
         if not (is_admin or is_applicant):
@@ -503,9 +811,20 @@ class ApplicationViewSet(viewsets.ModelViewSet):
         
         return super().destroy(request, *args, **kwargs)
     
+    @staticmethod
+    def filter_by_skills(applications, request):
+        """Keep applicants whose CV text contains every term of ``?skills=``."""
+        skills = request.query_params.get('skills', '').strip()
+        if not skills:
+            return applications
+        return applications.filter(applicant__profile__cv_text__in=matching_cv_texts(skills))
+
     @action(detail=False, methods=['get'], url_path='for-job/(?P<job_id>[^/.]+)')
     def for_job(self, request, job_id=None):
-        """Get all applications for a specific job (employer/admin only)."""
+        """Get all applications for a specific job (employer/admin only).
+
+        ``?skills=python django`` keeps applicants whose CV mentions every term.
+        """
         user = request.user
         
         try:
@@ -513,8 +832,8 @@ class ApplicationViewSet(viewsets.ModelViewSet):
         except Form.DoesNotExist:
             return Response({'detail': 'Job not found.'}, status=status.HTTP_404_NOT_FOUND)
         
-        is_admin = user.is_staff or (hasattr(user, 'role') and user.role and user.role.code.upper() == 'ADMIN')
-        is_job_owner = form.created_by == user
+        is_admin = user_is_admin(user)
+        is_job_owner = form.created_by_id == user.pk
         
         if not (is_admin or is_job_owner):
             return Response(
@@ -522,18 +841,123 @@ class ApplicationViewSet(viewsets.ModelViewSet):
                 status=status.HTTP_403_FORBIDDEN
             )
         
-        applications = Application.objects.select_related('applicant').filter(form=form)
+        applications = self.filter_by_skills(application_queryset().filter(form=form), request)
+        page = self.paginate_queryset(applications)
+        if page is not None:
+            serializer = ApplicationSerializer(page, many=True)
+            return self.get_paginated_response(serializer.data)
         serializer = ApplicationSerializer(applications, many=True)
         return Response(serializer.data)
     
+    @action(detail=False, methods=['get'])
+    def inbox(self, request):
+        """Applications to all of the current user's jobs, newest first, with counts per job.
+
+        Filters: ``?status=pending|approved|rejected``, ``?job=<form id>``,
+        ``?applicant_status=<status code>`` and ``?skills=<terms>`` (searched in
+        the applicants' CV text). ``counts`` and ``jobs`` ignore the
+        ``status``/``job`` filters so every tab can show its total.
+        """
+        applications = Application.objects.filter(form__created_by_id=request.user.pk)
+        applications = self.filter_by_skills(applications, request)
+
+        applicant_status = request.query_params.get('applicant_status')
+        if applicant_status:
+            applications = applications.filter(applicant__status_id=applicant_status)
+
+        counts = {'total': 0, **{code: 0 for code, _ in Application.STATUS_CHOICES}}
+        jobs = {}
+        grouped = applications.values('form_id', 'form__title', 'status').annotate(count=Count('id')).order_by()
+        for row in grouped:
+            job = jobs.setdefault(row['form_id'], {
+                'job_id': row['form_id'],
+                'job_title': row['form__title'],
+                'total': 0,
+                **{code: 0 for code, _ in Application.STATUS_CHOICES},
+            })
+            job[row['status']] = job.get(row['status'], 0) + row['count']
+            job['total'] += row['count']
+            counts[row['status']] = counts.get(row['status'], 0) + row['count']
+            counts['total'] += row['count']
+
+        status_filter = request.query_params.get('status')
+        if status_filter:
+            if status_filter not in counts or status_filter == 'total':
+                return Response({'detail': 'Invalid status.'}, status=status.HTTP_400_BAD_REQUEST)
+            applications = applications.filter(status=status_filter)
+        job_filter = request.query_params.get('job')
+        if job_filter:
+            if not job_filter.isdigit():
+                return Response({'detail': 'Invalid job id.'}, status=status.HTTP_400_BAD_REQUEST)
+            applications = applications.filter(form_id=int(job_filter))
+
+        rows = ApplicationInboxSerializer.project(applications)
+        summary = {'counts': counts, 'jobs': sorted(jobs.values(), key=lambda job: -job['job_id'])}
+        page = self.paginate_queryset(rows)
+        if page is not None:
+            response = self.get_paginated_response(ApplicationInboxSerializer(page, many=True).data)
+            response.data.update(summary)
+            return response
+        return Response({
+            'next': None,
+            'previous': None,
+            'results': ApplicationInboxSerializer(rows, many=True).data,
+            **summary,
+        })
+
+    @action(detail=False, methods=['post'], url_path='bulk-status')
+    def bulk_status(self, request):
+        """Move many applications to one status: ``{"ids": [...], "status": "approved"}``.
+
+        Ownership is checked for all ids in one query and the change is a
+        single UPDATE. ``results`` maps each id to ``updated``, ``unchanged``,
+        ``forbidden`` or ``not_found``.
+        """
+        new_status = request.data.get('status')
+        if not isinstance(new_status, str) or new_status not in dict(Application.STATUS_CHOICES):
+            return Response({'detail': 'Invalid status.'}, status=status.HTTP_400_BAD_REQUEST)
+        ids = parse_bulk_ids(request.data)
+        if ids is None:
+            return Response(
+                {'detail': f'ids must be a list of 1-{BULK_MAX_IDS} application ids.'},
+                status=status.HTTP_400_BAD_REQUEST,
+            )
+
+        user = request.user
+        is_admin = user_is_admin(user)
+        results = dict.fromkeys(ids, 'not_found')
+        moved = {}  # (form_id, old status) -> count
+        with transaction.atomic():
+            rows = (
+                Application.objects.select_for_update(of=('self',))
+                .filter(pk__in=ids)
+                .values_list('id', 'form_id', 'status', 'form__created_by_id')
+            )
+            for pk, form_id, old_status, owner_id in rows:
+                if not (is_admin or owner_id == user.pk):
+                    results[pk] = 'forbidden'
+                elif old_status == new_status:
+                    results[pk] = 'unchanged'
+                else:
+                    results[pk] = 'updated'
+                    moved[form_id, old_status] = moved.get((form_id, old_status), 0) + 1
+
+            updated_ids = [pk for pk, outcome in results.items() if outcome == 'updated']
+            if updated_ids:
+                Application.objects.filter(pk__in=updated_ids).update(status=new_status, updated_at=timezone.now())
+                for (form_id, old_status), count in moved.items():
+                    adjust_application_counters(form_id, old_status, new_status, count=count)
+
+        return Response({'status': new_status, 'updated': len(updated_ids), 'results': results})
+
     @action(detail=True, methods=['post'], url_path='approve')
     def approve(self, request, pk=None):
         """Employer/admin action to approve an application."""
         instance = self.get_object()
         user = request.user
         
-        is_admin = user.is_staff or (hasattr(user, 'role') and user.role and user.role.code.upper() == 'ADMIN')
-        is_job_owner = instance.form.created_by == user
+        is_admin = user_is_admin(user)
+        is_job_owner = instance.form.created_by_id == user.pk
         
         if not (is_admin or is_job_owner):
             return Response(
@@ -541,8 +965,7 @@ class ApplicationViewSet(viewsets.ModelViewSet):
                 status=status.HTTP_403_FORBIDDEN
             )
         
-        instance.status = 'approved'
-        instance.save()
+        self.set_status(instance, 'approved')
         return Response(ApplicationSerializer(instance).data)
     
     @action(detail=True, methods=['post'], url_path='reject')
@@ -551,8 +974,8 @@ class ApplicationViewSet(viewsets.ModelViewSet):
         instance = self.get_object()
         user = request.user
         
-        is_admin = user.is_staff or (hasattr(user, 'role') and user.role and user.role.code.upper() == 'ADMIN')
-        is_job_owner = instance.form.created_by == user
+        is_admin = user_is_admin(user)
+        is_job_owner = instance.form.created_by_id == user.pk
         
         if not (is_admin or is_job_owner):
             return Response(
@@ -560,6 +983,25 @@ class ApplicationViewSet(viewsets.ModelViewSet):
                 status=status.HTTP_403_FORBIDDEN
             )
         
-        instance.status = 'rejected'
-        instance.save()
+        self.set_status(instance, 'rejected')
         return Response(ApplicationSerializer(instance).data)
+
+
+class StatsView(APIView):
+    """Admin dashboard counters: jobs, applications and users by status, plus a posting timeline.
+
+    ``?bucket=day|week|month`` picks the timeline granularity (default: day).
+    """
+    permission_classes = [permissions.IsAuthenticated]
+
+    def get(self, request):
+        if not user_is_admin(request.user):
+            return Response({'detail': 'Only admins can view statistics.'}, status=status.HTTP_403_FORBIDDEN)
+
+        bucket = request.query_params.get('bucket', DEFAULT_BUCKET)
+        if bucket not in BUCKETS:
+            return Response(
+                {'detail': 'bucket must be one of: %s.' % ', '.join(BUCKETS)},
+                status=status.HTTP_400_BAD_REQUEST,
+            )
+        return Response(get_stats(bucket))
@@ -10,6 +10,11 @@ Cách dùng:
     python load_fixtures.py --district      # Chỉ load district lookups
     python load_fixtures.py --ward          # Chỉ load ward lookups
     python load_fixtures.py --users --basic # Load nhiều fixtures
+    python load_fixtures.py --force         # Load lại kể cả file không đổi
+
+Mỗi file được stream và ghi bằng bulk_create theo lô (jobfinder/fixture_loader.py).
+File có nội dung (SHA-256) không đổi so với lần load trước sẽ được bỏ qua;
+dùng --force để load lại.
 
 Fixtures bao gồm:
 - users_lookups.json: Role, Status, Gender
@@ -25,31 +30,38 @@ import django
 os.environ.setdefault('DJANGO_SETTINGS_MODULE', 'main.settings')
 django.setup()
 
-from django.core.management import call_command
+from jobfinder.fixture_loader import load_fixture_file, BATCH_SIZE
+
+# Đường dẫn tính từ thư mục chứa script (backend/), không phụ thuộc thư mục hiện tại
+BASE_DIR = os.path.dirname(os.path.abspath(__file__))
 
 # Định nghĩa tất cả fixtures
 ALL_FIXTURES = {
-    'users': ('backend/users/fixtures/users_lookups.json', 'Users lookups (Role, Status, Gender)'),
-    'basic': ('backend/jobfinder/fixtures/01_lookups_basic.json', 'Basic lookups (Company, WorkFormat, JobType, Currency, AdministrativeUnit)'),
-    'province': ('backend/jobfinder/fixtures/02_lookups_province.json', 'Province lookups'),
-    'district': ('backend/jobfinder/fixtures/03_lookups_district.json', 'District lookups'),
-    'ward1': ('backend/jobfinder/fixtures/04_lookups_ward_part1.json', 'Ward lookups (Part 1/3)'),
-    'ward2': ('backend/jobfinder/fixtures/04_lookups_ward_part2.json', 'Ward lookups (Part 2/3)'),
-    'ward3': ('backend/jobfinder/fixtures/04_lookups_ward_part3.json', 'Ward lookups (Part 3/3)'),
+    'users': ('users/fixtures/users_lookups.json', 'Users lookups (Role, Status, Gender)'),
+    'basic': ('jobfinder/fixtures/01_lookups_basic.json', 'Basic lookups (Company, WorkFormat, JobType, Currency, AdministrativeUnit)'),
+    'province': ('jobfinder/fixtures/02_lookups_province.json', 'Province lookups'),
+    'district': ('jobfinder/fixtures/03_lookups_district.json', 'District lookups'),
+    'ward1': ('jobfinder/fixtures/04_lookups_ward_part1.json', 'Ward lookups (Part 1/3)'),
+    'ward2': ('jobfinder/fixtures/04_lookups_ward_part2.json', 'Ward lookups (Part 2/3)'),
+    'ward3': ('jobfinder/fixtures/04_lookups_ward_part3.json', 'Ward lookups (Part 3/3)'),
 }
 
 # Thứ tự load fixtures (quan trọng vì có foreign key dependencies)
 LOAD_ORDER = ['users', 'basic', 'province', 'district', 'ward1', 'ward2', 'ward3']
 
 
-def load_fixture(key):
+def load_fixture(key, force=False, batch_size=BATCH_SIZE):
     """Load một fixture theo key"""
-    fixture_path, description = ALL_FIXTURES[key]
+    relative_path, description = ALL_FIXTURES[key]
+    fixture_path = os.path.join(BASE_DIR, relative_path)
     if os.path.exists(fixture_path):
         print(f"\n-> Loading: {description}")
         try:
-            call_command('loaddata', fixture_path, verbosity=1)
-            print(f"  [OK] Success!")
+            loaded, count = load_fixture_file(fixture_path, batch_size=batch_size, force=force)
+            if loaded:
+                print(f"  [OK] Installed {count} object(s)")
+            else:
+                print(f"  [SKIP] Unchanged since last load ({count} object(s))")
             return True
         except Exception as e:
             print(f"  [ERROR] {e}")
@@ -59,7 +71,7 @@ def load_fixture(key):
         return False
 
 
-def load_fixtures(selected_keys=None):
+def load_fixtures(selected_keys=None, force=False, batch_size=BATCH_SIZE):
     """Load fixtures theo danh sách keys, hoặc tất cả nếu không chỉ định"""
     print("=" * 50)
     print("Loading lookup data fixtures...")
@@ -74,7 +86,7 @@ def load_fixtures(selected_keys=None):
     
     success_count = 0
     for key in keys_to_load:
-        if load_fixture(key):
+        if load_fixture(key, force=force, batch_size=batch_size):
             success_count += 1
     
     print("\n" + "=" * 50)
@@ -91,6 +103,7 @@ Ví dụ:
   python load_fixtures.py                 # Load tất cả
   python load_fixtures.py --users --basic # Load users và basic
   python load_fixtures.py --ward          # Load tất cả ward parts
+  python load_fixtures.py --force         # Load lại tất cả, bỏ qua kiểm tra hash
         """
     )
     
@@ -106,6 +119,10 @@ Ví dụ:
                         help='Load district lookups')
     parser.add_argument('--ward', action='store_true', 
                         help='Load tất cả ward lookups (3 parts)')
+    parser.add_argument('--force', action='store_true',
+                        help='Load lại kể cả khi nội dung file không đổi')
+    parser.add_argument('--batch-size', type=int, default=BATCH_SIZE,
+                        help=f'Số bản ghi mỗi lệnh INSERT (mặc định {BATCH_SIZE})')
     
     args = parser.parse_args()
     
@@ -125,9 +142,9 @@ Ví dụ:
     
     # Nếu không có option nào hoặc --all thì load tất cả
     if args.all or not selected:
-        load_fixtures(None)
+        load_fixtures(None, force=args.force, batch_size=args.batch_size)
     else:
-        load_fixtures(selected)
+        load_fixtures(selected, force=args.force, batch_size=args.batch_size)
 
 
 if __name__ == '__main__':
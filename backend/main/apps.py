@@ -0,0 +1,8 @@
+from django.apps import AppConfig
+
+class MainConfig(AppConfig):
+    name = 'main'
+
+    def ready(self):
+        # register system checks
+        from . import checks  # noqa: F401
@@ -0,0 +1,37 @@
+from django.conf import settings
+from django.core.checks import Warning, register
+
+# Backends whose data lives inside one process
+PROCESS_LOCAL_CACHES = (
+    'django.core.cache.backends.locmem.LocMemCache',
+    'django.core.cache.backends.dummy.DummyCache',
+)
+DATABASE_CACHE = 'django.core.cache.backends.db.DatabaseCache'
+
+
+@register('caches')
+def check_shared_cache(app_configs, **kwargs):
+    """Versions, the job feed and token revocation need a fast cache shared by all workers."""
+    backend = settings.CACHES.get('default', {}).get('BACKEND')
+    if settings.DEBUG:
+        # runserver is a single process
+        return []
+    if backend in PROCESS_LOCAL_CACHES:
+        return [Warning(
+            f'The default cache ({backend}) is not shared between worker processes.',
+            hint=(
+                'Lookup lists, the location snapshot and the job feed go stale in other workers, '
+                'and revoked access tokens keep working there. Set REDIS_URL.'
+            ),
+            id='main.W001',
+        )]
+    if backend == DATABASE_CACHE:
+        return [Warning(
+            'The default cache is the database cache table.',
+            hint=(
+                'Every cache read is a query: the token revocation check on each authenticated '
+                'request and every job feed hit go to the database. Set REDIS_URL.'
+            ),
+            id='main.W002',
+        )]
+    return []
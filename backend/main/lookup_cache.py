@@ -0,0 +1,121 @@
+"""
+Versioned cache for the small lookup tables (roles, statuses, job types, ...).
+
+Each lookup model has a version number in the shared Django cache. Any write
+bumps it (model post_save/post_delete signals and
+LookupViewSetMixin.update_order), which retires the per-process copy and the
+shared copy of the list at once. List responses carry a strong ETag derived
+from the version, so clients revalidating with If-None-Match get a 304
+without the database being touched.
+"""
+import time
+
+from django.core.cache import cache
+from django.db import transaction
+from django.utils.cache import patch_cache_control
+from django.utils.http import parse_etags
+from rest_framework import status
+from rest_framework.response import Response
+
+VERSION_KEY = 'lookup:version:{label}'
+DATA_KEY = 'lookup:data:{label}:{version}'
+DATA_TIMEOUT = 24 * 60 * 60
+# Versions only need to outlive the entries keyed by them; a lost version is
+# re-seeded from the clock, which retires those entries
+VERSION_TIMEOUT = 7 * 24 * 60 * 60
+
+# label -> (version, data); per worker process
+_local = {}
+
+
+def _label(model):
+    return model._meta.label_lower
+
+
+def _seed():
+    # Clock-based start so a flushed cache never hands out an old version again
+    return int(time.time() * 1000)
+
+
+def get_versions(keys):
+    """Current value of each version key in ``keys``, seeding missing ones."""
+    versions = cache.get_many(keys)
+    for key in keys:
+        if versions.get(key) is None:
+            cache.add(key, _seed(), VERSION_TIMEOUT)
+            versions[key] = cache.get(key)
+    return versions
+
+
+def bump_versions(keys):
+    """Move each version key in ``keys`` on once the current transaction commits."""
+
+    def bump():
+        for key in keys:
+            try:
+                cache.incr(key)
+                cache.touch(key, VERSION_TIMEOUT)
+            except ValueError:
+                cache.set(key, _seed(), VERSION_TIMEOUT)
+
+    transaction.on_commit(bump)
+
+
+def get_version(model):
+    key = VERSION_KEY.format(label=_label(model))
+    return get_versions([key])[key]
+
+
+def bump_version(model):
+    """Invalidate the cached list of ``model`` once the current transaction commits."""
+    bump_versions([VERSION_KEY.format(label=_label(model))])
+
+
+def etag_matches(request, etag):
+    """Whether If-None-Match names ``etag``, compared weakly.
+
+    CompressionMiddleware sends compressed bodies with a weak ``W/`` ETag,
+    which clients then send back.
+    """
+    if_none_match = parse_etags(request.headers.get('If-None-Match', ''))
+    return '*' in if_none_match or etag in [tag.removeprefix('W/') for tag in if_none_match]
+
+
+def get_cached_list(model, build):
+    """Return ``(version, data)`` for ``model``, calling ``build()`` only on a miss."""
+    label = _label(model)
+    version = get_version(model)
+    local = _local.get(label)
+    if local is not None and local[0] == version:
+        return version, local[1]
+
+    data_key = DATA_KEY.format(label=label, version=version)
+    data = cache.get(data_key)
+    if data is None:
+        data = build()
+        cache.set(data_key, data, DATA_TIMEOUT)
+    _local[label] = (version, data)
+    return version, data
+
+
+class CachedLookupListMixin:
+    """Serve ``list`` from the versioned lookup cache with ETag revalidation."""
+
+    def list(self, request, *args, **kwargs):
+        model = self.get_queryset().model
+
+        def build():
+            serializer = self.get_serializer(self.get_queryset(), many=True)
+            return [dict(item) for item in serializer.data]
+
+        version, data = get_cached_list(model, build)
+        etag = f'"{_label(model)}-{version}-{request.accepted_renderer.format}"'
+
+        if etag_matches(request, etag):
+            response = Response(status=status.HTTP_304_NOT_MODIFIED)
+        else:
+            response = Response(data)
+        response['ETag'] = etag
+        # Let clients keep the body but always revalidate
+        patch_cache_control(response, no_cache=True)
+        return response
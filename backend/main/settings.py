@@ -12,6 +12,7 @@ https://docs.djangoproject.com/en/5.2/ref/settings/
 
 from pathlib import Path
 import os
+import tempfile
 from dotenv import load_dotenv
 load_dotenv()
 
@@ -47,7 +48,7 @@ INSTALLED_APPS = [
     'rest_framework',
 
     # Project main
-    'main', 'jobfinder',
+    'main', 'jobfinder.apps.JobfinderConfig',
 
     # Users (use AppConfig path to register custom user model)
     'users.apps.UsersConfig',
@@ -58,6 +59,8 @@ MIDDLEWARE = [
     'corsheaders.middleware.CorsMiddleware',
     'django.middleware.security.SecurityMiddleware',
     'whitenoise.middleware.WhiteNoiseMiddleware',  # Serve static files in production
+    # Below WhiteNoise so static files keep their precompressed copies
+    'main.middleware.CompressionMiddleware',
     'django.contrib.sessions.middleware.SessionMiddleware',
     'django.middleware.common.CommonMiddleware',
     'django.middleware.csrf.CsrfViewMiddleware',
@@ -124,6 +127,44 @@ else:
         }
 
 
+# Cache
+# Shared cache used for versioned lookup data, the location snapshot, the job
+# feed and access-token revocation, so it must be shared by every worker
+# process. Deployments should point REDIS_URL at a Redis instance (the
+# `redis` package is in requirements.txt): cache reads then never touch the
+# database. Without it, DEBUG (a single runserver process) keeps an in-memory
+# cache, and anything else falls back to the database cache table
+# (`python manage.py createcachetable`, run by the release step), which is
+# shared but costs one query per cache read (see the main.W002 check).
+
+REDIS_URL = os.getenv('REDIS_URL')
+
+if REDIS_URL:
+    CACHES = {
+        'default': {
+            'BACKEND': 'django.core.cache.backends.redis.RedisCache',
+            'LOCATION': REDIS_URL,
+        }
+    }
+elif DEBUG:
+    CACHES = {
+        'default': {
+            'BACKEND': 'django.core.cache.backends.locmem.LocMemCache',
+        }
+    }
+else:
+    CACHES = {
+        'default': {
+            'BACKEND': 'django.core.cache.backends.db.DatabaseCache',
+            'LOCATION': 'django_cache',
+            'OPTIONS': {
+                # Culling past the limit could drop version and revocation keys
+                'MAX_ENTRIES': int(os.getenv('CACHE_MAX_ENTRIES', '50000')),
+            },
+        }
+    }
+
+
 # Password validation
 # https://docs.djangoproject.com/en/5.2/ref/settings/#auth-password-validators
 
@@ -172,6 +213,19 @@ cloudinary.config(
 )
 
 
+# Avatar/CV uploads (users/uploads.py)
+# Files are spooled to UPLOAD_SPOOL_DIR and pushed to storage by a pool of
+# UPLOAD_WORKERS threads (0 runs them inside the request). Set UPLOAD_STORAGE
+# to 'users.uploads.LocalFileStorage' to keep files under MEDIA_ROOT instead
+# of Cloudinary; they are then linked as UPLOAD_PUBLIC_URL + MEDIA_URL.
+UPLOAD_STORAGE = os.getenv('UPLOAD_STORAGE', 'users.uploads.CloudinaryStorage')
+UPLOAD_WORKERS = int(os.getenv('UPLOAD_WORKERS', '4'))
+UPLOAD_SPOOL_DIR = os.getenv('UPLOAD_SPOOL_DIR', os.path.join(tempfile.gettempdir(), 'jobfinder-uploads'))
+UPLOAD_PUBLIC_URL = os.getenv('UPLOAD_PUBLIC_URL', 'http://localhost:8000')
+MEDIA_URL = '/media/'
+MEDIA_ROOT = BASE_DIR / 'media'
+
+
 # Default primary key field type
 # https://docs.djangoproject.com/en/5.2/ref/settings/#default-auto-field
 
@@ -182,10 +236,20 @@ AUTH_USER_MODEL = 'users.CustomUser'
 
 REST_FRAMEWORK = {
     'DEFAULT_AUTHENTICATION_CLASSES': (
-        'rest_framework_simplejwt.authentication.JWTAuthentication',
+        # Authenticates from the role/status/staff token claims, loading the
+        # user row only when a view needs it (users/authentication.py)
+        'users.authentication.StatelessJWTAuthentication',
+    ),
+    'DEFAULT_RENDERER_CLASSES': (
+        # orjson-backed, same output as DRF's JSONRenderer (main/renderers.py)
+        'main.renderers.ORJSONRenderer',
+        'rest_framework.renderers.BrowsableAPIRenderer',
     ),
 }
 
+# Response compression (main/middleware.py): smaller bodies are sent as is
+COMPRESSION_MIN_SIZE = int(os.getenv('COMPRESSION_MIN_SIZE', '1024'))
+
 
 CORS_ALLOW_ALL_ORIGINS = True
 # Optionally expose Authorization header and ensure common headers are allowed
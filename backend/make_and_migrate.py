@@ -25,6 +25,9 @@ print("=" * 50)
 
 call_command('migrate', verbosity=1)
 
+# Bảng cache dùng chung khi không có REDIS_URL
+call_command('createcachetable', verbosity=1)
+
 print("\n" + "=" * 50)
 print("Done!")
 print("=" * 50)
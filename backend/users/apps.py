@@ -5,9 +5,7 @@ class UsersConfig(AppConfig):
     name = 'users'
 
     def ready(self):
-        # import signals to register post_migrate handlers
-        try:
-            import users.signals  # noqa: F401
-        except Exception:
-            # Avoid breaking manage.py commands if imports fail
-            pass
+        # import signals to register post_migrate handlers and token
+        # revocation; an import error must fail loudly instead of silently
+        # disabling them
+        import users.signals  # noqa: F401
@@ -0,0 +1,212 @@
+"""
+Authentication with role/employer capabilities resolved up front.
+
+Views used to work out "is this user an admin / a job poster?" on their own,
+each time touching ``user.role`` (a lazy query) and, for employers, running
+an extra ``Form.objects.filter(created_by=user).exists()``. The
+authentication class below loads the user with ``role`` and ``status``
+joined and the employer flag annotated, all in one query, and the helpers
+read those flags instead of querying again.
+
+``StatelessJWTAuthentication`` goes one step further: the role code, status
+code and staff flag travel in the access token, so most requests are
+authenticated without touching the database at all. The CustomUser row is
+loaded lazily, only when a view uses something the claims do not carry.
+The checks that need the row (blocking statuses set by an admin,
+``is_active``, password changes behind ``CHECK_REVOKE_TOKEN``) are enforced
+through a short-lived revocation entry in the shared cache instead (see
+``revoke_user_tokens`` and users/signals.py).
+"""
+import time
+
+from django.apps import apps
+from django.core.cache import cache
+from django.db import transaction
+from django.db.models import Exists, OuterRef
+from django.utils.functional import SimpleLazyObject
+from django.utils.translation import gettext_lazy as _
+from rest_framework_simplejwt.authentication import JWTAuthentication
+from rest_framework_simplejwt.exceptions import AuthenticationFailed, InvalidToken
+from rest_framework_simplejwt.settings import api_settings
+from rest_framework_simplejwt.utils import get_md5_hash_password
+
+from .models import CustomUser
+
+ADMIN_ROLE = 'ADMIN'
+
+# Statuses that may not log in or keep using a session
+BLOCKED_STATUS_MESSAGES = {
+    # BANNED: admin-side, khoá vĩnh viễn - không thể đăng nhập
+    'BANNED': 'Tài khoản của bạn đã bị khoá vĩnh viễn. Vui lòng liên hệ hỗ trợ.',
+    # SUSPENDED: admin-side, tạm ngưng (nhập sai mật khẩu quá nhiều lần) - không thể đăng nhập
+    'SUSPENDED': 'Tài khoản của bạn đang bị tạm ngưng do nhập sai mật khẩu quá nhiều lần. Vui lòng liên hệ hỗ trợ.',
+}
+
+ROLE_CLAIM = 'role'
+STATUS_CLAIM = 'status'
+STAFF_CLAIM = 'is_staff'
+# Issue time in milliseconds: ``iat`` has whole seconds, too coarse to tell a
+# login right after a password change from a token issued just before it
+ISSUED_MS_CLAIM = 'iat_ms'
+
+REVOKED_KEY = 'auth:revoked-ms:{user_id}'
+
+
+def user_with_capabilities():
+    """CustomUser queryset with role/status joined and the employer flag annotated."""
+    Form = apps.get_model('jobfinder', 'Form')
+    return CustomUser.objects.select_related('role', 'status').annotate(
+        has_posted_jobs=Exists(Form.objects.filter(created_by=OuterRef('pk')))
+    )
+
+
+def user_is_admin(user):
+    """Staff users and users with the ADMIN role."""
+    if not user or not user.is_authenticated:
+        return False
+    # role is keyed by code, so role_id holds the code without a join
+    return bool(user.is_staff or (getattr(user, 'role_id', None) or '').upper() == ADMIN_ROLE)
+
+
+def user_is_employer(user):
+    """Users who have posted at least one job."""
+    if not user or not user.is_authenticated:
+        return False
+    flag = getattr(user, 'has_posted_jobs', None)
+    if flag is None:
+        # Not loaded through RoleAwareJWTAuthentication (e.g. session auth); resolve once
+        Form = apps.get_model('jobfinder', 'Form')
+        flag = user.has_posted_jobs = Form.objects.filter(created_by=user).exists()
+    return flag
+
+
+class RoleAwareJWTAuthentication(JWTAuthentication):
+    """JWTAuthentication that loads the user through ``user_with_capabilities()``."""
+
+    def get_user(self, validated_token):
+        try:
+            user_id = validated_token[api_settings.USER_ID_CLAIM]
+        except KeyError as e:
+            raise InvalidToken(_('Token contained no recognizable user identification')) from e
+
+        try:
+            user = user_with_capabilities().get(**{api_settings.USER_ID_FIELD: user_id})
+        except CustomUser.DoesNotExist as e:
+            raise AuthenticationFailed(_('User not found'), code='user_not_found') from e
+
+        if api_settings.CHECK_USER_IS_ACTIVE and not user.is_active:
+            raise AuthenticationFailed(_('User is inactive'), code='user_inactive')
+
+        if api_settings.CHECK_REVOKE_TOKEN:
+            if validated_token.get(api_settings.REVOKE_TOKEN_CLAIM) != get_md5_hash_password(user.password):
+                raise AuthenticationFailed(_("The user's password has been changed."), code='password_changed')
+
+        return user
+
+
+def blocked_status_message(user):
+    """Return the login error for a BANNED/SUSPENDED user, or None."""
+    return BLOCKED_STATUS_MESSAGES.get((getattr(user, 'status_id', None) or '').upper())
+
+
+def set_user_claims(token, user):
+    """Copy the claims read by StatelessJWTAuthentication onto ``token``."""
+    token[ROLE_CLAIM] = user.role_id
+    token[STATUS_CLAIM] = user.status_id
+    token[STAFF_CLAIM] = bool(user.is_staff)
+    token[ISSUED_MS_CLAIM] = _now_ms()
+    return token
+
+
+def _now_ms():
+    return int(time.time() * 1000)
+
+
+def revoke_user_tokens(user):
+    """Reject the user's already issued access tokens once the transaction commits.
+
+    Access tokens are short-lived and refreshing re-checks the status in the
+    database, so the entry only has to outlive the current access tokens.
+    """
+    key = REVOKED_KEY.format(user_id=user.pk)
+    timeout = int(api_settings.ACCESS_TOKEN_LIFETIME.total_seconds())
+    transaction.on_commit(lambda: cache.set(key, _now_ms(), timeout))
+
+
+def _load_user(user_id):
+    try:
+        return user_with_capabilities().get(**{api_settings.USER_ID_FIELD: user_id})
+    except CustomUser.DoesNotExist as e:
+        raise AuthenticationFailed(_('User not found'), code='user_not_found') from e
+
+
+class TokenClaimsUser(SimpleLazyObject):
+    """Request user answered from token claims, backed by a lazily loaded CustomUser.
+
+    ``pk``, ``role_id``, ``status_id``, ``is_staff`` and the authentication
+    flags come from the token; any other attribute (and isinstance checks,
+    e.g. assigning it to a ForeignKey) loads the row once.
+    """
+
+    def __init__(self, validated_token):
+        # The claim is serialized as a string; compare like the model's primary key
+        user_id = CustomUser._meta.get_field(api_settings.USER_ID_FIELD).to_python(
+            validated_token[api_settings.USER_ID_CLAIM]
+        )
+        super().__init__(lambda: _load_user(user_id))
+        self.__dict__['token'] = validated_token
+        self.__dict__['claims_user_id'] = user_id
+
+    @property
+    def pk(self):
+        return self.claims_user_id
+
+    id = pk
+
+    @property
+    def role_id(self):
+        return self.token.get(ROLE_CLAIM)
+
+    @property
+    def status_id(self):
+        return self.token.get(STATUS_CLAIM)
+
+    @property
+    def is_staff(self):
+        return bool(self.token.get(STAFF_CLAIM))
+
+    @property
+    def is_authenticated(self):
+        return True
+
+    @property
+    def is_anonymous(self):
+        return False
+
+    def __bool__(self):
+        # ``request.user and ...`` in permission classes must not load the row
+        return True
+
+
+class StatelessJWTAuthentication(RoleAwareJWTAuthentication):
+    """Authenticate from the token claims without a database query.
+
+    Tokens issued before the claims existed fall back to loading the user
+    through RoleAwareJWTAuthentication.
+    """
+
+    def get_user(self, validated_token):
+        try:
+            user_id = validated_token[api_settings.USER_ID_CLAIM]
+        except KeyError as e:
+            raise InvalidToken(_('Token contained no recognizable user identification')) from e
+
+        revoked_at = cache.get(REVOKED_KEY.format(user_id=user_id))
+        # Without the claim, assume the latest time within the iat second
+        issued_at = validated_token.get(ISSUED_MS_CLAIM, validated_token.get('iat', 0) * 1000 + 999)
+        if revoked_at is not None and issued_at <= revoked_at:
+            raise AuthenticationFailed(_('Token has been revoked'), code='token_revoked')
+
+        if ROLE_CLAIM not in validated_token or STATUS_CLAIM not in validated_token:
+            return super().get_user(validated_token)
+        return TokenClaimsUser(validated_token)
@@ -0,0 +1,182 @@
+"""
+Text extracted from uploaded CVs, indexed so employers can filter applicants by skills.
+
+Extraction runs once per file content: ``CVText`` rows are keyed by the
+SHA-256 of the file, so uploading the same CV again (or the same file from
+another account) only links the existing row to the profile. Profiles point
+at their current CV's text through ``Profile.cv_text``.
+
+``CVText.search_document`` holds the diacritic-folded text and is indexed
+like the job search (see jobfinder/search.py): a GIN index on PostgreSQL and
+the FTS5 table ``users_cvtext_fts`` on SQLite, both created by migration
+0009. The rows never change after they are written, so the FTS table only
+receives inserts.
+
+Formats:
+
+- DOCX: ``word/document.xml`` read with the standard library;
+- PDF: needs the ``pypdf`` package; without it PDFs are stored unindexed;
+- DOC (Word 97-2003): best effort, the text runs found in the binary file.
+"""
+import hashlib
+import io
+import logging
+import re
+import urllib.request
+import zipfile
+from xml.etree import ElementTree
+
+from django.db import DatabaseError, IntegrityError, connection, transaction
+from django.db.models.expressions import RawSQL
+
+from jobfinder.search import fold_text, query_terms
+
+from .models import CVText, Profile
+
+try:
+    from pypdf import PdfReader
+except ImportError:  # optional dependency
+    PdfReader = None
+
+logger = logging.getLogger(__name__)
+
+SQLITE_FTS_TABLE = 'users_cvtext_fts'
+
+# Enough for any real CV; keeps a pathological file from bloating the index
+MAX_TEXT_CHARS = 100_000
+DOWNLOAD_TIMEOUT = 30
+
+_WORD_NS = '{http://schemas.openxmlformats.org/wordprocessingml/2006/main}'
+# Text runs in a .doc file: UTF-16LE (as Word writes Unicode text) or 8-bit
+_DOC_UTF16_RUN = re.compile(rb'(?:[\x20-\x7e\xa0-\xff][\x00]|[\x00-\xff][\x01-\x1f]){4,}')
+_DOC_BYTE_RUN = re.compile(rb'[\x20-\x7e]{6,}')
+
+
+def extract_docx(data):
+    with zipfile.ZipFile(io.BytesIO(data)) as archive:
+        root = ElementTree.fromstring(archive.read('word/document.xml'))
+    paragraphs = []
+    for paragraph in root.iter(f'{_WORD_NS}p'):
+        paragraphs.append(''.join(node.text or '' for node in paragraph.iter(f'{_WORD_NS}t')))
+    return '\n'.join(p for p in paragraphs if p)
+
+
+def extract_pdf(data):
+    if PdfReader is None:
+        logger.info('pypdf is not installed; PDF CV text is not extracted')
+        return ''
+    reader = PdfReader(io.BytesIO(data))
+    return '\n'.join(page.extract_text() or '' for page in reader.pages)
+
+
+def extract_doc(data):
+    runs = [match.decode('utf-16le', errors='ignore') for match in _DOC_UTF16_RUN.findall(data)]
+    if not runs:
+        runs = [match.decode('latin-1') for match in _DOC_BYTE_RUN.findall(data)]
+    return '\n'.join(runs)
+
+
+def extract_text(data):
+    """Plain text of a PDF/DOCX/DOC file, chosen by its leading bytes."""
+    if data.startswith(b'%PDF-'):
+        extractor = extract_pdf
+    elif data.startswith(b'PK\x03\x04'):
+        extractor = extract_docx
+    elif data.startswith(b'\xd0\xcf\x11\xe0\xa1\xb1\x1a\xe1'):
+        extractor = extract_doc
+    else:
+        return ''
+    try:
+        return extractor(data)[:MAX_TEXT_CHARS]
+    except Exception:
+        logger.exception('Could not extract CV text')
+        return ''
+
+
+def get_or_extract(data):
+    """Return the CVText for ``data``, extracting it only the first time this content is seen."""
+    sha256 = hashlib.sha256(data).hexdigest()
+    cv_text = CVText.objects.filter(sha256=sha256).first()
+    if cv_text is not None:
+        return cv_text
+
+    text = extract_text(data)
+    try:
+        with transaction.atomic():
+            cv_text = CVText.objects.create(sha256=sha256, text=text, search_document=fold_text(text))
+            _add_to_sqlite_index(cv_text)
+    except IntegrityError:
+        # Extracted concurrently by another worker
+        cv_text = CVText.objects.get(sha256=sha256)
+    return cv_text
+
+
+def _add_to_sqlite_index(cv_text):
+    if connection.vendor != 'sqlite':
+        return
+    try:
+        with connection.cursor() as cursor:
+            cursor.execute(
+                f'INSERT INTO {SQLITE_FTS_TABLE}(rowid, search_document) VALUES (%s, %s)',
+                [cv_text.pk, cv_text.search_document],
+            )
+    except DatabaseError:
+        # No FTS5 table on this database; search uses the fallback
+        pass
+
+
+def read_cv(url, path=None, max_size=None):
+    """Bytes of a CV: from the local ``path`` when given, otherwise downloaded from ``url``."""
+    if path:
+        with open(path, 'rb') as fp:
+            return fp.read()
+    with urllib.request.urlopen(url, timeout=DOWNLOAD_TIMEOUT) as response:
+        return response.read(max_size + 1 if max_size else -1)
+
+
+def index_profile_cv(user_id, url, path=None, max_size=None):
+    """Link the user's profile to the text of its CV at ``url``; return the CVText or None."""
+    try:
+        data = read_cv(url, path, max_size)
+    except OSError:
+        logger.exception('Could not read CV %s', url)
+        return None
+    if max_size and len(data) > max_size:
+        return None
+    cv_text = get_or_extract(data)
+    # Only if the profile still has this CV
+    Profile.objects.filter(user_id=user_id, cv=url).update(cv_text=cv_text)
+    return cv_text
+
+
+def matching_cv_texts(query):
+    """CVText queryset whose text contains every term of ``query`` (as prefixes)."""
+    terms = query_terms(query)
+    if not terms:
+        return CVText.objects.none()
+
+    if connection.vendor == 'postgresql':
+        from django.contrib.postgres.search import SearchQuery, SearchVector
+
+        search_query = SearchQuery(' & '.join(f'{t}:*' for t in terms), config='simple', search_type='raw')
+        return CVText.objects.annotate(
+            search=SearchVector('search_document', config='simple')
+        ).filter(search=search_query)
+    if connection.vendor == 'sqlite':
+        match = ' '.join(f'"{t}"*' for t in terms)
+        hits = f'SELECT rowid FROM {SQLITE_FTS_TABLE} WHERE {SQLITE_FTS_TABLE} MATCH %s'
+        try:
+            with connection.cursor() as cursor:
+                # Fail here, not in the caller's query, when there is no FTS5 table
+                cursor.execute(f'{hits} LIMIT 0', [match])
+        except DatabaseError:
+            pass
+        else:
+            # A subquery rather than a capped id list: the caller's filters
+            # (e.g. one job's applicants) must see every match
+            return CVText.objects.filter(pk__in=RawSQL(hits, [match]))
+
+    queryset = CVText.objects.all()
+    for term in terms:
+        queryset = queryset.filter(search_document__icontains=term)
+    return queryset
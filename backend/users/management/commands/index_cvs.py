@@ -0,0 +1,19 @@
+from django.core.management.base import BaseCommand
+
+from users.cv_index import index_profile_cv
+from users.models import Profile
+from users.uploads import UPLOAD_KINDS
+
+
+class Command(BaseCommand):
+    help = 'Extract and index the text of profile CVs that have not been indexed yet.'
+
+    def handle(self, *args, **options):
+        profiles = Profile.objects.filter(cv__isnull=False, cv_text__isnull=True).exclude(cv='')
+        indexed = skipped = 0
+        for user_id, url in profiles.values_list('user_id', 'cv').iterator():
+            if index_profile_cv(user_id, url, max_size=UPLOAD_KINDS['cv']['max_size']) is None:
+                skipped += 1
+            else:
+                indexed += 1
+        self.stdout.write(self.style.SUCCESS(f'{indexed} CV(s) indexed, {skipped} could not be read.'))
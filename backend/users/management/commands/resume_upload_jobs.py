@@ -0,0 +1,39 @@
+import os
+from datetime import timedelta
+
+from django.core.management.base import BaseCommand
+from django.utils import timezone
+
+from users.models import UploadJob
+from users.uploads import DIRECT_UPLOAD_TTL, run_upload_job
+
+
+class Command(BaseCommand):
+    help = 'Re-run avatar/CV uploads left pending or running by a worker that stopped, and expire abandoned direct uploads.'
+
+    def add_arguments(self, parser):
+        parser.add_argument(
+            '--older-than', type=int, default=10,
+            help='Only jobs not updated for this many minutes (default: 10).',
+        )
+
+    def handle(self, *args, **options):
+        cutoff = timezone.now() - timedelta(minutes=options['older_than'])
+        stuck = UploadJob.objects.filter(status__in=['pending', 'running'], updated_at__lt=cutoff)
+        resumed = failed = 0
+        for job in stuck:
+            if not os.path.exists(job.spool_path):
+                UploadJob.objects.filter(pk=job.pk).update(
+                    status='failed', error='Spooled file is missing.', updated_at=timezone.now()
+                )
+                failed += 1
+                continue
+            UploadJob.objects.filter(pk=job.pk).update(status='pending')
+            run_upload_job(job.pk)
+            resumed += 1
+
+        # Signed parameters were issued but the browser never completed the upload
+        failed += UploadJob.objects.filter(
+            status='awaiting', created_at__lt=timezone.now() - DIRECT_UPLOAD_TTL
+        ).update(status='failed', error='Upload expired.', updated_at=timezone.now())
+        self.stdout.write(self.style.SUCCESS(f'{resumed} upload(s) resumed, {failed} marked failed.'))
@@ -0,0 +1,18 @@
+# Generated by Django 5.2.9 on 2026-10-17 13:00
+
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('users', '0007_uploadjob'),
+    ]
+
+    operations = [
+        migrations.AlterField(
+            model_name='uploadjob',
+            name='status',
+            field=models.CharField(choices=[('awaiting', 'Awaiting upload'), ('pending', 'Pending'), ('running', 'Running'), ('done', 'Done'), ('superseded', 'Superseded'), ('failed', 'Failed')], default='pending', max_length=20),
+        ),
+    ]
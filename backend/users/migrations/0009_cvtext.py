@@ -0,0 +1,64 @@
+# Generated by Django 5.2.9 on 2026-10-17 18:15
+
+import django.db.models.deletion
+from django.db import migrations, models
+
+
+# Kept in step with users/cv_index.py
+SQLITE_FTS_TABLE = 'users_cvtext_fts'
+POSTGRES_INDEX_NAME = 'cvtext_search_document_gin'
+
+
+def _postgres_index():
+    from django.contrib.postgres.indexes import GinIndex
+    from django.contrib.postgres.search import SearchVector
+
+    return GinIndex(SearchVector('search_document', config='simple'), name=POSTGRES_INDEX_NAME)
+
+
+def _sqlite_has_fts5(connection):
+    with connection.cursor() as cursor:
+        cursor.execute("SELECT sqlite_compileoption_used('ENABLE_FTS5')")
+        return bool(cursor.fetchone()[0])
+
+
+def create_search_index(apps, schema_editor):
+    vendor = schema_editor.connection.vendor
+    if vendor == 'postgresql':
+        schema_editor.add_index(apps.get_model('users', 'CVText'), _postgres_index())
+    elif vendor == 'sqlite' and _sqlite_has_fts5(schema_editor.connection):
+        schema_editor.execute(f'CREATE VIRTUAL TABLE {SQLITE_FTS_TABLE} USING fts5(search_document)')
+
+
+def drop_search_index(apps, schema_editor):
+    vendor = schema_editor.connection.vendor
+    if vendor == 'postgresql':
+        schema_editor.remove_index(apps.get_model('users', 'CVText'), _postgres_index())
+    elif vendor == 'sqlite':
+        schema_editor.execute(f'DROP TABLE IF EXISTS {SQLITE_FTS_TABLE}')
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('users', '0008_uploadjob_awaiting_status'),
+    ]
+
+    operations = [
+        migrations.CreateModel(
+            name='CVText',
+            fields=[
+                ('id', models.BigAutoField(auto_created=True, primary_key=True, serialize=False, verbose_name='ID')),
+                ('sha256', models.CharField(max_length=64, unique=True)),
+                ('text', models.TextField(blank=True)),
+                ('search_document', models.TextField(blank=True, editable=False)),
+                ('created_at', models.DateTimeField(auto_now_add=True)),
+            ],
+        ),
+        migrations.AddField(
+            model_name='profile',
+            name='cv_text',
+            field=models.ForeignKey(blank=True, editable=False, null=True, on_delete=django.db.models.deletion.SET_NULL, related_name='profiles', to='users.cvtext'),
+        ),
+        migrations.RunPython(create_search_index, drop_search_index),
+    ]
@@ -1,3 +1,5 @@
+import uuid
+
 from django.db import models
 from django.conf import settings
 from django.utils import timezone
@@ -118,6 +120,18 @@ class CustomUser(AbstractBaseUser, PermissionsMixin):
     def __str__(self):
         return f"{self.username} ({self.email})"
 
+class CVText(models.Model):
+    """Text extracted from a CV file, stored once per file content (see cv_index.py)."""
+    sha256 = models.CharField(max_length=64, unique=True)
+    text = models.TextField(blank=True)
+    # Diacritic-folded copy of ``text``, indexed for full-text search
+    search_document = models.TextField(blank=True, editable=False)
+    created_at = models.DateTimeField(auto_now_add=True)
+
+    def __str__(self):
+        return self.sha256
+
+
 class Profile(models.Model):
     user = models.OneToOneField(settings.AUTH_USER_MODEL, on_delete=models.CASCADE)
     dob = models.DateField(null=True, blank=True)
@@ -125,7 +139,47 @@ class Profile(models.Model):
     bio = models.TextField(blank=True)
     cv = models.URLField(max_length=500, null=True, blank=True)  # Cloudinary URL for CV
     cv_filename = models.CharField(max_length=255, null=True, blank=True)  # Original filename
+    # Extracted text of the current CV, filled in by the upload pool
+    cv_text = models.ForeignKey(CVText, on_delete=models.SET_NULL, null=True, blank=True, editable=False, related_name='profiles')
 
     def __str__(self):
         user_repr = getattr(self.user, 'username', str(self.user))
-        return f"{user_repr}"
\ No newline at end of file
+        return f"{user_repr}"
+
+
+class UploadJob(models.Model):
+    """An avatar/CV upload: spooled to disk for the upload pool, or posted directly to storage (see uploads.py)."""
+
+    KIND_CHOICES = [
+        ('avatar', 'Avatar'),
+        ('cv', 'CV'),
+    ]
+    STATUS_CHOICES = [
+        # Direct upload: signed parameters issued, waiting for the browser
+        ('awaiting', 'Awaiting upload'),
+        ('pending', 'Pending'),
+        ('running', 'Running'),
+        ('done', 'Done'),
+        # Finished after a newer upload of the same kind; not applied
+        ('superseded', 'Superseded'),
+        ('failed', 'Failed'),
+    ]
+
+    id = models.UUIDField(primary_key=True, default=uuid.uuid4, editable=False)
+    user = models.ForeignKey(settings.AUTH_USER_MODEL, on_delete=models.CASCADE, related_name='upload_jobs')
+    kind = models.CharField(max_length=10, choices=KIND_CHOICES)
+    status = models.CharField(max_length=20, choices=STATUS_CHOICES, default='pending')
+    filename = models.CharField(max_length=255)
+    content_type = models.CharField(max_length=100, blank=True)
+    size = models.PositiveIntegerField(default=0)
+    spool_path = models.CharField(max_length=500, blank=True)
+    url = models.URLField(max_length=500, blank=True)
+    error = models.TextField(blank=True)
+    created_at = models.DateTimeField(auto_now_add=True)
+    updated_at = models.DateTimeField(auto_now=True)
+
+    class Meta:
+        ordering = ['-created_at']
+
+    def __str__(self):
+        return f"{self.kind} upload {self.id} ({self.status})"
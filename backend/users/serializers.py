@@ -2,7 +2,7 @@ from rest_framework import serializers
 from rest_framework.validators import UniqueValidator
 from django.contrib.auth import get_user_model
 
-from .models import Profile, Role, Gender, Status, CustomUser, CustomUserManager
+from .models import Profile, Role, Gender, Status, CustomUser, CustomUserManager, UploadJob
 
 User = get_user_model()
 
@@ -203,4 +203,13 @@ class PasswordChangeSerializer(serializers.Serializer):
         user = self.context['request'].user
         user.set_password(self.validated_data['new_password'])
         user.save(update_fields=['password'])
-        return user
\ No newline at end of file
+        return user
+
+
+# Upload Serializers
+
+class UploadJobSerializer(serializers.ModelSerializer):
+    class Meta:
+        model = UploadJob
+        fields = ['id', 'kind', 'status', 'filename', 'size', 'url', 'error', 'created_at', 'updated_at']
+        read_only_fields = fields
@@ -1,10 +1,14 @@
-from django.db.models.signals import post_migrate, post_save
+from django.db.models.signals import post_migrate, pre_save, post_save, post_delete
 from django.dispatch import receiver
 from django.apps import apps
 from django.contrib.auth.signals import user_logged_in
 from django.contrib.auth.models import update_last_login
 from django.utils import timezone
 
+from main.lookup_cache import bump_version
+
+from .authentication import revoke_user_tokens
+
 
 @receiver(user_logged_in)
 def handle_user_logged_in(sender, user, request, **kwargs):
@@ -35,9 +39,58 @@ def create_profile_for_user(sender, instance, created, **kwargs):
         Profile.objects.get_or_create(user=instance)
 
 
+@receiver(pre_save, sender='users.CustomUser')
+def remember_credentials(sender, instance, raw=False, update_fields=None, **kwargs):
+    """Note whether this save changes the password or deactivates the account (see post_save below)."""
+    instance._revoke_tokens = False
+    if raw or instance.pk is None or instance._state.adding:
+        return
+    if update_fields is not None and not {'password', 'is_active'} & set(update_fields):
+        return
+    before = sender.objects.filter(pk=instance.pk).values('password', 'is_active').first()
+    if before is not None:
+        instance._revoke_tokens = before['password'] != instance.password or (
+            before['is_active'] and not instance.is_active
+        )
+
+
+@receiver(post_save, sender='users.CustomUser')
+def revoke_tokens_on_credential_change(sender, instance, raw=False, **kwargs):
+    """Access tokens are checked from their claims only, so cut them off explicitly."""
+    if not raw and getattr(instance, '_revoke_tokens', False):
+        instance._revoke_tokens = False
+        revoke_user_tokens(instance)
+
+
+@receiver(post_delete, sender='users.CustomUser')
+def revoke_tokens_on_delete(sender, instance, **kwargs):
+    revoke_user_tokens(instance)
+
+
 @receiver(user_logged_in)
 def ensure_profile_exists(sender, user, request, **kwargs):
     """Ensure profile exists when user logs in (for existing users without profile)."""
     from .models import Profile
     
     Profile.objects.get_or_create(user=user)
+
+
+@receiver([post_save, post_delete], sender='users.Role')
+@receiver([post_save, post_delete], sender='users.Gender')
+@receiver([post_save, post_delete], sender='users.Status')
+def invalidate_lookup_cache(sender, **kwargs):
+    """Retire the cached lookup list (and its ETag) after any change."""
+    bump_version(sender)
+
+
+@receiver(post_migrate)
+def create_cache_table(sender, using, **kwargs):
+    """Create the database cache table (settings.CACHES) along with the schema.
+
+    Sent once per migrated app; the users app always has models, so hook there.
+    """
+    if sender.label != 'users':
+        return
+    from django.core.management import call_command
+
+    call_command('createcachetable', database=using, verbosity=0)
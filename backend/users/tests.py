@@ -0,0 +1,68 @@
+from django.core.cache import cache
+from rest_framework.test import APITestCase
+
+from .models import CustomUser
+
+
+class TokenRevocationTests(APITestCase):
+    fixtures = ['users_lookups.json']
+
+    def setUp(self):
+        # Revocation entries live in the cache, which outlives a test's transaction
+        cache.clear()
+        self.admin = CustomUser.objects.create_superuser('admin', 'admin@example.com', password='pw')
+        self.user = CustomUser.objects.create_user('seek', 'seek@example.com', password='pw', status_id='ACTIVE')
+
+    def tokens(self, username, password='pw'):
+        response = self.client.post('/api/users/token/', {'username': username, 'password': password}, format='json')
+        self.assertEqual(response.status_code, 200, response.content)
+        return response.json()
+
+    def me(self, access):
+        return self.client.get('/api/users/me/', HTTP_AUTHORIZATION='Bearer ' + access)
+
+    def test_token_works_without_revocation(self):
+        self.assertEqual(self.me(self.tokens('seek')['access']).status_code, 200)
+
+    def test_ban_revokes_issued_tokens(self):
+        tokens = self.tokens('seek')
+        admin_access = self.tokens('admin')['access']
+        with self.captureOnCommitCallbacks(execute=True):
+            response = self.client.post(
+                f'/api/users/users/{self.user.pk}/set-status/', {'status': 'BANNED'},
+                format='json', HTTP_AUTHORIZATION='Bearer ' + admin_access,
+            )
+        self.assertEqual(response.status_code, 200, response.content)
+
+        self.assertEqual(self.me(tokens['access']).status_code, 401)
+        response = self.client.post('/api/users/token/refresh/', {'refresh': tokens['refresh']}, format='json')
+        self.assertEqual(response.status_code, 401)
+        response = self.client.post('/api/users/token/', {'username': 'seek', 'password': 'pw'}, format='json')
+        self.assertNotEqual(response.status_code, 200)
+
+    def test_password_change_revokes_older_tokens_only(self):
+        old_access = self.tokens('seek')['access']
+        with self.captureOnCommitCallbacks(execute=True):
+            response = self.client.post(
+                '/api/users/change-password/', {'old_password': 'pw', 'new_password': 'new-pw'},
+                format='json', HTTP_AUTHORIZATION='Bearer ' + old_access,
+            )
+        self.assertEqual(response.status_code, 200, response.content)
+        self.assertEqual(self.me(old_access).status_code, 401)
+
+        # Issued in the same second as the revocation, but after it
+        new_access = self.tokens('seek', 'new-pw')['access']
+        self.assertEqual(self.me(new_access).status_code, 200)
+
+    def test_deactivation_and_deletion_revoke_tokens(self):
+        access = self.tokens('seek')['access']
+        self.user.is_active = False
+        with self.captureOnCommitCallbacks(execute=True):
+            self.user.save()
+        self.assertEqual(self.me(access).status_code, 401)
+
+        other = CustomUser.objects.create_user('other', 'other@example.com', password='pw', status_id='ACTIVE')
+        access = self.tokens('other')['access']
+        with self.captureOnCommitCallbacks(execute=True):
+            other.delete()
+        self.assertEqual(self.me(access).status_code, 401)
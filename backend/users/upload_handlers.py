@@ -0,0 +1,106 @@
+"""
+Upload handler that rejects bad avatar/CV uploads while the body is still arriving.
+
+Django only lets a view look at ``content_type`` and ``size`` after the whole
+multipart body has been read into memory or a temporary file. Installed in
+front of the default handlers (see ``GuardedUploadMixin`` in views.py),
+``UploadGuardHandler``:
+
+- refuses a request whose Content-Length already exceeds the limit;
+- checks the first bytes of the file against the formats the kind accepts;
+- counts bytes as they arrive and stops at the limit.
+
+Each refusal raises ``StopUpload(connection_reset=True)``: nothing more is
+read from the client and nothing past the limit reaches memory or disk.
+The reason is kept in ``error``/``error_status`` for the view to report.
+"""
+from django.core.files.uploadhandler import FileUploadHandler, SkipFile, StopUpload
+from rest_framework import status
+
+from .uploads import UPLOAD_KINDS
+
+# Leading bytes of the file formats each kind accepts
+SIGNATURES = {
+    'avatar': (
+        (0, b'\xff\xd8\xff'),  # JPEG
+        (0, b'\x89PNG\r\n\x1a\n'),  # PNG
+        (0, b'GIF87a'),
+        (0, b'GIF89a'),
+        (8, b'WEBP'),  # RIFF....WEBP
+    ),
+    'cv': (
+        (0, b'%PDF-'),
+        (0, b'\xd0\xcf\x11\xe0\xa1\xb1\x1a\xe1'),  # DOC (OLE compound file)
+        (0, b'PK\x03\x04'),  # DOCX (zip container)
+    ),
+}
+SNIFF_BYTES = 12
+
+# Room for the multipart boundaries and part headers around the file itself
+MULTIPART_OVERHEAD = 64 * 1024
+
+
+def matches_signature(kind, head):
+    return any(head[offset:offset + len(magic)] == magic for offset, magic in SIGNATURES[kind])
+
+
+class UploadGuardHandler(FileUploadHandler):
+    """Enforce the ``UPLOAD_KINDS[kind]`` size limit and file signature as bytes arrive."""
+
+    def __init__(self, kind, request=None):
+        super().__init__(request)
+        self.kind = kind
+        self.max_size = UPLOAD_KINDS[kind]['max_size']
+        self.request_too_large = False
+        self.error = None
+        self.error_status = None
+        self.received = 0
+        self.head = b''
+        self.sniffed = False
+
+    def reject(self, message, error_status):
+        self.error = message
+        self.error_status = error_status
+        raise StopUpload(connection_reset=True)
+
+    def reject_too_large(self):
+        self.reject(
+            f'File too large. Maximum size is {self.max_size // (1024 * 1024)}MB.',
+            status.HTTP_413_REQUEST_ENTITY_TOO_LARGE,
+        )
+
+    def handle_raw_input(self, input_data, META, content_length, boundary, encoding=None):
+        # Raising here would escape the parser; refuse at the first file part instead
+        self.request_too_large = content_length > self.max_size + MULTIPART_OVERHEAD
+
+    def new_file(self, field_name, file_name, content_type, content_length, charset=None, content_type_extra=None):
+        if field_name != self.kind:
+            raise SkipFile()
+        if self.request_too_large or (content_length or 0) > self.max_size:
+            self.reject_too_large()
+        super().new_file(field_name, file_name, content_type, content_length, charset, content_type_extra)
+        self.received = 0
+        self.head = b''
+        self.sniffed = False
+
+    def receive_data_chunk(self, raw_data, start):
+        self.received += len(raw_data)
+        if self.received > self.max_size:
+            self.reject_too_large()
+        if not self.sniffed:
+            self.head += raw_data[:SNIFF_BYTES - len(self.head)]
+            if len(self.head) >= SNIFF_BYTES:
+                self.check_signature()
+        return raw_data
+
+    def check_signature(self):
+        self.sniffed = True
+        if not matches_signature(self.kind, self.head):
+            self.reject(UPLOAD_KINDS[self.kind]['type_error'], status.HTTP_400_BAD_REQUEST)
+
+    def file_complete(self, file_size):
+        # Files shorter than SNIFF_BYTES are checked on what arrived
+        if not self.sniffed:
+            self.check_signature()
+        # Let the default handlers build the file
+        return None
@@ -0,0 +1,530 @@
+"""
+Background upload pipeline for avatars and CVs.
+
+Pushing a file to Cloudinary used to happen inside the request, holding a
+gunicorn worker for the whole transfer (up to 10 MB for a CV). Now the view
+only:
+
+- spools the uploaded file to ``UPLOAD_SPOOL_DIR``;
+- records an ``UploadJob`` and submits it to a small thread pool;
+- answers 202 with the job, which the client polls at ``uploads/<id>/``.
+
+The worker uploads the file, records the URL on ``CustomUser.avatar`` or
+``Profile.cv`` and queues the replaced asset for deletion. Deletions are
+collected and sent in batches (one API call per kind and flush) by the same
+pool, so neither uploads nor deletes are on the request path.
+
+Direct uploads skip the API workers altogether: ``uploads/sign/`` reserves
+an UploadJob and returns short-lived signed parameters, the browser posts
+the file straight to storage, and ``uploads/<id>/complete/`` checks the
+stored file's size and format from the storage metadata, and its first
+bytes against the accepted file signatures, before recording it (see ``start_direct_upload`` / ``complete_direct_upload``).
+
+The storage backend is ``settings.UPLOAD_STORAGE``: ``CloudinaryStorage`` in
+production, ``LocalFileStorage`` to keep files under ``MEDIA_ROOT`` (local
+development and tests). ``UPLOAD_WORKERS = 0`` runs jobs inline.
+"""
+import logging
+import os
+import threading
+import urllib.request
+from datetime import timedelta
+from concurrent.futures import ThreadPoolExecutor
+from functools import lru_cache
+
+import cloudinary.api
+import cloudinary.exceptions
+import cloudinary.uploader
+import cloudinary.utils
+
+from django.apps import apps
+from django.conf import settings
+from django.core import signing
+from django.core.files.storage import FileSystemStorage
+from django.db import close_old_connections, transaction
+from django.urls import reverse
+from django.utils import timezone
+from django.utils.module_loading import import_string
+
+from . import cv_index
+from .models import CustomUser, Profile, UploadJob
+
+logger = logging.getLogger(__name__)
+
+# kind -> where the files go and what the upload endpoints accept
+UPLOAD_KINDS = {
+    'avatar': {
+        'folder': 'jobfinder/avatars',
+        'resource_type': 'image',
+        'options': {
+            'transformation': [
+                {'width': 200, 'height': 200, 'crop': 'fill', 'gravity': 'face'},
+                {'quality': 'auto', 'fetch_format': 'auto'},
+            ],
+        },
+        'max_size': 5 * 1024 * 1024,
+        'content_types': ['image/jpeg', 'image/png', 'image/gif', 'image/webp'],
+        # Images must declare an image content type; the extension alone is not enough
+        'extensions': [],
+        # Formats accepted from storage metadata on direct uploads
+        'formats': ['jpg', 'jpeg', 'png', 'gif', 'webp'],
+        'type_error': 'Invalid file type. Allowed: JPEG, PNG, GIF, WebP.',
+    },
+    'cv': {
+        'folder': 'jobfinder/cvs',
+        'resource_type': 'raw',
+        'options': {},
+        'max_size': 10 * 1024 * 1024,
+        'content_types': [
+            'application/pdf',
+            'application/msword',
+            'application/vnd.openxmlformats-officedocument.wordprocessingml.document',
+        ],
+        'extensions': ['.pdf', '.doc', '.docx'],
+        'formats': ['pdf', 'doc', 'docx'],
+        'type_error': 'Invalid file type. Allowed: PDF, DOC, DOCX.',
+    },
+}
+
+# Cloudinary's delete_resources accepts at most 100 public ids per call
+DELETE_BATCH_SIZE = 100
+
+# How long signed direct-upload parameters stay valid
+DIRECT_UPLOAD_TTL = timedelta(minutes=15)
+LOCAL_UPLOAD_SALT = 'users.uploads.local-direct-upload'
+READ_HEAD_TIMEOUT = 30
+
+
+def file_extension(filename):
+    return os.path.splitext(filename or '')[1].lower()
+
+
+def validate_upload(kind, uploaded_file):
+    """Return an error message when ``uploaded_file`` is not acceptable for ``kind``."""
+    return validate_file_info(kind, uploaded_file.name, uploaded_file.content_type, uploaded_file.size)
+
+
+def validate_file_info(kind, filename, content_type, size):
+    config = UPLOAD_KINDS[kind]
+    if content_type not in config['content_types'] and file_extension(filename) not in config['extensions']:
+        return config['type_error']
+    if size > config['max_size']:
+        return f"File too large. Maximum size is {config['max_size'] // (1024 * 1024)}MB."
+    return None
+
+
+def validate_stored_file(kind, info):
+    """Check storage metadata (``size``/``format``) of a directly uploaded file."""
+    config = UPLOAD_KINDS[kind]
+    if (info['format'] or '').lower() not in config['formats']:
+        return config['type_error']
+    if info['size'] > config['max_size']:
+        return f"File too large. Maximum size is {config['max_size'] // (1024 * 1024)}MB."
+    return None
+
+
+class CloudinaryStorage:
+    """Stores uploads in Cloudinary under ``UPLOAD_KINDS[kind]['folder']``."""
+
+    def upload(self, path, kind, name):
+        config = UPLOAD_KINDS[kind]
+        result = cloudinary.uploader.upload(
+            path,
+            public_id=f"{config['folder']}/{name}",
+            overwrite=True,
+            resource_type=config['resource_type'],
+            **config['options'],
+        )
+        return result['secure_url']
+
+    def _public_id(self, kind, name, filename):
+        config = UPLOAD_KINDS[kind]
+        # Raw files have no detected format; keep the extension in the public id
+        extension = file_extension(filename) if config['resource_type'] == 'raw' else ''
+        return f"{config['folder']}/{name}{extension}"
+
+    def direct_upload(self, job):
+        """Signed form fields for posting the job's file straight to Cloudinary."""
+        config = UPLOAD_KINDS[job.kind]
+        params = cloudinary.utils.build_upload_params(
+            public_id=self._public_id(job.kind, asset_name(job), job.filename),
+            # The name is unique per job: the signed fields can never replace a verified file
+            overwrite=False,
+            allowed_formats=','.join(config['formats']) if config['resource_type'] != 'raw' else None,
+            **config['options'],
+        )
+        fields = cloudinary.utils.sign_request(
+            {key: value for key, value in params.items() if value not in (None, '')}, {}
+        )
+        return {
+            'url': cloudinary.utils.cloudinary_api_url('upload', resource_type=config['resource_type']),
+            'fields': fields,
+            'file_field': 'file',
+        }
+
+    def describe(self, kind, name, filename):
+        """``{'url', 'size', 'format'}`` of a stored file, or None when it does not exist."""
+        config = UPLOAD_KINDS[kind]
+        public_id = self._public_id(kind, name, filename)
+        try:
+            resource = cloudinary.api.resource(public_id, resource_type=config['resource_type'])
+        except cloudinary.exceptions.NotFound:
+            return None
+        return {
+            'url': resource['secure_url'],
+            'size': resource['bytes'],
+            'format': resource.get('format') or file_extension(public_id).lstrip('.'),
+        }
+
+    def read_head(self, kind, url, size):
+        """First ``size`` bytes of a stored file (a ranged GET)."""
+        request = urllib.request.Request(url, headers={'Range': f'bytes=0-{size - 1}'})
+        with urllib.request.urlopen(request, timeout=READ_HEAD_TIMEOUT) as response:
+            return response.read(size)
+
+    def asset_id(self, kind, url):
+        """Public id of a Cloudinary URL in this kind's folder, or None."""
+        config = UPLOAD_KINDS[kind]
+        if not url or 'cloudinary' not in url or '/upload/' not in url:
+            return None
+        parts = url.split('/upload/', 1)[1].split('/')
+        if parts and parts[0].startswith('v') and parts[0][1:].isdigit():
+            parts = parts[1:]
+        public_id = '/'.join(parts)
+        if not public_id.startswith(config['folder'] + '/'):
+            return None
+        if config['resource_type'] != 'raw':
+            # Image public ids are stored without the format extension
+            public_id = os.path.splitext(public_id)[0]
+        return public_id
+
+    def delete(self, kind, asset_ids):
+        resource_type = UPLOAD_KINDS[kind]['resource_type']
+        for start in range(0, len(asset_ids), DELETE_BATCH_SIZE):
+            cloudinary.api.delete_resources(asset_ids[start:start + DELETE_BATCH_SIZE], resource_type=resource_type)
+
+
+class LocalFileStorage:
+    """Keeps uploads under ``MEDIA_ROOT``; a stand-in for Cloudinary in development and tests."""
+
+    def __init__(self):
+        self.storage = FileSystemStorage(
+            location=settings.MEDIA_ROOT,
+            base_url=settings.UPLOAD_PUBLIC_URL.rstrip('/') + settings.MEDIA_URL,
+        )
+
+    def upload(self, path, kind, name):
+        target = f"{UPLOAD_KINDS[kind]['folder']}/{name}{file_extension(path)}"
+        with open(path, 'rb') as fp:
+            saved = self.storage.save(target, fp)
+        return self.storage.url(saved)
+
+    def _name(self, kind, name, filename):
+        return f"{UPLOAD_KINDS[kind]['folder']}/{name}{file_extension(filename)}"
+
+    def direct_upload(self, job):
+        """Form fields for LocalDirectUploadView, which plays the storage service."""
+        token = signing.dumps(
+            {'name': self._name(job.kind, asset_name(job), job.filename), 'job': str(job.pk)},
+            salt=LOCAL_UPLOAD_SALT,
+        )
+        return {
+            'url': settings.UPLOAD_PUBLIC_URL.rstrip('/') + reverse('upload-local-direct'),
+            'fields': {'token': token},
+            'file_field': 'file',
+        }
+
+    def receive(self, token, uploaded_file):
+        """Store a file posted to LocalDirectUploadView; raises signing.BadSignature.
+
+        A token is good for one file: it is refused once its name is taken or
+        its job has left ``awaiting``, like Cloudinary with ``overwrite=False``.
+        """
+        payload = signing.loads(token, salt=LOCAL_UPLOAD_SALT, max_age=DIRECT_UPLOAD_TTL)
+        name = payload['name']
+        if self.storage.exists(name) or not UploadJob.objects.filter(pk=payload.get('job'), status='awaiting').exists():
+            raise signing.BadSignature('Upload token already used.')
+        # A concurrent post with the same token gets another name, never this one
+        saved = self.storage.save(name, uploaded_file)
+        return self.storage.url(saved)
+
+    def describe(self, kind, name, filename):
+        stored = self._name(kind, name, filename)
+        if not self.storage.exists(stored):
+            return None
+        return {
+            'url': self.storage.url(stored),
+            'size': self.storage.size(stored),
+            'format': file_extension(stored).lstrip('.'),
+        }
+
+    def read_head(self, kind, url, size):
+        with self.storage.open(self.asset_id(kind, url), 'rb') as fp:
+            return fp.read(size)
+
+    def asset_id(self, kind, url):
+        base_url = self.storage.base_url
+        if not url or not url.startswith(base_url):
+            return None
+        name = url[len(base_url):]
+        return name if name.startswith(UPLOAD_KINDS[kind]['folder'] + '/') else None
+
+    def delete(self, kind, asset_ids):
+        for name in asset_ids:
+            self.storage.delete(name)
+
+
+@lru_cache(maxsize=None)
+def get_storage():
+    return import_string(settings.UPLOAD_STORAGE)()
+
+
+_executor = None
+_executor_lock = threading.Lock()
+
+
+def submit(fn, *args):
+    """Run ``fn(*args)`` on the upload pool (inline when UPLOAD_WORKERS is 0)."""
+    global _executor
+    if settings.UPLOAD_WORKERS <= 0:
+        fn(*args)
+        return
+    if _executor is None:
+        with _executor_lock:
+            if _executor is None:
+                _executor = ThreadPoolExecutor(max_workers=settings.UPLOAD_WORKERS, thread_name_prefix='upload')
+    _executor.submit(fn, *args)
+
+
+# kind -> asset ids waiting for the next delete flush
+_pending_deletes = {}
+_delete_lock = threading.Lock()
+_flush_scheduled = False
+
+
+def schedule_delete(kind, url):
+    """Queue the asset behind ``url`` for deletion once the transaction commits.
+
+    Deletes queued while a flush is waiting on the pool go out together.
+    """
+    def enqueue():
+        global _flush_scheduled
+        asset_id = get_storage().asset_id(kind, url)
+        if asset_id is None:
+            return
+        with _delete_lock:
+            _pending_deletes.setdefault(kind, set()).add(asset_id)
+            if _flush_scheduled:
+                return
+            _flush_scheduled = True
+        submit(flush_deletes)
+
+    transaction.on_commit(enqueue)
+
+
+def flush_deletes():
+    global _flush_scheduled
+    with _delete_lock:
+        batch = dict(_pending_deletes)
+        _pending_deletes.clear()
+        _flush_scheduled = False
+    for kind, asset_ids in batch.items():
+        try:
+            get_storage().delete(kind, sorted(asset_ids))
+        except Exception:
+            logger.exception('Deleting %d %s asset(s) failed', len(asset_ids), kind)
+
+
+def spool(uploaded_file, job_id):
+    """Copy an uploaded file to the spool directory and return its path."""
+    os.makedirs(settings.UPLOAD_SPOOL_DIR, exist_ok=True)
+    path = os.path.join(settings.UPLOAD_SPOOL_DIR, f'{job_id}{file_extension(uploaded_file.name)}')
+    with open(path, 'wb') as fp:
+        for chunk in uploaded_file.chunks():
+            fp.write(chunk)
+    return path
+
+
+def start_upload(user, kind, uploaded_file):
+    """Spool ``uploaded_file`` and queue it for upload; return the UploadJob."""
+    job = UploadJob(
+        user_id=user.pk,
+        kind=kind,
+        filename=uploaded_file.name,
+        content_type=uploaded_file.content_type or '',
+        size=uploaded_file.size,
+    )
+    job.spool_path = spool(uploaded_file, job.id)
+    job.save()
+    transaction.on_commit(lambda: submit(run_upload_job, job.pk))
+    return job
+
+
+def still_referenced(kind, url):
+    # Applications keep the CV URL they were sent with; never delete those files
+    if kind != 'cv':
+        return False
+    Application = apps.get_model('jobfinder', 'Application')
+    return Application.objects.filter(cv_url=url).exists()
+
+
+def _apply_upload(job, url):
+    """Record ``url`` on the user/profile; return the URL it replaces, or None.
+
+    Marks the job superseded (and returns ``url`` itself for deletion) when a
+    newer upload of the same kind has already been applied.
+    """
+    user = CustomUser.objects.select_for_update().get(pk=job.user_id)
+    newer = UploadJob.objects.filter(
+        user_id=job.user_id, kind=job.kind, status='done', created_at__gt=job.created_at
+    ).exists()
+    if newer:
+        job.status = 'superseded'
+        return url
+
+    job.status = 'done'
+    if job.kind == 'avatar':
+        old_url, user.avatar = user.avatar, url
+        user.save(update_fields=['avatar'])
+    else:
+        profile, _ = Profile.objects.get_or_create(user=user)
+        old_url = profile.cv
+        profile.cv = url
+        profile.cv_filename = job.filename
+        # Filled in again by index_cv once the new file's text is extracted
+        profile.cv_text = None
+        profile.save(update_fields=['cv', 'cv_filename', 'cv_text'])
+    return old_url if old_url and old_url != url else None
+
+
+def asset_name(job):
+    # A fresh name per upload, so a slow older job never overwrites a newer file
+    return f'user_{job.user_id}_{job.id.hex[:12]}'
+
+
+def _finish_upload(job, url):
+    with transaction.atomic():
+        stale_url = _apply_upload(job, url)
+        job.url = url
+        job.save(update_fields=['status', 'url', 'updated_at'])
+        if stale_url and not still_referenced(job.kind, stale_url):
+            schedule_delete(job.kind, stale_url)
+
+
+def run_upload_job(job_id):
+    """Upload a spooled file and record the result (runs on the upload pool).
+
+    Any error fails the job and removes the spooled file: nothing raised here
+    would be seen, the executor keeps it in a future nobody reads.
+    """
+    close_old_connections()
+    try:
+        # Claim the job so a repeated submission never uploads it twice
+        if not UploadJob.objects.filter(pk=job_id, status='pending').update(status='running'):
+            return
+        job = UploadJob.objects.get(pk=job_id)
+        url = None
+        try:
+            url = get_storage().upload(job.spool_path, job.kind, asset_name(job))
+            _finish_upload(job, url)
+            if job.kind == 'cv' and job.status == 'done':
+                # Extract from the spooled copy before it is removed
+                index_cv(job.user_id, url, job.spool_path)
+        except Exception as e:
+            logger.exception('Upload %s failed', job_id)
+            # Only a job that was not recorded yet; its stored file is then unreferenced
+            if UploadJob.objects.filter(pk=job_id, status='running').update(
+                status='failed', error=str(e), updated_at=timezone.now()
+            ) and url:
+                schedule_delete(job.kind, url)
+        finally:
+            remove_spooled_file(job.spool_path)
+    except Exception:
+        logger.exception('Upload %s could not be started', job_id)
+    finally:
+        close_old_connections()
+
+
+def index_cv(user_id, url, path=None):
+    """Extract and index the text of an uploaded CV (runs on the upload pool).
+
+    Reads the local ``path`` when there is one, otherwise downloads ``url``.
+    """
+    close_old_connections()
+    try:
+        cv_index.index_profile_cv(user_id, url, path, max_size=UPLOAD_KINDS['cv']['max_size'])
+    except Exception:
+        logger.exception('Indexing CV %s failed', url)
+    finally:
+        close_old_connections()
+
+
+def remove_spooled_file(path):
+    if path and os.path.exists(path):
+        try:
+            os.remove(path)
+        except OSError:
+            logger.warning('Could not remove spooled upload %s', path)
+
+
+def start_direct_upload(user, kind, filename, content_type, size):
+    """Reserve an UploadJob for a direct upload; return ``(job, upload)``.
+
+    ``upload`` holds the storage URL, the signed form fields and the name of
+    the file field the browser should post.
+    """
+    job = UploadJob.objects.create(
+        user_id=user.pk,
+        kind=kind,
+        status='awaiting',
+        filename=filename,
+        content_type=content_type,
+        size=size,
+    )
+    return job, get_storage().direct_upload(job)
+
+
+def check_stored_signature(kind, url):
+    """Check the leading bytes of a stored file like the proxied upload does; return an error or None."""
+    # upload_handlers imports this module
+    from .upload_handlers import SNIFF_BYTES, matches_signature
+
+    try:
+        head = get_storage().read_head(kind, url, SNIFF_BYTES)
+    except (OSError, ValueError):
+        logger.exception('Could not read the head of %s', url)
+        return 'Uploaded file could not be read.'
+    if not matches_signature(kind, head):
+        return UPLOAD_KINDS[kind]['type_error']
+    return None
+
+
+def complete_direct_upload(job):
+    """Verify a directly uploaded file from storage metadata and record it.
+
+    Returns None on success, or the error the job was failed with.
+    """
+    if not UploadJob.objects.filter(pk=job.pk, status='awaiting').update(status='running'):
+        return 'This upload is not waiting to be completed.'
+    info = get_storage().describe(job.kind, asset_name(job), job.filename)
+    if info is None:
+        error = 'Uploaded file not found.'
+    elif timezone.now() - job.created_at > DIRECT_UPLOAD_TTL:
+        error = 'Upload expired. Please try again.'
+    else:
+        error = validate_stored_file(job.kind, info) or check_stored_signature(job.kind, info['url'])
+
+    if error:
+        if info is not None:
+            schedule_delete(job.kind, info['url'])
+        job.status = 'failed'
+        job.error = error
+        job.save(update_fields=['status', 'error', 'updated_at'])
+        return error
+
+    job.size = info['size']
+    job.save(update_fields=['size', 'updated_at'])
+    _finish_upload(job, info['url'])
+    if job.kind == 'cv' and job.status == 'done':
+        transaction.on_commit(lambda: submit(index_cv, job.user_id, info['url']))
+    return None
@@ -1,7 +1,6 @@
 from django.urls import include, path
 
 from rest_framework.routers import DefaultRouter
-from rest_framework_simplejwt.views import TokenRefreshView
 
 from .views import (
     RoleViewSet,
@@ -12,9 +11,14 @@ from .views import (
     ChangePasswordView,
     ProfileViewSet,
     CustomTokenObtainPairView,
+    CustomTokenRefreshView,
     UserViewSet,
     AvatarUploadView,
     CVUploadView,
+    UploadJobView,
+    DirectUploadSignView,
+    DirectUploadCompleteView,
+    LocalDirectUploadView,
 )
 
 router = DefaultRouter()
@@ -30,7 +34,11 @@ urlpatterns = [
     path('me/', MeUserView.as_view(), name='me'),
     path('change-password/', ChangePasswordView.as_view(), name='change-password'),
     path('token/', CustomTokenObtainPairView.as_view(), name='token_obtain_pair'),
-    path('token/refresh/', TokenRefreshView.as_view(), name='token_refresh'),
+    path('token/refresh/', CustomTokenRefreshView.as_view(), name='token_refresh'),
     path('avatar/', AvatarUploadView.as_view(), name='avatar-upload'),
     path('cv/', CVUploadView.as_view(), name='cv-upload'),
+    path('uploads/sign/', DirectUploadSignView.as_view(), name='upload-sign'),
+    path('uploads/local/', LocalDirectUploadView.as_view(), name='upload-local-direct'),
+    path('uploads/<uuid:job_id>/', UploadJobView.as_view(), name='upload-job'),
+    path('uploads/<uuid:job_id>/complete/', DirectUploadCompleteView.as_view(), name='upload-job-complete'),
 ]
\ No newline at end of file
@@ -1,22 +1,34 @@
 from rest_framework import viewsets, permissions, filters, status
 from rest_framework.response import Response
 from rest_framework.decorators import action
-from rest_framework_simplejwt.authentication import JWTAuthentication
 from rest_framework.views import APIView
-from rest_framework_simplejwt.views import TokenObtainPairView
-from rest_framework_simplejwt.serializers import TokenObtainPairSerializer
+from rest_framework_simplejwt.views import TokenObtainPairView, TokenRefreshView
+from rest_framework_simplejwt.serializers import TokenObtainPairSerializer, TokenRefreshSerializer
+from rest_framework_simplejwt.exceptions import AuthenticationFailed
+from rest_framework_simplejwt.settings import api_settings as jwt_settings
+from rest_framework_simplejwt.utils import get_md5_hash_password
 from rest_framework.parsers import MultiPartParser, FormParser
 
-import cloudinary
-import cloudinary.uploader
-
 from django.contrib.auth.models import update_last_login
+from django.core import signing
+from django.shortcuts import get_object_or_404
+from django.urls import reverse
 
 from django_filters.rest_framework import DjangoFilterBackend
 from django.utils import timezone
 from django.db import transaction, IntegrityError
 
-from .models import Profile, Role, Gender, Status, CustomUser
+from jobfinder.owners import sync_owner_hidden
+from main.lookup_cache import CachedLookupListMixin, bump_version
+
+from .models import Profile, Role, Gender, Status, CustomUser, UploadJob
+from .authentication import (
+    StatelessJWTAuthentication,
+    blocked_status_message,
+    revoke_user_tokens,
+    set_user_claims,
+    user_is_admin,
+)
 from .serializers import (
     ProfileSerializer,
     RoleSerializer,
@@ -26,6 +38,20 @@ from .serializers import (
     UserSerializer,
     UserSelfUpdateSerializer,
     PasswordChangeSerializer,
+    UploadJobSerializer,
+)
+from .upload_handlers import UploadGuardHandler
+from .uploads import (
+    UPLOAD_KINDS,
+    LocalFileStorage,
+    complete_direct_upload,
+    get_storage,
+    schedule_delete,
+    start_direct_upload,
+    start_upload,
+    still_referenced,
+    validate_file_info,
+    validate_upload,
 )
 
 # Custom Permissions
@@ -61,27 +87,28 @@ class LookupViewSetMixin:
                     order = item_data.get('order')
                     if code is not None and order is not None:
                         model.objects.filter(code=code).update(order=order)
+                bump_version(model)
             return Response({'detail': 'Order updated successfully.'}, status=status.HTTP_200_OK)
         except Exception as e:
             return Response({'detail': str(e)}, status=status.HTTP_400_BAD_REQUEST)
 
 
-class RoleViewSet(LookupViewSetMixin, viewsets.ModelViewSet):
+class RoleViewSet(CachedLookupListMixin, LookupViewSetMixin, viewsets.ModelViewSet):
     queryset = Role.objects.all().order_by('order', 'code')
     serializer_class = RoleSerializer
-    authentication_classes = [JWTAuthentication]
+    authentication_classes = [StatelessJWTAuthentication]
     lookup_field = 'code'
 
-class GenderViewSet(LookupViewSetMixin, viewsets.ModelViewSet):
+class GenderViewSet(CachedLookupListMixin, LookupViewSetMixin, viewsets.ModelViewSet):
     queryset = Gender.objects.all().order_by('order', 'code')
     serializer_class = GenderSerializer
-    authentication_classes = [JWTAuthentication]
+    authentication_classes = [StatelessJWTAuthentication]
     lookup_field = 'code'
 
-class StatusViewSet(LookupViewSetMixin, viewsets.ModelViewSet):
+class StatusViewSet(CachedLookupListMixin, LookupViewSetMixin, viewsets.ModelViewSet):
     queryset = Status.objects.all().order_by('order', 'code')
     serializer_class = StatusSerializer
-    authentication_classes = [JWTAuthentication]
+    authentication_classes = [StatelessJWTAuthentication]
     lookup_field = 'code'
 
 # Registration
@@ -105,7 +132,7 @@ class RegisterUserView(APIView):
 
 class MeUserView(APIView):
     permission_classes = [permissions.IsAuthenticated]
-    authentication_classes = [JWTAuthentication]
+    authentication_classes = [StatelessJWTAuthentication]
 
     def get(self, request):
         return Response(UserSerializer(request.user, context={'request': request}).data)
@@ -117,6 +144,8 @@ class MeUserView(APIView):
             serializer.is_valid(raise_exception=True)
             with transaction.atomic():
                 serializer.save()
+                if 'status' in serializer.validated_data:
+                    sync_owner_hidden(request.user.pk)
         except IntegrityError:
             return Response({"detail": "Update failed due to integrity error."}, status=status.HTTP_400_BAD_REQUEST)
         return Response(UserSerializer(request.user, context={'request': request}).data)
@@ -125,7 +154,7 @@ class MeUserView(APIView):
 
 class ChangePasswordView(APIView):
     permission_classes = [permissions.IsAuthenticated]
-    authentication_classes = [JWTAuthentication]
+    authentication_classes = [StatelessJWTAuthentication]
 
     def post(self, request):
         serializer = PasswordChangeSerializer(data=request.data, context={'request': request})
@@ -144,11 +173,8 @@ class IsAdminOrReadSingleUser(permissions.BasePermission):
             return False
         
         # Admin has full access
-        if request.user.is_staff:
+        if user_is_admin(request.user):
             return True
-        if hasattr(request.user, 'role') and request.user.role:
-            if request.user.role.code.upper() == 'ADMIN':
-                return True
         
         # Non-admin can only retrieve single user, not list
         if view.action == 'retrieve':
@@ -162,7 +188,7 @@ class UserViewSet(viewsets.ReadOnlyModelViewSet):
     queryset = CustomUser.objects.select_related('role', 'status').all()
     serializer_class = UserSerializer
     permission_classes = [permissions.IsAuthenticated, IsAdminOrReadSingleUser]
-    authentication_classes = [JWTAuthentication]
+    authentication_classes = [StatelessJWTAuthentication]
     filter_backends = [DjangoFilterBackend, filters.SearchFilter, filters.OrderingFilter]
     filterset_fields = ['role__code', 'status__code', 'is_active']
     search_fields = ['username', 'email', 'first_name', 'last_name']
@@ -174,7 +200,7 @@ class UserViewSet(viewsets.ReadOnlyModelViewSet):
         instance = self.get_object()
         
         # Admin can always view
-        is_admin = request.user.is_staff or (hasattr(request.user, 'role') and request.user.role and request.user.role.code.upper() == 'ADMIN')
+        is_admin = user_is_admin(request.user)
         
         if not is_admin:
             user_status = getattr(instance, 'status', None)
@@ -199,90 +225,82 @@ class UserViewSet(viewsets.ReadOnlyModelViewSet):
             new_status = Status.objects.get(code=status_code)
         except Status.DoesNotExist:
             return Response({'detail': 'Invalid status code.'}, status=status.HTTP_400_BAD_REQUEST)
-        user_obj.status = new_status
-        user_obj.save()
+        with transaction.atomic():
+            user_obj.status = new_status
+            user_obj.save()
+            sync_owner_hidden(user_obj.pk)
+        if blocked_status_message(user_obj):
+            # Cut off access tokens issued before the ban instead of waiting for them to expire
+            revoke_user_tokens(user_obj)
         return Response({'detail': f'User status updated to {new_status.name}.', 'status': new_status.code})
 
 
-class AvatarUploadView(APIView):
-    """Upload avatar for current user to Cloudinary."""
+class GuardedUploadMixin:
+    """Check size and file signature while the multipart body streams in (see upload_handlers.py)."""
+    upload_kind = None
+
+    def initialize_request(self, request, *args, **kwargs):
+        self.upload_guard = None
+        if request.method == 'POST':
+            self.upload_guard = UploadGuardHandler(self.upload_kind, request)
+            request.upload_handlers.insert(0, self.upload_guard)
+        return super().initialize_request(request, *args, **kwargs)
+
+    def upload_guard_response(self):
+        guard = self.upload_guard
+        if guard is not None and guard.error:
+            return Response({'detail': guard.error}, status=guard.error_status)
+        return None
+
+
+def upload_job_response(request, job):
+    data = UploadJobSerializer(job).data
+    data['status_url'] = request.build_absolute_uri(reverse('upload-job', args=[job.pk]))
+    return Response(data, status=status.HTTP_202_ACCEPTED)
+
+
+class AvatarUploadView(GuardedUploadMixin, APIView):
+    """Upload avatar for current user; the file is sent to storage in the background."""
     permission_classes = [permissions.IsAuthenticated]
-    authentication_classes = [JWTAuthentication]
+    authentication_classes = [StatelessJWTAuthentication]
     parser_classes = [MultiPartParser, FormParser]
+    upload_kind = 'avatar'
 
     def post(self, request):
-        if 'avatar' not in request.FILES:
+        files = request.FILES
+        rejected = self.upload_guard_response()
+        if rejected:
+            return rejected
+        if 'avatar' not in files:
             return Response({'detail': 'No file provided.'}, status=status.HTTP_400_BAD_REQUEST)
         
         avatar_file = request.FILES['avatar']
         
-        # Validate file type
-        allowed_types = ['image/jpeg', 'image/png', 'image/gif', 'image/webp']
-        if avatar_file.content_type not in allowed_types:
-            return Response({'detail': 'Invalid file type. Allowed: JPEG, PNG, GIF, WebP.'}, status=status.HTTP_400_BAD_REQUEST)
+        # Validate file type (images only) and size (max 5MB)
+        error = validate_upload('avatar', avatar_file)
+        if error:
+            return Response({'detail': error}, status=status.HTTP_400_BAD_REQUEST)
         
-        # Validate file size (max 5MB)
-        if avatar_file.size > 5 * 1024 * 1024:
-            return Response({'detail': 'File too large. Maximum size is 5MB.'}, status=status.HTTP_400_BAD_REQUEST)
-        
-        try:
-            # Delete old avatar from Cloudinary if exists
-            if request.user.avatar:
-                # Extract public_id from URL
-                old_url = request.user.avatar
-                if 'cloudinary' in old_url:
-                    # Extract public_id: jobfinder/avatars/user_123
-                    parts = old_url.split('/')
-                    if 'avatars' in parts:
-                        idx = parts.index('avatars')
-                        public_id = '/'.join(parts[idx:]).split('.')[0]
-                        public_id = f"jobfinder/{public_id}"
-                        cloudinary.uploader.destroy(public_id)
-            
-            # Upload to Cloudinary with transformations
-            result = cloudinary.uploader.upload(
-                avatar_file,
-                folder='jobfinder/avatars',
-                public_id=f'user_{request.user.id}',
-                overwrite=True,
-                transformation=[
-                    {'width': 200, 'height': 200, 'crop': 'fill', 'gravity': 'face'},
-                    {'quality': 'auto', 'fetch_format': 'auto'}
-                ]
-            )
-            
-            avatar_url = result['secure_url']
-            
-            # Save URL to user model
-            request.user.avatar = avatar_url
-            request.user.save(update_fields=['avatar'])
-            
-            return Response({'avatar': avatar_url}, status=status.HTTP_200_OK)
-            
-        except Exception as e:
-            return Response({'detail': f'Upload failed: {str(e)}'}, status=status.HTTP_500_INTERNAL_SERVER_ERROR)
+        job = start_upload(request.user, 'avatar', avatar_file)
+        return upload_job_response(request, job)
 
     def delete(self, request):
-        """Delete avatar from Cloudinary."""
-        if request.user.avatar:
-            try:
-                # Delete from Cloudinary
-                public_id = f'jobfinder/avatars/user_{request.user.id}'
-                cloudinary.uploader.destroy(public_id)
-                
-                request.user.avatar = None
-                request.user.save(update_fields=['avatar'])
-                return Response({'detail': 'Avatar deleted.'}, status=status.HTTP_200_OK)
-            except Exception as e:
-                return Response({'detail': f'Delete failed: {str(e)}'}, status=status.HTTP_500_INTERNAL_SERVER_ERROR)
+        """Delete avatar; the stored file is removed in the background."""
+        user = request.user
+        if user.avatar:
+            schedule_delete('avatar', user.avatar)
+            user.avatar = None
+            user.save(update_fields=['avatar'])
+            return Response({'detail': 'Avatar deleted.'}, status=status.HTTP_200_OK)
         return Response({'detail': 'No avatar to delete.'}, status=status.HTTP_404_NOT_FOUND)
 
 
-class CVUploadView(APIView):
-    """Upload CV for current user to Cloudinary."""
+class CVUploadView(GuardedUploadMixin, APIView):
+    """Upload CV for current user; the file is sent to storage in the background."""
     permission_classes = [permissions.IsAuthenticated]
-    authentication_classes = [JWTAuthentication]
+    authentication_classes = [StatelessJWTAuthentication]
     parser_classes = [MultiPartParser, FormParser]
+    upload_kind = 'cv'
 
     def get(self, request):
         """Get current user's CV info."""
@@ -298,90 +316,126 @@ class CVUploadView(APIView):
             return Response({'cv': None, 'filename': None}, status=status.HTTP_200_OK)
 
     def post(self, request):
-        if 'cv' not in request.FILES:
+        files = request.FILES
+        rejected = self.upload_guard_response()
+        if rejected:
+            return rejected
+        if 'cv' not in files:
             return Response({'detail': 'No file provided.'}, status=status.HTTP_400_BAD_REQUEST)
         
         cv_file = request.FILES['cv']
         
-        # Validate file type
-        allowed_types = [
-            'application/pdf',
-            'application/msword',
-            'application/vnd.openxmlformats-officedocument.wordprocessingml.document'
-        ]
-        allowed_extensions = ['.pdf', '.doc', '.docx']
-        
-        file_ext = '.' + cv_file.name.split('.')[-1].lower() if '.' in cv_file.name else ''
+        # Validate file type (PDF, DOC, DOCX) and size (max 10MB)
+        error = validate_upload('cv', cv_file)
+        if error:
+            return Response({'detail': error}, status=status.HTTP_400_BAD_REQUEST)
         
-        if cv_file.content_type not in allowed_types and file_ext not in allowed_extensions:
-            return Response({'detail': 'Invalid file type. Allowed: PDF, DOC, DOCX.'}, status=status.HTTP_400_BAD_REQUEST)
-        
-        # Validate file size (max 10MB)
-        if cv_file.size > 10 * 1024 * 1024:
-            return Response({'detail': 'File too large. Maximum size is 10MB.'}, status=status.HTTP_400_BAD_REQUEST)
-        
-        try:
-            # Get or create profile
-            profile, _ = Profile.objects.get_or_create(user=request.user)
-            
-            # Delete old CV from Cloudinary if exists
-            if profile.cv and 'cloudinary' in profile.cv:
-                parts = profile.cv.split('/')
-                if 'cvs' in parts:
-                    idx = parts.index('cvs')
-                    public_id = '/'.join(parts[idx:]).split('.')[0]
-                    public_id = f"jobfinder/{public_id}"
-                    cloudinary.uploader.destroy(public_id, resource_type='raw')
-            
-            # Upload to Cloudinary as raw file
-            result = cloudinary.uploader.upload(
-                cv_file,
-                folder='jobfinder/cvs',
-                public_id=f'user_{request.user.id}_cv',
-                overwrite=True,
-                resource_type='raw'  # Important for non-image files
-            )
-            
-            cv_url = result['secure_url']
-            
-            # Save URL and filename to profile
-            profile.cv = cv_url
-            profile.cv_filename = cv_file.name
-            profile.save(update_fields=['cv', 'cv_filename'])
-            
-            return Response({
-                'cv': cv_url,
-                'filename': cv_file.name
-            }, status=status.HTTP_200_OK)
-            
-        except Exception as e:
-            return Response({'detail': f'Upload failed: {str(e)}'}, status=status.HTTP_500_INTERNAL_SERVER_ERROR)
+        job = start_upload(request.user, 'cv', cv_file)
+        return upload_job_response(request, job)
 
     def delete(self, request):
-        """Delete CV from Cloudinary."""
+        """Delete CV; the stored file is removed in the background."""
         try:
             profile = request.user.profile
             if profile.cv:
-                # Delete from Cloudinary
-                public_id = f'jobfinder/cvs/user_{request.user.id}_cv'
-                cloudinary.uploader.destroy(public_id, resource_type='raw')
-                
+                # Applications sent with this CV keep pointing at the file
+                if not still_referenced('cv', profile.cv):
+                    schedule_delete('cv', profile.cv)
                 profile.cv = None
                 profile.cv_filename = None
-                profile.save(update_fields=['cv', 'cv_filename'])
+                profile.cv_text = None
+                profile.save(update_fields=['cv', 'cv_filename', 'cv_text'])
                 return Response({'detail': 'CV deleted.'}, status=status.HTTP_200_OK)
             return Response({'detail': 'No CV to delete.'}, status=status.HTTP_404_NOT_FOUND)
         except Profile.DoesNotExist:
             return Response({'detail': 'No CV to delete.'}, status=status.HTTP_404_NOT_FOUND)
 
 
+class DirectUploadSignView(APIView):
+    """Issue signed parameters for uploading an avatar/CV straight to storage.
+
+    Body: ``{"kind": "avatar" | "cv", "filename", "content_type", "size"}``.
+    Post the file to ``upload.url`` with ``upload.fields``, then call
+    ``complete_url``.
+    """
+    permission_classes = [permissions.IsAuthenticated]
+    authentication_classes = [StatelessJWTAuthentication]
+
+    def post(self, request):
+        kind = request.data.get('kind')
+        filename = request.data.get('filename')
+        content_type = request.data.get('content_type') or ''
+        size = request.data.get('size')
+        if kind not in UPLOAD_KINDS:
+            return Response({'detail': 'kind must be "avatar" or "cv".'}, status=status.HTTP_400_BAD_REQUEST)
+        if not isinstance(filename, str) or not filename or not isinstance(size, int) or size < 0:
+            return Response({'detail': 'filename and size are required.'}, status=status.HTTP_400_BAD_REQUEST)
+        error = validate_file_info(kind, filename, content_type, size)
+        if error:
+            return Response({'detail': error}, status=status.HTTP_400_BAD_REQUEST)
+
+        job, upload = start_direct_upload(request.user, kind, filename[:255], content_type[:100], size)
+        return Response({
+            'job': UploadJobSerializer(job).data,
+            'upload': upload,
+            'complete_url': request.build_absolute_uri(reverse('upload-job-complete', args=[job.pk])),
+        }, status=status.HTTP_201_CREATED)
+
+
+class DirectUploadCompleteView(APIView):
+    """Record a direct upload once storage confirms its size and format."""
+    permission_classes = [permissions.IsAuthenticated]
+    authentication_classes = [StatelessJWTAuthentication]
+
+    def post(self, request, job_id):
+        job = get_object_or_404(UploadJob, pk=job_id, user_id=request.user.pk)
+        error = complete_direct_upload(job)
+        if error:
+            job.refresh_from_db()
+            return Response({'detail': error, **UploadJobSerializer(job).data}, status=status.HTTP_400_BAD_REQUEST)
+        return Response(UploadJobSerializer(job).data)
+
+
+class LocalDirectUploadView(APIView):
+    """Receives direct uploads when UPLOAD_STORAGE is LocalFileStorage (development/tests).
+
+    Plays the storage service: the signed token authorizes the upload, not
+    the API credentials.
+    """
+    permission_classes = [permissions.AllowAny]
+    authentication_classes = []
+    parser_classes = [MultiPartParser, FormParser]
+
+    def post(self, request):
+        storage = get_storage()
+        if not isinstance(storage, LocalFileStorage):
+            return Response({'detail': 'Not found.'}, status=status.HTTP_404_NOT_FOUND)
+        if 'file' not in request.FILES:
+            return Response({'detail': 'No file provided.'}, status=status.HTTP_400_BAD_REQUEST)
+        try:
+            url = storage.receive(request.data.get('token', ''), request.FILES['file'])
+        except signing.BadSignature:
+            return Response({'detail': 'Invalid or expired upload token.'}, status=status.HTTP_403_FORBIDDEN)
+        return Response({'secure_url': url}, status=status.HTTP_201_CREATED)
+
+
+class UploadJobView(APIView):
+    """Status of one of the current user's uploads (poll until ``done`` or ``failed``)."""
+    permission_classes = [permissions.IsAuthenticated]
+    authentication_classes = [StatelessJWTAuthentication]
+
+    def get(self, request, job_id):
+        job = get_object_or_404(UploadJob, pk=job_id, user_id=request.user.pk)
+        return Response(UploadJobSerializer(job).data)
+
+
 # Profile ViewSet
 
 class ProfileViewSet(viewsets.ModelViewSet):
     queryset = Profile.objects.select_related('user', 'user__role', 'user__status', 'gender')
     serializer_class = ProfileSerializer
     permission_classes = [permissions.IsAuthenticated, IsOwnerOrAdmin]
-    authentication_classes = [JWTAuthentication]
+    authentication_classes = [StatelessJWTAuthentication]
     filter_backends = [DjangoFilterBackend, filters.SearchFilter, filters.OrderingFilter]
     filterset_fields = ['user__role__code', 'user__status__code', 'gender__code']
     search_fields = ['user__username', 'user__email', 'user__first_name', 'user__last_name']
@@ -418,26 +472,19 @@ class ProfileViewSet(viewsets.ModelViewSet):
         return Response(self.get_serializer(instance if 'instance' in locals() else profile).data, status=status.HTTP_201_CREATED if created else status.HTTP_200_OK)
 
 class CustomTokenObtainPairSerializer(TokenObtainPairSerializer):
+    @classmethod
+    def get_token(cls, user):
+        # role/status/staff claims let StatelessJWTAuthentication skip the user query
+        return set_user_claims(super().get_token(user), user)
+
     def validate(self, attrs):
         data = super().validate(attrs)
         
-        # Check user status and restrict login accordingly
-        user_status = getattr(self.user, 'status', None)
-        status_code = user_status.code.upper() if user_status else None
-        
-        # BANNED: admin-side, khoá vĩnh viễn - không thể đăng nhập
-        if status_code == 'BANNED':
-            from rest_framework import serializers
-            raise serializers.ValidationError({
-                'detail': 'Tài khoản của bạn đã bị khoá vĩnh viễn. Vui lòng liên hệ hỗ trợ.'
-            })
-        
-        # SUSPENDED: admin-side, tạm ngưng (nhập sai mật khẩu quá nhiều lần) - không thể đăng nhập
-        if status_code == 'SUSPENDED':
+        # Check user status and restrict login accordingly (BANNED, SUSPENDED)
+        message = blocked_status_message(self.user)
+        if message:
             from rest_framework import serializers
-            raise serializers.ValidationError({
-                'detail': 'Tài khoản của bạn đang bị tạm ngưng do nhập sai mật khẩu quá nhiều lần. Vui lòng liên hệ hỗ trợ.'
-            })
+            raise serializers.ValidationError({'detail': message})
         
         # INACTIVE: user-side, ngưng hoạt động - cho phép đăng nhập
         # LOCKED: user-side, khoá (ẩn khỏi nền tảng) - cho phép đăng nhập
@@ -449,4 +496,37 @@ class CustomTokenObtainPairSerializer(TokenObtainPairSerializer):
         return data
 
 class CustomTokenObtainPairView(TokenObtainPairView):
-    serializer_class = CustomTokenObtainPairSerializer
\ No newline at end of file
+    serializer_class = CustomTokenObtainPairSerializer
+
+
+class CustomTokenRefreshSerializer(TokenRefreshSerializer):
+    """Refresh that re-reads the user, so new access tokens carry current claims."""
+
+    def validate(self, attrs):
+        refresh = self.token_class(attrs['refresh'])
+        user = CustomUser.objects.filter(pk=refresh.payload.get(jwt_settings.USER_ID_CLAIM)).first()
+        if user is None or not jwt_settings.USER_AUTHENTICATION_RULE(user):
+            raise AuthenticationFailed(self.error_messages['no_active_account'], 'no_active_account')
+
+        message = blocked_status_message(user)
+        if message:
+            raise AuthenticationFailed(message, 'user_blocked')
+
+        if jwt_settings.CHECK_REVOKE_TOKEN:
+            if refresh.payload.get(jwt_settings.REVOKE_TOKEN_CLAIM) != get_md5_hash_password(user.password):
+                raise AuthenticationFailed("The user's password has been changed.", 'password_changed')
+
+        # Claims are copied from the refresh token into the new access token
+        set_user_claims(refresh, user)
+        data = {'access': str(refresh.access_token)}
+
+        if jwt_settings.ROTATE_REFRESH_TOKENS:
+            refresh.set_jti()
+            refresh.set_exp()
+            refresh.set_iat()
+            data['refresh'] = str(refresh)
+        return data
+
+
+class CustomTokenRefreshView(TokenRefreshView):
+    serializer_class = CustomTokenRefreshSerializer
\ No newline at end of file
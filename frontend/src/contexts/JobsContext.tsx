@@ -13,9 +13,10 @@ export interface Job {
   salary: string;
   type: JobType;
   category: string;
-  description: string;
-  requirements: string[];
-  benefits: string[];
+  // Only on jobs loaded from the detail endpoint; list rows use the compact schema
+  description?: string;
+  requirements?: string[];
+  benefits?: string[];
   postedDate: string;
   employerId: string;
   status: JobStatus;
@@ -15,6 +15,11 @@ function handleLogout() {
   }
 }
 
+// List endpoints may be paginated ({ next, previous, results }) or plain arrays
+function unwrapList(data: any): any[] {
+  return Array.isArray(data) ? data : (data?.results || []);
+}
+
 // Public fetch (no auth needed)
 async function fetchJSON(url: string) {
   const res = await fetch(url);
@@ -56,9 +61,9 @@ async function authDeleteJSON(url: string) {
 
 // Public endpoints (no auth required)
 export async function listForms(): Promise<Job[]> {
-  const data = await fetchJSON(`${API_BASE}/api/jobfinder/forms/`);
+  const data = await fetchJSON(`${API_BASE}/api/jobfinder/forms/?page_size=all`);
   // map backend shape to frontend Job where necessary — keep minimal mapping
-  return (data || []).map((f: any) => ({
+  return unwrapList(data).map((f: any) => ({
     id: String(f.id),
     title: f.title,
     company: f.display_verified_company || f.verified_company || '',
@@ -67,9 +72,7 @@ export async function listForms(): Promise<Job[]> {
     salary: f.salary_from && f.salary_to ? `${f.salary_from} - ${f.salary_to} ${f.display_salary_currency || ''}` : (f.display_salary_currency || ''),
     type: (f.work_format && f.work_format.code) || 'full-time',
     category: f.job_type && f.job_type.name ? f.job_type.name : '',
-    description: f.description || '',
-    requirements: (f.requirements || '').split('\n').filter(Boolean),
-    benefits: (f.benefits || '').split('\n').filter(Boolean),
+    // description/requirements/benefits are only returned by getForm (detail endpoint)
     postedDate: f.created_at,
     employerId: f.created_by ? String(f.created_by) : '',
     status: f.status || 'pending',
@@ -156,11 +159,11 @@ export interface ApplicationResponse {
 }
 
 export async function listMyApplications(): Promise<ApplicationResponse[]> {
-  return authGetJSON(`${API_BASE}/api/jobfinder/applications/`);
+  return unwrapList(await authGetJSON(`${API_BASE}/api/jobfinder/applications/?page_size=all`));
 }
 
 export async function listApplicationsForJob(jobId: string): Promise<ApplicationResponse[]> {
-  return authGetJSON(`${API_BASE}/api/jobfinder/applications/for-job/${jobId}/`);
+  return unwrapList(await authGetJSON(`${API_BASE}/api/jobfinder/applications/for-job/${jobId}/?page_size=all`));
 }
 
 export async function approveApplication(appId: string): Promise<ApplicationResponse> {
@@ -0,0 +1,87 @@
+import { API_BASE, getAccessToken } from '../contexts/AuthContext';
+
+export type UploadKind = 'avatar' | 'cv';
+
+export interface UploadJob {
+  id: string;
+  kind: UploadKind;
+  status: 'awaiting' | 'pending' | 'running' | 'done' | 'superseded' | 'failed';
+  filename: string;
+  size: number;
+  url: string;
+  error: string;
+  status_url?: string;
+}
+
+const POLL_INTERVAL_MS = 500;
+const POLL_TIMEOUT_MS = 2 * 60 * 1000;
+
+const sleep = (ms: number) => new Promise(resolve => setTimeout(resolve, ms));
+
+interface DirectUpload {
+  job: UploadJob;
+  upload: { url: string; fields: Record<string, string>; file_field: string };
+  complete_url: string;
+}
+
+// Upload an avatar/CV. The file goes straight to storage with signed
+// parameters; if storage cannot be reached it is sent through the API instead.
+// Resolves with the finished job (job.url is the stored file); rejects with { detail }.
+export async function uploadUserFile(kind: UploadKind, file: File): Promise<UploadJob> {
+  const headers = { 'Authorization': `Bearer ${await getAccessToken()}`, 'Content-Type': 'application/json' };
+  const signRes = await fetch(`${API_BASE}/api/users/uploads/sign/`, {
+    method: 'POST',
+    headers,
+    body: JSON.stringify({ kind, filename: file.name, content_type: file.type, size: file.size }),
+  });
+  if (!signRes.ok) throw await signRes.json().catch(() => ({}));
+  const { upload, complete_url }: DirectUpload = await signRes.json();
+
+  const formData = new FormData();
+  Object.entries(upload.fields).forEach(([key, value]) => formData.append(key, value));
+  formData.append(upload.file_field, file);
+  let stored = false;
+  try {
+    stored = (await fetch(upload.url, { method: 'POST', body: formData })).ok;
+  } catch (e) {
+    stored = false;
+  }
+  if (!stored) return uploadViaApi(kind, file);
+
+  const completeRes = await fetch(complete_url, {
+    method: 'POST',
+    headers: { 'Authorization': `Bearer ${await getAccessToken()}` },
+  });
+  const job = await completeRes.json().catch(() => ({}));
+  if (!completeRes.ok) throw job;
+  return job;
+}
+
+// Upload through the API, then wait for the background job to finish.
+async function uploadViaApi(kind: UploadKind, file: File): Promise<UploadJob> {
+  const token = await getAccessToken();
+  const formData = new FormData();
+  formData.append(kind, file);
+
+  const res = await fetch(`${API_BASE}/api/users/${kind}/`, {
+    method: 'POST',
+    headers: { 'Authorization': `Bearer ${token}` },
+    body: formData,
+  });
+  if (!res.ok) throw await res.json().catch(() => ({}));
+
+  let job: UploadJob = await res.json();
+  const statusUrl = job.status_url || `${API_BASE}/api/users/uploads/${job.id}/`;
+  const deadline = Date.now() + POLL_TIMEOUT_MS;
+  while (job.status === 'pending' || job.status === 'running') {
+    if (Date.now() > deadline) throw { detail: 'Tải lên quá lâu, vui lòng thử lại' };
+    await sleep(POLL_INTERVAL_MS);
+    const pollRes = await fetch(statusUrl, {
+      headers: { 'Authorization': `Bearer ${await getAccessToken()}` },
+    });
+    if (!pollRes.ok) throw await pollRes.json().catch(() => ({}));
+    job = await pollRes.json();
+  }
+  if (job.status === 'failed') throw { detail: job.error || undefined };
+  return job;
+}
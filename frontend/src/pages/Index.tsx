@@ -48,11 +48,11 @@ const Index = () => {
   useEffect(() => {
     const fetchJobs = async () => {
       try {
-        const res = await fetch(`${API_BASE}/api/jobfinder/forms/`);
+        const res = await fetch(`${API_BASE}/api/jobfinder/forms/?page_size=6`);
         if (res.ok) {
           const data = await res.json();
           // Only show approved jobs, limit to 6
-          const approvedJobs = data
+          const approvedJobs = (Array.isArray(data) ? data : (data.results || []))
             .filter((j: JobForm) => j.status === 'approved')
             .slice(0, 6);
           setJobs(approvedJobs);
@@ -8,6 +8,7 @@ import { Card, CardContent } from '@/components/ui/card';
 import { Badge } from '@/components/ui/badge';
 import { Avatar, AvatarFallback, AvatarImage } from '@/components/ui/avatar';
 import { resolveWorkFormatLabel, resolveJobTypeLabel, badgeColorForKey } from '@/lib/badge';
+import { uploadUserFile } from '@/lib/uploads';
 import { Separator } from '@/components/ui/separator';
 import {
   MapPin, DollarSign, Briefcase, Clock, Building2,
@@ -210,26 +211,13 @@ const JobDetail = () => {
       
       // If user selected custom CV, upload it first (regardless of useDefaultCV)
       if (customCV) {
-        const token = await getAccessToken();
-        const formData = new FormData();
-        formData.append('cv', customCV);
-
-        const uploadRes = await fetch(`${API_BASE}/api/users/cv/`, {
-          method: 'POST',
-          headers: {
-            'Authorization': `Bearer ${token}`,
-          },
-          body: formData,
-        });
-
-        if (uploadRes.ok) {
-          const data = await uploadRes.json();
-          cvUrl = data.cv;
-        } else {
-          const errData = await uploadRes.json().catch(() => ({}));
+        try {
+          const upload = await uploadUserFile('cv', customCV);
+          cvUrl = upload.url;
+        } catch (errData: any) {
           toast({
             title: 'Lỗi',
-            description: errData.detail || 'Không thể tải lên CV',
+            description: errData?.detail || 'Không thể tải lên CV',
             variant: 'destructive',
           });
           setUploadingCV(false);
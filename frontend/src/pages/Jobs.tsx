@@ -77,6 +77,8 @@ const Jobs = () => {
   const navigate = useNavigate();
   const [jobs, setJobs] = useState<JobForm[]>([]);
   const [loading, setLoading] = useState(false);
+  const [nextPage, setNextPage] = useState<string | null>(null);
+  const [loadingMore, setLoadingMore] = useState(false);
   const [showAdvanced, setShowAdvanced] = useState(false);
 
   // Filter options from API
@@ -150,8 +152,6 @@ const Jobs = () => {
         searchParams.has('min_positions')) {
       setShowAdvanced(true);
     }
-    // Fetch jobs on mount
-    fetchJobs();
   }, []);
 
   // Auto-search when any filter changes (with debounce for text inputs)
@@ -171,6 +171,8 @@ const Jobs = () => {
       if (currency !== 'all') params.set('currency', currency);
       if (minPositions) params.set('min_positions', minPositions);
       setSearchParams(params, { replace: true });
+      // Filtering happens on the server; the same params are forwarded as-is
+      fetchJobs(params);
     }, 300); // 300ms debounce
     
     return () => clearTimeout(timer);
@@ -224,15 +226,18 @@ const Jobs = () => {
     fetchWards();
   }, [district]);
 
-  const fetchJobs = async () => {
+  const fetchJobs = async (params?: URLSearchParams) => {
     setLoading(true);
     try {
-      const res = await fetch(`${API_BASE}/api/jobfinder/forms/`);
+      const query = params && params.toString() ? `?${params.toString()}` : '';
+      const res = await fetch(`${API_BASE}/api/jobfinder/forms/${query}`);
       if (res.ok) {
         const data = await res.json();
+        const results: JobForm[] = Array.isArray(data) ? data : (data.results || []);
         // Only show approved jobs
-        const approvedJobs = data.filter((j: JobForm) => j.status === 'approved');
+        const approvedJobs = results.filter((j: JobForm) => j.status === 'approved');
         setJobs(approvedJobs);
+        setNextPage(Array.isArray(data) ? null : data.next);
       }
     } catch (e) {
       console.error('Failed to fetch jobs', e);
@@ -241,6 +246,25 @@ const Jobs = () => {
     }
   };
 
+  // Append the next cursor page to the current results
+  const loadMoreJobs = async () => {
+    if (!nextPage) return;
+    setLoadingMore(true);
+    try {
+      const res = await fetch(nextPage);
+      if (res.ok) {
+        const data = await res.json();
+        const approvedJobs = (data.results || []).filter((j: JobForm) => j.status === 'approved');
+        setJobs(prev => [...prev, ...approvedJobs]);
+        setNextPage(data.next);
+      }
+    } catch (e) {
+      console.error('Failed to fetch more jobs', e);
+    } finally {
+      setLoadingMore(false);
+    }
+  };
+
   // Helper functions
   const getCompanyName = (job: JobForm) => {
     if (job.display_verified_company) return job.display_verified_company;
@@ -635,6 +659,13 @@ const Jobs = () => {
                       </CardFooter>
                     </Card>
                   ))}
+                  {nextPage && (
+                    <div className="col-span-full flex justify-center">
+                      <Button variant="outline" onClick={loadMoreJobs} disabled={loadingMore}>
+                        {loadingMore ? 'Đang tải...' : 'Xem thêm'}
+                      </Button>
+                    </div>
+                  )}
                 </div>
               ) : (
                 <div className="text-center py-16">
@@ -25,6 +25,7 @@ import { Tooltip, TooltipContent, TooltipProvider, TooltipTrigger } from '@/comp
 import { format, parse } from 'date-fns';
 import { vi } from 'date-fns/locale';
 import { cn } from '@/lib/utils';
+import { uploadUserFile } from '@/lib/uploads';
 
 interface Gender {
   code: string;
@@ -263,37 +264,17 @@ const Profile = () => {
 
     setUploadingAvatar(true);
     try {
-      const token = await getAccessToken();
-      const formData = new FormData();
-      formData.append('avatar', file);
-
-      const res = await fetch(`${API_BASE}/api/users/avatar/`, {
-        method: 'POST',
-        headers: {
-          'Authorization': `Bearer ${token}`,
-        },
-        body: formData,
+      await uploadUserFile('avatar', file);
+      toast({
+        title: 'Thành công',
+        description: 'Đã cập nhật ảnh đại diện',
       });
-
-      if (res.ok) {
-        toast({
-          title: 'Thành công',
-          description: 'Đã cập nhật ảnh đại diện',
-        });
-        // Refresh user data
-        await refreshUser();
-      } else {
-        const data = await res.json();
-        toast({
-          title: 'Lỗi',
-          description: data.detail || 'Không thể tải ảnh lên',
-          variant: 'destructive',
-        });
-      }
-    } catch (err) {
+      // Refresh user data
+      await refreshUser();
+    } catch (err: any) {
       toast({
         title: 'Lỗi',
-        description: 'Không thể tải ảnh lên',
+        description: err?.detail || 'Không thể tải ảnh lên',
         variant: 'destructive',
       });
     } finally {
@@ -344,36 +325,16 @@ const Profile = () => {
 
     setUploadingCV(true);
     try {
-      const token = await getAccessToken();
-      const formData = new FormData();
-      formData.append('cv', file);
-
-      const res = await fetch(`${API_BASE}/api/users/cv/`, {
-        method: 'POST',
-        headers: {
-          'Authorization': `Bearer ${token}`,
-        },
-        body: formData,
+      await uploadUserFile('cv', file);
+      toast({
+        title: 'Thành công',
+        description: 'Đã tải lên CV',
       });
-
-      if (res.ok) {
-        toast({
-          title: 'Thành công',
-          description: 'Đã tải lên CV',
-        });
-        await refreshUser();
-      } else {
-        const data = await res.json();
-        toast({
-          title: 'Lỗi',
-          description: data.detail || 'Không thể tải CV lên',
-          variant: 'destructive',
-        });
-      }
-    } catch (err) {
+      await refreshUser();
+    } catch (err: any) {
       toast({
         title: 'Lỗi',
-        description: 'Không thể tải CV lên',
+        description: err?.detail || 'Không thể tải CV lên',
         variant: 'destructive',
       });
     } finally {
@@ -28,6 +28,17 @@ interface Stats {
   activeUsers: number;
 }
 
+interface TimelinePoint {
+  start: string;
+  count: number;
+}
+
+interface ActivityPoint {
+  start: string;
+  jobs: number;
+  applications: number;
+}
+
 const AdminDashboard = () => {
   const { user } = useAuth();
   const navigate = useNavigate();
@@ -41,6 +52,7 @@ const AdminDashboard = () => {
     pendingVerification: 0,
     activeUsers: 0,
   });
+  const [timeline, setTimeline] = useState<ActivityPoint[]>([]);
   const [loading, setLoading] = useState(true);
 
   useEffect(() => {
@@ -49,40 +61,28 @@ const AdminDashboard = () => {
         const token = await getAccessToken();
         const headers = token ? { 'Authorization': `Bearer ${token}` } : {};
 
-        // Fetch jobs
-        const [jobsRes, hiddenRes, usersRes] = await Promise.all([
-          fetch(`${API_BASE}/api/jobfinder/forms/`, { headers }),
-          fetch(`${API_BASE}/api/jobfinder/forms/hidden/`, { headers }),
-          fetch(`${API_BASE}/api/users/users/`, { headers }),
-        ]);
-
-        let jobs: any[] = [];
-        let hiddenJobs: any[] = [];
-        let users: any[] = [];
-
-        if (jobsRes.ok) {
-          const data = await jobsRes.json();
-          jobs = Array.isArray(data) ? data : (data.results || []);
-        }
-        if (hiddenRes.ok) {
-          const data = await hiddenRes.json();
-          hiddenJobs = Array.isArray(data) ? data : (data.results || []);
-        }
-        if (usersRes.ok) {
-          const data = await usersRes.json();
-          users = Array.isArray(data) ? data : (data.results || []);
-        }
+        // Counts are aggregated server-side (GET /api/jobfinder/stats/)
+        const res = await fetch(`${API_BASE}/api/jobfinder/stats/`, { headers });
+        if (!res.ok) return;
+        const data = await res.json();
 
         setStats({
-          totalJobs: jobs.length + hiddenJobs.length,
-          pendingJobs: jobs.filter(j => j.status === 'pending').length,
-          approvedJobs: jobs.filter(j => j.status === 'approved').length,
-          rejectedJobs: jobs.filter(j => j.status === 'rejected').length,
-          hiddenJobs: hiddenJobs.length,
-          totalUsers: users.length,
-          pendingVerification: users.filter(u => u.status?.toUpperCase() === 'PENDING_VERIFICATION').length,
-          activeUsers: users.filter(u => u.status?.toUpperCase() === 'ACTIVE').length,
+          totalJobs: data.jobs.total,
+          pendingJobs: data.jobs.by_status.pending || 0,
+          approvedJobs: data.jobs.by_status.approved || 0,
+          rejectedJobs: data.jobs.by_status.rejected || 0,
+          hiddenJobs: data.jobs.hidden,
+          totalUsers: data.users.total,
+          pendingVerification: data.users.by_status.PENDING_VERIFICATION || 0,
+          activeUsers: data.users.by_status.ACTIVE || 0,
         });
+        setTimeline(
+          data.timeline.jobs.map((point: TimelinePoint, i: number) => ({
+            start: point.start,
+            jobs: point.count,
+            applications: data.timeline.applications[i]?.count || 0,
+          }))
+        );
       } catch (e) {
         console.error('Failed to fetch stats', e);
       } finally {
@@ -94,6 +94,7 @@ const AdminDashboard = () => {
   }, []);
 
   const isAdmin = user && user.role?.toUpperCase() === 'ADMIN';
+  const timelineMax = Math.max(1, ...timeline.map(p => Math.max(p.jobs, p.applications)));
 
   if (!user || !isAdmin) {
     navigate('/');
@@ -301,6 +302,29 @@ const AdminDashboard = () => {
             </Card>
           </div>
 
+          {/* Activity (last 30 days) */}
+          <h2 className="text-xl font-semibold mb-4">Hoạt động 30 ngày qua</h2>
+          <Card className="mb-8">
+            <CardContent className="p-4">
+              <div className="flex items-end gap-1 h-32">
+                {timeline.map((point) => (
+                  <div
+                    key={point.start}
+                    className="flex-1 flex items-end gap-px h-full"
+                    title={`${point.start}: ${point.jobs} tin đăng, ${point.applications} đơn ứng tuyển`}
+                  >
+                    <div className="flex-1 bg-blue-500 rounded-t" style={{ height: `${(point.jobs / timelineMax) * 100}%` }} />
+                    <div className="flex-1 bg-green-500 rounded-t" style={{ height: `${(point.applications / timelineMax) * 100}%` }} />
+                  </div>
+                ))}
+              </div>
+              <div className="mt-3 flex gap-4 text-xs text-muted-foreground">
+                <span className="flex items-center gap-1"><span className="h-2 w-2 rounded bg-blue-500" /> Tin đăng mới</span>
+                <span className="flex items-center gap-1"><span className="h-2 w-2 rounded bg-green-500" /> Đơn ứng tuyển</span>
+              </div>
+            </CardContent>
+          </Card>
+
         </div>
       </main>
       <Footer />
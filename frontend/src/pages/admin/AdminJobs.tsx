@@ -40,6 +40,7 @@ interface JobForm {
   is_active: boolean;
   created_at: string;
   created_by?: string;
+  claimed_by?: string | null;
 }
 
 const AdminJobs = () => {
@@ -56,6 +57,7 @@ const AdminJobs = () => {
   };
 
   const [jobs, setJobs] = useState<JobForm[]>([]);
+  const [pendingJobs, setPendingJobs] = useState<JobForm[]>([]);
   const [hiddenJobs, setHiddenJobs] = useState<JobForm[]>([]);
   const [loading, setLoading] = useState(true);
 
@@ -67,13 +69,20 @@ const AdminJobs = () => {
   const fetchJobs = async () => {
     try {
       const token = await getAccessToken();
-      const res = await fetch(`${API_BASE}/api/jobfinder/forms/`, {
-        headers: token ? { 'Authorization': `Bearer ${token}` } : {},
-      });
+      const headers = token ? { 'Authorization': `Bearer ${token}` } : {};
+      // Tin chờ duyệt lấy từ hàng đợi kiểm duyệt (cũ nhất trước)
+      const [res, queueRes] = await Promise.all([
+        fetch(`${API_BASE}/api/jobfinder/forms/?page_size=all`, { headers }),
+        fetch(`${API_BASE}/api/jobfinder/forms/moderation-queue/?include_claimed=true&page_size=all`, { headers }),
+      ]);
       if (res.ok) {
         const data = await res.json();
         setJobs(Array.isArray(data) ? data : (data.results || []));
       }
+      if (queueRes.ok) {
+        const data = await queueRes.json();
+        setPendingJobs(Array.isArray(data) ? data : (data.results || []));
+      }
     } catch (e) {
       console.error('Failed to fetch jobs', e);
     }
@@ -83,7 +92,7 @@ const AdminJobs = () => {
   const fetchHiddenJobs = async () => {
     try {
       const token = await getAccessToken();
-      const res = await fetch(`${API_BASE}/api/jobfinder/forms/hidden/`, {
+      const res = await fetch(`${API_BASE}/api/jobfinder/forms/hidden/?page_size=all`, {
         headers: token ? { 'Authorization': `Bearer ${token}` } : {},
       });
       if (res.ok) {
@@ -104,7 +113,6 @@ const AdminJobs = () => {
     loadData();
   }, []);
 
-  const pendingJobs = jobs.filter(j => j.status === 'pending');
   const approvedJobs = jobs.filter(j => j.status === 'approved');
   const rejectedJobs = jobs.filter(j => j.status === 'rejected');
 
@@ -134,15 +142,19 @@ const AdminJobs = () => {
     try {
       const token = await getAccessToken();
       let successCount = 0;
-      for (const job of pendingJobs) {
-        const res = await fetch(`${API_BASE}/api/jobfinder/forms/${job.id}/approve/`, {
+      // The bulk endpoint accepts up to 500 ids per request
+      for (let i = 0; i < pendingJobs.length; i += 500) {
+        const res = await fetch(`${API_BASE}/api/jobfinder/forms/bulk-moderate/`, {
           method: 'POST',
           headers: {
             'Content-Type': 'application/json',
             ...(token ? { 'Authorization': `Bearer ${token}` } : {}),
           },
+          body: JSON.stringify({ ids: pendingJobs.slice(i, i + 500).map(job => job.id), action: 'approved' }),
         });
-        if (res.ok) successCount++;
+        if (!res.ok) throw new Error('bulk-moderate failed');
+        const data = await res.json();
+        successCount += data.updated;
       }
       toast({ title: "Đã duyệt toàn bộ", description: `Đã duyệt ${successCount}/${pendingJobs.length} tin tuyển dụng` });
       fetchJobs();
@@ -358,6 +370,9 @@ const AdminJobs = () => {
                             <div className="flex items-center gap-2">
                               <h3 className="font-semibold text-lg">{job.title}</h3>
                             <Badge className="bg-warning/10 text-warning">Chờ duyệt</Badge>
+                            {job.claimed_by && (
+                              <Badge variant="outline">Đang xử lý: {job.claimed_by}</Badge>
+                            )}
                           </div>
                           <p className="text-sm text-muted-foreground">{getCompanyName(job)}</p>
                           <div className="flex flex-wrap gap-4 text-sm text-muted-foreground">
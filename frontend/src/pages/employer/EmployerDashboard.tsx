@@ -7,8 +7,9 @@ import Footer from '@/components/layout/Footer';
 import { Button } from '@/components/ui/button';
 import { Card, CardContent, CardHeader, CardTitle } from '@/components/ui/card';
 import { Badge } from '@/components/ui/badge';
+import { Input } from '@/components/ui/input';
 import { Tabs, TabsContent, TabsList, TabsTrigger } from '@/components/ui/tabs';
-import { CheckCircle2, XCircle, Check, X, User as UserIcon, Plus, Briefcase, Users, Eye, Trash2, Clock, FileText } from 'lucide-react';
+import { CheckCircle2, XCircle, Check, X, User as UserIcon, Plus, Briefcase, Users, Eye, Trash2, Clock, FileText, Search } from 'lucide-react';
 import { useToast } from '@/hooks/use-toast';
 
 interface JobForm {
@@ -31,12 +32,13 @@ interface JobForm {
   is_active: boolean;
   created_at: string;
   created_by?: string;
+  application_count?: number;
+  pending_application_count?: number;
 }
 
 const EmployerDashboard = () => {
   const { user, logout } = useAuth();
   const {
-    getApplicationsForJob,
     approveApplication,
     rejectApplication,
   } = useJobs();
@@ -53,8 +55,10 @@ const EmployerDashboard = () => {
 
   const [jobs, setJobs] = useState<JobForm[]>([]);
   const [loading, setLoading] = useState(true);
-  const [userStatuses, setUserStatuses] = useState<Record<string, string>>({});
   const [jobApplications, setJobApplications] = useState<Application[]>([]);
+  // Kỹ năng tìm trong CV; null = không lọc
+  const [skillQuery, setSkillQuery] = useState('');
+  const [skillMatches, setSkillMatches] = useState<Set<string> | null>(null);
 
   // Fetch jobs from API
   useEffect(() => {
@@ -62,7 +66,7 @@ const EmployerDashboard = () => {
     
     const fetchJobs = async () => {
       try {
-        const res = await authFetch(`${API_BASE}/api/jobfinder/forms/`, {}, () => {
+        const res = await authFetch(`${API_BASE}/api/jobfinder/forms/?page_size=all`, {}, () => {
           logout();
           navigate('/auth/login');
         });
@@ -70,18 +74,31 @@ const EmployerDashboard = () => {
           const data = await res.json();
           // Backend already filters by current user, so we get only our jobs
           // Plus any public jobs - filter to only show our own
-          const myJobs = data.filter((j: JobForm) => 
+          const allJobs: JobForm[] = Array.isArray(data) ? data : (data.results || []);
+          const myJobs = allJobs.filter((j: JobForm) => 
             j.created_by === user.username || j.created_by === user.email
           );
           setJobs(myJobs);
-          
-          // Fetch applications for all jobs
-          const allApps: Application[] = [];
-          for (const job of myJobs) {
-            const apps = await getApplicationsForJob(String(job.id));
-            allApps.push(...apps);
-          }
-          setJobApplications(allApps);
+        }
+
+        // Applications across all of our jobs in one request; only ACTIVE applicants are shown
+        const inboxRes = await authFetch(`${API_BASE}/api/jobfinder/applications/inbox/?applicant_status=ACTIVE&page_size=all`, {}, () => {
+          logout();
+          navigate('/auth/login');
+        });
+        if (inboxRes.ok) {
+          const inbox = await inboxRes.json();
+          setJobApplications(inbox.results.map((r: any): Application => ({
+            id: String(r.id),
+            jobId: String(r.job_id),
+            userId: String(r.applicant_id),
+            userName: r.applicant_name,
+            userEmail: r.applicant_email,
+            cvUrl: r.cv_url,
+            coverLetter: r.cover_letter,
+            appliedDate: r.applied_at,
+            status: r.status,
+          })));
         }
       } catch (e) {
         console.error('Failed to fetch jobs', e);
@@ -91,38 +108,7 @@ const EmployerDashboard = () => {
     };
 
     fetchJobs();
-  }, [user, logout, navigate, getApplicationsForJob]);
-
-  // Fetch user statuses for all applicants
-  useEffect(() => {
-    const fetchUserStatuses = async () => {
-      const userIds = [...new Set(jobApplications.map(app => app.userId))];
-      const statuses: Record<string, string> = {};
-      
-      for (const userId of userIds) {
-        try {
-          const res = await authFetch(`${API_BASE}/api/users/users/${userId}/`, {}, () => {});
-          if (res.ok) {
-            const userData = await res.json();
-            // Lấy status từ response, nếu không có thì đánh dấu là UNKNOWN để ẩn
-            statuses[userId] = userData.status || 'UNKNOWN';
-          } else {
-            // Nếu fetch thất bại, đánh dấu là UNKNOWN để ẩn user này
-            statuses[userId] = 'UNKNOWN';
-          }
-        } catch (e) {
-          // Nếu có lỗi, đánh dấu là UNKNOWN để ẩn user này
-          statuses[userId] = 'UNKNOWN';
-        }
-      }
-      
-      setUserStatuses(statuses);
-    };
-
-    if (jobApplications.length > 0) {
-      fetchUserStatuses();
-    }
-  }, [jobApplications]);
+  }, [user, logout, navigate]);
 
   if (!user || !['user', 'admin'].includes(user.role ?? '')) {
     navigate('/');
@@ -155,12 +141,33 @@ const EmployerDashboard = () => {
     return `Từ ${job.salary_from.toLocaleString()} ${symbol}`;
   };
 
-  // Lọc ứng viên chỉ hiển thị user có trạng thái ACTIVE
-  const filteredApplications = jobApplications.filter(app => {
-    const userStatus = userStatuses[app.userId];
-    // Chỉ hiển thị nếu đã fetch được status và status là ACTIVE
-    return userStatus === 'ACTIVE';
-  });
+  // Inbox đã lọc sẵn ứng viên có trạng thái ACTIVE ở backend
+  const filteredApplications = skillMatches
+    ? jobApplications.filter(a => skillMatches.has(a.id))
+    : jobApplications;
+
+  // Tìm ứng viên theo kỹ năng trong nội dung CV (backend đã trích xuất và đánh chỉ mục)
+  const handleSkillSearch = async (e: React.FormEvent) => {
+    e.preventDefault();
+    const query = skillQuery.trim();
+    if (!query) {
+      setSkillMatches(null);
+      return;
+    }
+    try {
+      const params = new URLSearchParams({ applicant_status: 'ACTIVE', page_size: 'all', skills: query });
+      const res = await authFetch(`${API_BASE}/api/jobfinder/applications/inbox/?${params}`, {}, () => {
+        logout();
+        navigate('/auth/login');
+      });
+      if (!res.ok) throw new Error('skills search failed');
+      const data = await res.json();
+      const rows = Array.isArray(data) ? data : (data.results || []);
+      setSkillMatches(new Set(rows.map((r: any) => String(r.id))));
+    } catch (err) {
+      toast({ title: 'Lỗi', description: 'Không thể tìm theo kỹ năng', variant: 'destructive' });
+    }
+  };
 
   // Badge trạng thái job
   const jobStatusBadge = (status: string) => {
@@ -254,6 +261,33 @@ const EmployerDashboard = () => {
     }
   };
 
+  // Duyệt/từ chối tất cả ứng viên đang chờ trong một request
+  const handleBulkStatus = async (targetStatus: 'approved' | 'rejected') => {
+    const ids = filteredApplications.filter(a => a.status === 'pending').map(a => Number(a.id));
+    if (ids.length === 0) return;
+    try {
+      const res = await authFetch(`${API_BASE}/api/jobfinder/applications/bulk-status/`, {
+        method: 'POST',
+        headers: { 'Content-Type': 'application/json' },
+        body: JSON.stringify({ ids, status: targetStatus }),
+      }, () => {
+        logout();
+        navigate('/auth/login');
+      });
+      if (!res.ok) throw new Error('bulk-status failed');
+      const data = await res.json();
+      setJobApplications(prev =>
+        prev.map(a => data.results[a.id] === 'updated' ? { ...a, status: targetStatus } : a)
+      );
+      toast({
+        title: 'Thành công',
+        description: `Đã ${targetStatus === 'approved' ? 'duyệt' : 'từ chối'} ${data.updated} ứng viên`,
+      });
+    } catch (e) {
+      toast({ title: 'Lỗi', description: 'Không thể cập nhật ứng viên', variant: 'destructive' });
+    }
+  };
+
   if (loading) {
     return (
       <div className="flex min-h-screen flex-col">
@@ -377,6 +411,8 @@ const EmployerDashboard = () => {
                           </p>
                           <p className="text-xs text-muted-foreground">
                             Đăng ngày {new Date(job.created_at).toLocaleDateString('vi-VN')}
+                            {' • '}{job.application_count ?? 0} ứng viên
+                            {(job.pending_application_count ?? 0) > 0 && ` (${job.pending_application_count} đang chờ)`}
                           </p>
                         </div>
 
@@ -575,14 +611,39 @@ const EmployerDashboard = () => {
 
             {/* Ứng viên */}
             <TabsContent value="applications" className="space-y-4">
+              {jobApplications.length > 0 && (
+                <form onSubmit={handleSkillSearch} className="flex gap-2">
+                  <Input
+                    value={skillQuery}
+                    onChange={e => setSkillQuery(e.target.value)}
+                    placeholder="Tìm theo kỹ năng trong CV, ví dụ: python django"
+                  />
+                  <Button type="submit" variant="outline">
+                    <Search className="h-4 w-4 mr-1" /> Tìm
+                  </Button>
+                </form>
+              )}
               {filteredApplications.length === 0 ? (
                 <Card>
                   <CardContent className="py-12 text-center">
                     <Users className="h-12 w-12 mx-auto text-muted-foreground mb-4" />
-                    <p className="text-muted-foreground">Chưa có ứng viên nào</p>
+                    <p className="text-muted-foreground">
+                      {skillMatches ? 'Không có ứng viên nào có CV phù hợp' : 'Chưa có ứng viên nào'}
+                    </p>
                   </CardContent>
                 </Card>
               ) : (
+                <>
+                {filteredApplications.some(a => a.status === 'pending') && (
+                  <div className="flex justify-end gap-2">
+                    <Button size="sm" variant="outline" onClick={() => handleBulkStatus('approved')}>
+                      <Check className="h-4 w-4 mr-1" /> Duyệt tất cả đang chờ
+                    </Button>
+                    <Button size="sm" variant="outline" onClick={() => handleBulkStatus('rejected')}>
+                      <X className="h-4 w-4 mr-1" /> Từ chối tất cả đang chờ
+                    </Button>
+                  </div>
+                )}
                 <div className="grid md:grid-cols-2 gap-4">
                   {filteredApplications.map(app => (
                     <Card key={app.id}>
@@ -659,6 +720,7 @@ const EmployerDashboard = () => {
                     </Card>
                   ))}
                 </div>
+                </>
               )}
             </TabsContent>
           </Tabs>